@@ -1,4 +1,13 @@
-﻿import re
+﻿import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
 
 
 def _normalize_for_match(value):
@@ -9,14 +18,52 @@ def _normalize_for_match(value):
 
 
 def _prepare_text(value):
+    if isinstance(value, PreparedText):
+        return value.padded
     normalized = _normalize_for_match(value)
     return f" {normalized} " if normalized else " "
 
 
+# One job text prepared once and shared by every detector: the lowercased raw
+# form (for clause splitting), the normalized and space-padded forms, the
+# normalized tokens with their character offsets in the normalized form, and a
+# positional index mapping each token to its sorted token positions.
+PreparedText = namedtuple(
+    "PreparedText",
+    ["lowered", "normalized", "padded", "tokens", "offsets", "positions"],
+)
+
+
+def _build_prepared_text(value):
+    if isinstance(value, PreparedText):
+        return value
+    lowered = str(value or "").lower()
+    normalized = re.sub(r"[^\w\s]+", " ", lowered)
+    normalized = re.sub(r"\s+", " ", normalized).strip()
+    tokens = tuple(normalized.split(" ")) if normalized else ()
+    offsets = []
+    positions = {}
+    position = 0
+    for idx, token in enumerate(tokens):
+        offsets.append(position)
+        positions.setdefault(token, []).append(idx)
+        position += len(token) + 1
+    return PreparedText(
+        lowered=lowered,
+        normalized=normalized,
+        padded=f" {normalized} " if normalized else " ",
+        tokens=tokens,
+        offsets=tuple(offsets),
+        positions=positions,
+    )
+
+
 def _phrase_in_text(prepared_text, phrase):
     normalized_phrase = _normalize_for_match(phrase)
     if not normalized_phrase:
         return False
+    if isinstance(prepared_text, PreparedText):
+        prepared_text = prepared_text.padded
     if " " in normalized_phrase:
         return f" {normalized_phrase} " in prepared_text
 
@@ -29,8 +76,159 @@ def _phrase_in_text(prepared_text, phrase):
     return bool(re.search(pattern, prepared_text))
 
 
+def _phrase_token_forms(normalized_phrase):
+    if normalized_phrase.endswith("y") and len(normalized_phrase) > 3:
+        return (normalized_phrase, normalized_phrase[:-1] + "ies")
+    return (normalized_phrase, normalized_phrase + "s", normalized_phrase + "es")
+
+
+def _compile_token_automaton(entries):
+    # Token-level automaton equivalent to running _phrase_in_text per phrase:
+    # single-token phrases index every accepted plural form, multi-token phrases
+    # are keyed by their first token and verified against the following tokens.
+    single = {}
+    multi = {}
+    for phrase, payload in entries:
+        normalized_phrase = _normalize_for_match(phrase)
+        if not normalized_phrase:
+            continue
+        tokens = tuple(normalized_phrase.split())
+        if len(tokens) == 1:
+            for form in _phrase_token_forms(normalized_phrase):
+                single.setdefault(form, set()).add(payload)
+            continue
+        candidates = multi.setdefault(tokens[0], {})
+        candidates.setdefault(tokens, set()).add(payload)
+    return (
+        {form: frozenset(found) for form, found in single.items()},
+        {
+            first: tuple((tokens, frozenset(found)) for tokens, found in candidates.items())
+            for first, candidates in multi.items()
+        },
+    )
+
+
+# Matcher backends: "compiled" builds the token automaton above, "reference"
+# keeps the phrase list and runs _phrase_in_text per phrase. Both must return
+# identical hits; the reference backend exists for parity checks and benchmarks.
+MATCHER_BACKENDS = ("compiled", "reference")
+_MATCHER_BACKEND = os.getenv("CAREER_SLEEVES_MATCHER_BACKEND", "compiled").strip().lower()
+if _MATCHER_BACKEND not in MATCHER_BACKENDS:
+    _MATCHER_BACKEND = "compiled"
+
+_ReferenceMatcher = namedtuple("_ReferenceMatcher", ["entries"])
+
+
+def _compile_matcher(entries):
+    if _MATCHER_BACKEND == "reference":
+        return _ReferenceMatcher(
+            entries=tuple(
+                (phrase, payload) for phrase, payload in entries if _normalize_for_match(phrase)
+            )
+        )
+    return _compile_token_automaton(entries)
+
+
+def _compile_phrase_matcher(phrases):
+    return _compile_matcher((phrase, phrase) for phrase in phrases or [])
+
+
+def _compile_tagged_phrase_matcher(tagged_phrases):
+    return _compile_matcher(
+        (phrase, (tag, phrase)) for tag, phrases in tagged_phrases for phrase in phrases or []
+    )
+
+
+def _match_reference_phrases(prepared_text, matcher):
+    if not isinstance(prepared_text, PreparedText):
+        prepared_text = f" {' '.join(str(prepared_text or '').split())} "
+    return {
+        payload
+        for phrase, payload in matcher.entries
+        if _phrase_in_text(prepared_text, phrase)
+    }
+
+
+def _match_phrases(prepared_text, matcher):
+    if isinstance(matcher, _ReferenceMatcher):
+        return _match_reference_phrases(prepared_text, matcher)
+    single, multi = matcher
+    if isinstance(prepared_text, PreparedText):
+        tokens = prepared_text.tokens
+    else:
+        tokens = prepared_text.split()
+    hits = set()
+    for idx, token in enumerate(tokens):
+        found = single.get(token)
+        if found:
+            hits.update(found)
+        candidates = multi.get(token)
+        if not candidates:
+            continue
+        for phrase_tokens, found in candidates:
+            end = idx + len(phrase_tokens)
+            if end <= len(tokens) and tuple(tokens[idx:end]) == phrase_tokens:
+                hits.update(found)
+    return hits
+
+
+def _match_tagged_phrases(prepared_text, matcher):
+    hits_by_tag = {}
+    for tag, phrase in _match_phrases(prepared_text, matcher):
+        hits_by_tag.setdefault(tag, set()).add(phrase)
+    return hits_by_tag
+
+
+def _match_tagged_phrases_batch(prepared_texts, matcher):
+    # One pass over the concatenated token streams of every document; phrases
+    # never extend past the end of the document they start in.
+    if isinstance(matcher, _ReferenceMatcher):
+        return [_match_tagged_phrases(prepared_text, matcher) for prepared_text in prepared_texts]
+    single, multi = matcher
+    tokens = []
+    doc_ends = []
+    for prepared_text in prepared_texts:
+        tokens.extend(prepared_text.tokens)
+        doc_ends.append(len(tokens))
+    hits_by_doc = [{} for _ in prepared_texts]
+    doc_index = 0
+    for idx, token in enumerate(tokens):
+        while idx >= doc_ends[doc_index]:
+            doc_index += 1
+        found = single.get(token)
+        candidates = multi.get(token)
+        if not found and not candidates:
+            continue
+        hits_by_tag = hits_by_doc[doc_index]
+        for tag, phrase in found or ():
+            hits_by_tag.setdefault(tag, set()).add(phrase)
+        for phrase_tokens, found_multi in candidates or ():
+            end = idx + len(phrase_tokens)
+            if end <= doc_ends[doc_index] and tuple(tokens[idx:end]) == phrase_tokens:
+                for tag, phrase in found_multi:
+                    hits_by_tag.setdefault(tag, set()).add(phrase)
+    return hits_by_doc
+
+
+_PHRASE_MATCHER_CACHE = {}
+_PHRASE_MATCHER_CACHE_MAX = 2048
+
+
+def _phrase_matcher_for(phrases):
+    key = phrases if isinstance(phrases, tuple) else tuple(phrases or [])
+    matcher = _PHRASE_MATCHER_CACHE.get(key)
+    if matcher is None:
+        if len(_PHRASE_MATCHER_CACHE) >= _PHRASE_MATCHER_CACHE_MAX:
+            _PHRASE_MATCHER_CACHE.clear()
+        matcher = _compile_phrase_matcher(key)
+        _PHRASE_MATCHER_CACHE[key] = matcher
+    return matcher
+
+
 def _find_hits(prepared_text, phrases):
-    return {phrase for phrase in phrases if _phrase_in_text(prepared_text, phrase)}
+    if not phrases:
+        return set()
+    return _match_phrases(prepared_text, _phrase_matcher_for(phrases))
 
 
 SCHEMA_VERSION = "2.0"
@@ -333,6 +531,39 @@ def _expand_abroad_phrases_with_variants(phrases):
     _ABROAD_PHRASE_VARIANT_CACHE[normalized_phrases] = expanded
     return expanded
 
+
+def _compile_abroad_signal_table(signal_config, cap_max):
+    score_cfg = signal_config.get("score", {})
+    positive_terms = _expand_abroad_phrases_with_variants(signal_config.get("positive", []))
+    negative_terms = _expand_abroad_phrases_with_variants(signal_config.get("negative", []))
+    return {
+        "positive_terms": tuple(positive_terms),
+        "negative_terms": tuple(negative_terms),
+        "positive_hit_points": int(score_cfg.get("positive_hit", 0)),
+        "negative_hit_points": int(score_cfg.get("negative_hit", 0)),
+        "cap": int(cap_max),
+    }
+
+
+def _compile_abroad_signal_tables(rules):
+    tables = {
+        "remote_flex": _compile_abroad_signal_table(
+            rules["REMOTE_FLEX_SIGNALS"],
+            REMOTE_FLEX_SCORE_CAP,
+        ),
+        "mobility": _compile_abroad_signal_table(rules["MOBILITY_SIGNALS"], MOBILITY_SCORE_CAP),
+        "visa": _compile_abroad_signal_table(rules["VISA_SIGNALS"], VISA_SCORE_CAP),
+    }
+    matcher = _compile_tagged_phrase_matcher(
+        [
+            ((bucket, polarity), table[f"{polarity}_terms"])
+            for bucket, table in tables.items()
+            for polarity in ("positive", "negative")
+        ]
+    )
+    return tables, matcher
+
+
 SYNERGY_SIGNALS = {
     "positive": [
         "international",
@@ -1263,56 +1494,144 @@ LANGUAGE_CATALOG = [
     {"code": "za", "names": ["zhuang"]},
 ]
 
-_LANGUAGE_LOOKUP = {}
-for language in LANGUAGE_CATALOG:
-    code = language.get("code")
-    for name in language.get("names", []):
-        normalized_name = _normalize_for_match(name)
-        if not normalized_name:
-            continue
-        _LANGUAGE_LOOKUP[normalized_name] = code
+
+def _compile_language_matchers(rules):
+    language_lookup = {}
+    for language in LANGUAGE_CATALOG:
+        code = language.get("code")
+        for name in language.get("names", []):
+            normalized_name = _normalize_for_match(name)
+            if not normalized_name:
+                continue
+            language_lookup[normalized_name] = code
+    name_matcher = _compile_phrase_matcher(
+        [name for name, code in language_lookup.items() if code not in ALLOW_LANGUAGES]
+    )
+    return name_matcher, _compile_phrase_matcher(rules["LANGUAGE_REQUIRED_MARKERS"])
+
+
+# Rules that a scoring ruleset file may override, by constant name. Dict rules
+# are merged one level deep (e.g. a single sleeve or weight); other values are
+# replaced. Everything else in this module is fixed at deploy time.
+RULE_NAMES = (
+    "RANKING_WEIGHTS",
+    "CAREER_SLEEVE_RANKING_WEIGHT_OVERRIDES",
+    "CAREER_SLEEVE_DECISION_THRESHOLD_OVERRIDES",
+    "CAREER_SLEEVE_CONFIG",
+    "CAREER_SLEEVE_TITLE_INTENT_TERMS",
+    "CAREER_SLEEVE_SCORE_TUNING",
+    "SOFT_PENALTIES",
+    "SYNERGY_SIGNALS",
+    "REMOTE_FLEX_SIGNALS",
+    "MOBILITY_SIGNALS",
+    "VISA_SIGNALS",
+    "HARD_REJECT_TITLE_PATTERNS",
+    "HARD_REJECT_TEXT_PATTERNS",
+    "HARD_REJECT_COLD_CALLING_CONTEXT",
+    "LANGUAGE_REQUIRED_MARKERS",
+)
 
 
-def detect_hard_reject(raw_title, raw_text):
-    prepared_title = _prepare_text(raw_title)
-    prepared_text = _prepare_text(raw_text)
+def _builtin_rules():
+    module_globals = globals()
+    return {name: module_globals[name] for name in RULE_NAMES}
+
+
+def _compute_ruleset_fingerprint(rules):
+    fixed = {
+        "schema_version": SCHEMA_VERSION,
+        "allow_languages": ALLOW_LANGUAGES,
+        "thresholds": [
+            MIN_PRIMARY_CAREER_SLEEVE_SCORE_TO_SHOW,
+            MIN_ABROAD_SCORE_TO_PASS,
+            ABROAD_SCORE_CAP,
+            REMOTE_FLEX_SCORE_CAP,
+            MOBILITY_SCORE_CAP,
+            VISA_SCORE_CAP,
+            MIN_TOTAL_HITS_TO_SHOW,
+            MIN_PRIMARY_CAREER_SLEEVE_SCORE_TO_MAYBE,
+            MIN_TOTAL_HITS_TO_MAYBE,
+        ],
+        "abroad_bilingual_token_groups": _ABROAD_BILINGUAL_TOKEN_GROUPS,
+        "abroad_bilingual_phrase_groups": _ABROAD_BILINGUAL_PHRASE_GROUPS,
+        "language_catalog": LANGUAGE_CATALOG,
+    }
+    encoded = json.dumps(
+        {"fixed": fixed, "rules": rules},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=sorted,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
 
-    for phrase in HARD_REJECT_TITLE_PATTERNS:
+
+def ruleset_fingerprint(ruleset=None):
+    return (ruleset or _ACTIVE_RULESET)["fingerprint"]
+
+
+def detect_hard_reject(raw_title, raw_text, ruleset=None):
+    rules = (ruleset or _ACTIVE_RULESET)["rules"]
+    prepared_title = _build_prepared_text(raw_title)
+    prepared_text = _build_prepared_text(raw_text)
+
+    for phrase in rules["HARD_REJECT_TITLE_PATTERNS"]:
         if _phrase_in_text(prepared_title, phrase):
             return f"hard_reject_title:{phrase}"
 
-    for phrase in HARD_REJECT_TEXT_PATTERNS:
+    for phrase in rules["HARD_REJECT_TEXT_PATTERNS"]:
         if _phrase_in_text(prepared_text, phrase):
             return f"hard_reject_text:{phrase}"
 
     if _phrase_in_text(prepared_text, "cold calling"):
-        if _find_hits(prepared_text, HARD_REJECT_COLD_CALLING_CONTEXT):
+        if _find_hits(prepared_text, rules["HARD_REJECT_COLD_CALLING_CONTEXT"]):
             return "hard_reject_text:cold calling sales context"
     return ""
 
 
-def detect_blocked_html(html_text):
-    prepared = _prepare_text(html_text)
-    if not prepared:
-        return False
+# Block and consent pages put their markers near the top; scanning a bounded
+# prefix keeps detection cheap on multi-hundred-KB result pages.
+BLOCKED_HTML_SCAN_CHARS = 128 * 1024
+_BLOCKED_HTML_STRONG_MARKERS = (
+    "captcha",
+    "are you a robot",
+    "access denied",
+    "security check",
+    "unusual traffic",
+    "verify you are human",
+)
+_BLOCKED_HTML_WEAK_MARKERS = (
+    "blocked",
+    "sign in to continue",
+)
 
-    strong_markers = [
-        "captcha",
-        "are you a robot",
-        "access denied",
-        "security check",
-        "unusual traffic",
-        "verify you are human",
-    ]
-    if any(_phrase_in_text(prepared, marker) for marker in strong_markers):
-        return True
 
-    weak_markers = [
-        "blocked",
-        "sign in to continue",
-    ]
-    weak_hits = sum(1 for marker in weak_markers if _phrase_in_text(prepared, marker))
-    return weak_hits >= 2
+def _compile_blocked_html_pattern():
+    alternatives = []
+    markers = _BLOCKED_HTML_STRONG_MARKERS + _BLOCKED_HTML_WEAK_MARKERS
+    for idx, marker in enumerate(markers):
+        tokens = _normalize_for_match(marker).split()
+        if len(tokens) == 1:
+            body = "(?:" + "|".join(re.escape(form) for form in _phrase_token_forms(tokens[0])) + ")"
+        else:
+            body = r"\W+".join(re.escape(token) for token in tokens)
+        alternatives.append(rf"(?P<m{idx}>(?<!\w){body}(?!\w))")
+    return re.compile("|".join(alternatives), re.IGNORECASE), markers
+
+
+_BLOCKED_HTML_PATTERN, _BLOCKED_HTML_MARKERS = _compile_blocked_html_pattern()
+
+
+def detect_blocked_html(html_text):
+    text = str(html_text or "")[:BLOCKED_HTML_SCAN_CHARS]
+    weak_hits = set()
+    for match in _BLOCKED_HTML_PATTERN.finditer(text):
+        marker = _BLOCKED_HTML_MARKERS[int(match.lastgroup[1:])]
+        if marker in _BLOCKED_HTML_STRONG_MARKERS:
+            return True
+        weak_hits.add(marker)
+        if len(weak_hits) >= 2:
+            return True
+    return False
 
 
 def normalize_for_match(value):
@@ -1323,13 +1642,39 @@ def prepare_text(value):
     return _prepare_text(value)
 
 
+def build_prepared_text(value):
+    return _build_prepared_text(value)
+
+
 def find_hits(prepared_text, phrases):
     return _find_hits(prepared_text, phrases)
 
 
-def ranking_weights_for_career_sleeve(career_sleeve_id):
-    base = {key: float(RANKING_WEIGHTS.get(key, 0.0)) for key in WEIGHT_KEYS}
-    overrides = CAREER_SLEEVE_RANKING_WEIGHT_OVERRIDES.get(
+def phrase_spans(prepared_text, phrase):
+    return _phrase_spans(prepared_text, phrase)
+
+
+def compile_phrase_matcher(phrases):
+    return _compile_phrase_matcher(phrases)
+
+
+def compile_tagged_phrase_matcher(tagged_phrases):
+    return _compile_tagged_phrase_matcher(tagged_phrases)
+
+
+def match_phrases(prepared_text, matcher):
+    return _match_phrases(_build_prepared_text(prepared_text), matcher)
+
+
+def match_tagged_phrases(prepared_text, matcher):
+    return _match_tagged_phrases(_build_prepared_text(prepared_text), matcher)
+
+
+def ranking_weights_for_career_sleeve(career_sleeve_id, ruleset=None):
+    rules = (ruleset or _ACTIVE_RULESET)["rules"]
+    ranking_weights = rules["RANKING_WEIGHTS"]
+    base = {key: float(ranking_weights.get(key, 0.0)) for key in WEIGHT_KEYS}
+    overrides = rules["CAREER_SLEEVE_RANKING_WEIGHT_OVERRIDES"].get(
         (career_sleeve_id or "").upper(),
         {},
     )
@@ -1343,12 +1688,12 @@ def ranking_weights_for_career_sleeve(career_sleeve_id):
 
     total = sum(base.values())
     if total <= 0:
-        total = sum(float(RANKING_WEIGHTS.get(key, 0.0)) for key in WEIGHT_KEYS) or 1.0
-        return {key: float(RANKING_WEIGHTS.get(key, 0.0)) / total for key in WEIGHT_KEYS}
+        total = sum(float(ranking_weights.get(key, 0.0)) for key in WEIGHT_KEYS) or 1.0
+        return {key: float(ranking_weights.get(key, 0.0)) / total for key in WEIGHT_KEYS}
     return {key: base[key] / total for key in WEIGHT_KEYS}
 
 
-def decision_thresholds_for_career_sleeve(career_sleeve_id):
+def decision_thresholds_for_career_sleeve(career_sleeve_id, ruleset=None):
     defaults = {
         "min_primary_score": int(MIN_PRIMARY_CAREER_SLEEVE_SCORE_TO_SHOW),
         "min_total_hits": int(MIN_TOTAL_HITS_TO_SHOW),
@@ -1359,7 +1704,7 @@ def decision_thresholds_for_career_sleeve(career_sleeve_id):
         "custom_maybe_score": 1,
         "custom_maybe_hits": 1,
     }
-    overrides = CAREER_SLEEVE_DECISION_THRESHOLD_OVERRIDES.get(
+    overrides = (ruleset or _ACTIVE_RULESET)["rules"]["CAREER_SLEEVE_DECISION_THRESHOLD_OVERRIDES"].get(
         (career_sleeve_id or "").upper(),
         {},
     )
@@ -1380,57 +1725,80 @@ def decision_thresholds_for_career_sleeve(career_sleeve_id):
     return defaults
 
 
-def _phrase_spans(normalized_text, phrase):
-    normalized_phrase = _normalize_for_match(phrase)
-    if not normalized_phrase:
-        return []
-    parts = [re.escape(part) for part in normalized_phrase.split()]
-    if not parts:
-        return []
-    pattern = r"\b" + r"\s+".join(parts) + r"\b"
-    return [match.span() for match in re.finditer(pattern, normalized_text)]
-
-
-def _phrase_token_positions(normalized_text, phrase):
+def _phrase_token_positions(prepared_text, phrase):
+    # Start positions of the exact token sequence, found by intersecting the
+    # shifted position lists of each phrase token in the positional index.
+    prepared_text = _build_prepared_text(prepared_text)
     phrase_tokens = _normalize_for_match(phrase).split()
-    text_tokens = normalized_text.split()
-    if not phrase_tokens or not text_tokens:
+    if not phrase_tokens:
         return []
-    positions = []
-    span_len = len(phrase_tokens)
-    for idx in range(0, len(text_tokens) - span_len + 1):
-        if text_tokens[idx : idx + span_len] == phrase_tokens:
-            positions.append(idx)
-    return positions
-
-
-def _is_language_required_in_context(raw_text, language_phrase):
-    raw_value = str(raw_text or "").lower()
-    clauses = [segment.strip() for segment in re.split(r"[.;:!\n\r]+", raw_value) if segment.strip()]
-    for clause in clauses:
-        normalized_clause = _normalize_for_match(clause)
-        prepared_clause = _prepare_text(normalized_clause)
-        if not _phrase_in_text(prepared_clause, language_phrase):
+    index = prepared_text.positions
+    candidates = None
+    for shift, token in sorted(
+        enumerate(phrase_tokens),
+        key=lambda pair: len(index.get(pair[1], ())),
+    ):
+        token_positions = index.get(token)
+        if not token_positions:
+            return []
+        starts = {position - shift for position in token_positions}
+        candidates = starts if candidates is None else candidates & starts
+        if not candidates:
+            return []
+    return sorted(candidates)
+
+
+def _phrase_spans(prepared_text, phrase):
+    # Character spans in the normalized text of non-overlapping occurrences,
+    # matching a left-to-right regex scan.
+    prepared_text = _build_prepared_text(prepared_text)
+    span_len = len(_normalize_for_match(phrase).split())
+    spans = []
+    next_free = 0
+    for start in _phrase_token_positions(prepared_text, phrase):
+        if start < next_free:
             continue
-        for marker in LANGUAGE_REQUIRED_MARKERS:
-            if _phrase_in_text(prepared_clause, marker):
-                return True
-    return False
+        end = start + span_len - 1
+        spans.append(
+            (
+                prepared_text.offsets[start],
+                prepared_text.offsets[end] + len(prepared_text.tokens[end]),
+            )
+        )
+        next_free = start + span_len
+    return spans
+
+
+def _required_languages_in_clauses(lowered_text, candidate_languages, ruleset):
+    # Clauses are segmented once; a language counts as required when it shares a
+    # clause with one of LANGUAGE_REQUIRED_MARKERS.
+    language_name_matcher = ruleset["language_name_matcher"]
+    language_marker_matcher = ruleset["language_marker_matcher"]
+    required = set()
+    for segment in re.split(r"[.;:!\n\r]+", lowered_text):
+        if not segment.strip():
+            continue
+        prepared_clause = _build_prepared_text(segment)
+        if not _match_phrases(prepared_clause, language_marker_matcher):
+            continue
+        required.update(_match_phrases(prepared_clause, language_name_matcher) & candidate_languages)
+        if required == candidate_languages:
+            break
+    return required
 
 
-def detect_language_flags(raw_text):
-    normalized_text = _normalize_for_match(raw_text)
-    prepared_text = _prepare_text(normalized_text)
+def detect_language_flags(raw_text, ruleset=None):
+    ruleset = ruleset or _ACTIVE_RULESET
+    prepared_text = _build_prepared_text(raw_text)
 
-    extra_languages = set()
+    extra_languages = _match_phrases(prepared_text, ruleset["language_name_matcher"])
     required_languages = set()
-    for normalized_name, code in _LANGUAGE_LOOKUP.items():
-        if code in ALLOW_LANGUAGES:
-            continue
-        if _phrase_in_text(prepared_text, normalized_name):
-            extra_languages.add(normalized_name)
-            if _is_language_required_in_context(raw_text, normalized_name):
-                required_languages.add(normalized_name)
+    if extra_languages:
+        required_languages = _required_languages_in_clauses(
+            prepared_text.lowered,
+            extra_languages,
+            ruleset,
+        )
 
     ordered_languages = sorted(extra_languages)
     ordered_required = sorted(required_languages)
@@ -1453,17 +1821,32 @@ def detect_language_flags(raw_text):
     }, notes
 
 
-def _score_signal_bucket(prepared_text, signal_config, cap_max):
-    positive_terms = _expand_abroad_phrases_with_variants(signal_config.get("positive", []))
-    negative_terms = _expand_abroad_phrases_with_variants(signal_config.get("negative", []))
-    positive_hits = _find_hits(prepared_text, positive_terms)
-    negative_hits = _find_hits(prepared_text, negative_terms)
-    score_cfg = signal_config.get("score", {})
+# Explanation payload levels for the scorers: "none" keeps only numbers and
+# gate outcomes, "summary" adds hit counts and thresholds, "full" adds the
+# sorted hit lists.
+EXPLAIN_LEVELS = ("none", "summary", "full")
+
+
+def _explain_level(explain):
+    if explain not in EXPLAIN_LEVELS:
+        raise ValueError(f"Unsupported explain level: {explain!r}")
+    return explain
+
+
+def _score_signal_bucket(table, positive_hits, negative_hits, explain="full"):
     total = (
-        len(positive_hits) * int(score_cfg.get("positive_hit", 0))
-        + len(negative_hits) * int(score_cfg.get("negative_hit", 0))
+        len(positive_hits) * table["positive_hit_points"]
+        + len(negative_hits) * table["negative_hit_points"]
     )
-    score = max(0, min(int(cap_max), total))
+    score = max(0, min(table["cap"], total))
+    if explain == "none":
+        return score, {"raw_total": total}
+    if explain == "summary":
+        return score, {
+            "positive_hit_count": len(positive_hits),
+            "negative_hit_count": len(negative_hits),
+            "raw_total": total,
+        }
     return score, {
         "positive_hits": sorted(positive_hits),
         "negative_hits": sorted(negative_hits),
@@ -1471,8 +1854,10 @@ def _score_signal_bucket(prepared_text, signal_config, cap_max):
     }
 
 
-def score_abroad_components(raw_text):
-    prepared_text = _prepare_text(raw_text)
+def score_abroad_components(raw_text, explain="full", ruleset=None):
+    explain = _explain_level(explain)
+    ruleset = ruleset or _ACTIVE_RULESET
+    prepared_text = _build_prepared_text(raw_text)
     badges = []
     details = {
         "remote_flex": {},
@@ -1480,21 +1865,19 @@ def score_abroad_components(raw_text):
         "visa": {},
     }
 
-    remote_flex_score, remote_flex_details = _score_signal_bucket(
-        prepared_text,
-        REMOTE_FLEX_SIGNALS,
-        REMOTE_FLEX_SCORE_CAP,
-    )
-    mobility_score, mobility_details = _score_signal_bucket(
-        prepared_text,
-        MOBILITY_SIGNALS,
-        MOBILITY_SCORE_CAP,
-    )
-    visa_score, visa_details = _score_signal_bucket(
-        prepared_text,
-        VISA_SIGNALS,
-        VISA_SCORE_CAP,
-    )
+    hits_by_tag = _match_tagged_phrases(prepared_text, ruleset["abroad_signal_matcher"])
+    bucket_results = {
+        bucket: _score_signal_bucket(
+            table,
+            hits_by_tag.get((bucket, "positive"), set()),
+            hits_by_tag.get((bucket, "negative"), set()),
+            explain=explain,
+        )
+        for bucket, table in ruleset["abroad_signal_tables"].items()
+    }
+    remote_flex_score, remote_flex_details = bucket_results["remote_flex"]
+    mobility_score, mobility_details = bucket_results["mobility"]
+    visa_score, visa_details = bucket_results["visa"]
 
     details["remote_flex"] = remote_flex_details
     details["mobility"] = mobility_details
@@ -1523,77 +1906,200 @@ def score_abroad_components(raw_text):
     return components, sorted(set(badges)), details
 
 
-def score_abroad(raw_text):
-    components, badges, details = score_abroad_components(raw_text)
+def score_abroad(raw_text, explain="full", ruleset=None):
+    components, badges, details = score_abroad_components(
+        raw_text,
+        explain=explain,
+        ruleset=ruleset,
+    )
     return float(components.get("abroad_score", 0.0)), badges, details
 
 
-def score_synergy(raw_text):
-    prepared_text = _prepare_text(raw_text)
-    hits = _find_hits(prepared_text, SYNERGY_SIGNALS["positive"])
-    return min(SYNERGY_SIGNALS["cap_max"], len(hits)), sorted(hits)
+def score_synergy(raw_text, ruleset=None):
+    synergy_signals = (ruleset or _ACTIVE_RULESET)["rules"]["SYNERGY_SIGNALS"]
+    prepared_text = _build_prepared_text(raw_text)
+    hits = _find_hits(prepared_text, synergy_signals["positive"])
+    return min(synergy_signals["cap_max"], len(hits)), sorted(hits)
+
 
+def _plan_int(values, key, fallback=0):
+    try:
+        return int(values.get(key, fallback))
+    except (TypeError, ValueError):
+        return int(fallback)
 
-def score_career_sleeve(career_sleeve_id, raw_text, raw_title):
-    config = CAREER_SLEEVE_CONFIG[career_sleeve_id]
+
+def _compile_career_sleeve_plan(career_sleeve_id, rules):
+    config = rules["CAREER_SLEEVE_CONFIG"][career_sleeve_id]
     keywords = config["keywords"]
-    anchors = config.get("anchors") or []
     must_haves = config["must_haves"]
     points = config["scoring"]["points"]
     cap = config["scoring"]["cap_max"]
-    sleeve_tuning = CAREER_SLEEVE_SCORE_TUNING.get(career_sleeve_id, {})
-
-    prepared_text = _prepare_text(raw_text)
-    prepared_title = _prepare_text(raw_title)
-
-    title_hits_in_title = _find_hits(prepared_title, keywords["title_positive"])
-    title_hits_in_text = _find_hits(prepared_text, keywords["title_positive"])
-    context_hits = _find_hits(prepared_text, keywords["context_positive"])
-    negative_hits = _find_hits(prepared_text, keywords["negative"])
-    anchor_hits = _find_hits(prepared_text, anchors)
-    bonus_hits = _find_hits(prepared_text, must_haves.get("bonus_signals") or [])
-    title_intent_hits = _find_hits(
-        prepared_title,
-        CAREER_SLEEVE_TITLE_INTENT_TERMS.get(career_sleeve_id, []),
+    sleeve_tuning = rules["CAREER_SLEEVE_SCORE_TUNING"].get(career_sleeve_id, {})
+    min_anchor_hits = max(0, int(must_haves.get("min_anchor_hits", 0)))
+    return {
+        "career_sleeve_id": career_sleeve_id,
+        "title_positive": _compile_phrase_matcher(keywords["title_positive"]),
+        "context_positive": _compile_phrase_matcher(keywords["context_positive"]),
+        "negative": _compile_phrase_matcher(keywords["negative"]),
+        "anchors": _compile_phrase_matcher(config.get("anchors") or []),
+        "bonus_signals": _compile_phrase_matcher(must_haves.get("bonus_signals") or []),
+        "title_intent": _compile_phrase_matcher(
+            rules["CAREER_SLEEVE_TITLE_INTENT_TERMS"].get(career_sleeve_id, [])
+        ),
+        "title_hit_points": points.get("title_hit", 0),
+        "context_hit_points": points.get("context_hit", 0),
+        "bonus_hit_points": points.get("bonus_hit", 0),
+        "negative_hit_points": points.get("negative_hit", 0),
+        "title_gate_bonus": points.get("title_gate_bonus", 0),
+        "coverage_bonus": points.get("coverage_bonus", 0),
+        "cap": cap,
+        "title_intent_weight": _plan_int(sleeve_tuning, "title_intent_weight", 0),
+        "context_density_threshold": max(
+            1,
+            _plan_int(sleeve_tuning, "context_density_threshold", 3),
+        ),
+        "context_density_bonus": _plan_int(sleeve_tuning, "context_density_bonus", 0),
+        "title_context_blend_bonus": _plan_int(sleeve_tuning, "title_context_blend_bonus", 0),
+        "min_title_hits": must_haves.get("min_title_hits", 0),
+        "min_total_hits": must_haves.get("min_total_hits", 0),
+        "min_anchor_hits": min_anchor_hits,
+        "anchor_cap_score": max(0, min(cap, int(must_haves.get("anchor_cap_score", cap)))),
+    }
+
+
+def _compile_career_sleeve_plans(rules):
+    return {
+        career_sleeve_id: _compile_career_sleeve_plan(career_sleeve_id, rules)
+        for career_sleeve_id in sorted(rules["CAREER_SLEEVE_CONFIG"])
+    }
+
+
+_TEXT_BUCKETS = ("title_positive", "context_positive", "negative", "anchors", "bonus_signals")
+_TITLE_BUCKETS = ("title_positive", "title_intent")
+
+
+def _compile_fused_matchers(rules):
+    # One matcher over every sleeve's phrases, tagged by (sleeve, bucket), so
+    # score_all_career_sleeves scans the text and the title once each.
+    text_phrases = []
+    title_phrases = []
+    for career_sleeve_id in sorted(rules["CAREER_SLEEVE_CONFIG"]):
+        config = rules["CAREER_SLEEVE_CONFIG"][career_sleeve_id]
+        keywords = config["keywords"]
+        bucket_phrases = {
+            "title_positive": keywords["title_positive"],
+            "context_positive": keywords["context_positive"],
+            "negative": keywords["negative"],
+            "anchors": config.get("anchors") or [],
+            "bonus_signals": config["must_haves"].get("bonus_signals") or [],
+            "title_intent": rules["CAREER_SLEEVE_TITLE_INTENT_TERMS"].get(career_sleeve_id, []),
+        }
+        for bucket in _TEXT_BUCKETS:
+            text_phrases.append(((career_sleeve_id, bucket), bucket_phrases[bucket]))
+        for bucket in _TITLE_BUCKETS:
+            title_phrases.append(((career_sleeve_id, bucket), bucket_phrases[bucket]))
+    return (
+        _compile_tagged_phrase_matcher(text_phrases),
+        _compile_tagged_phrase_matcher(title_phrases),
     )
-    total_positive_hits = len(title_hits_in_text.union(context_hits))
 
-    def _tuning_int(key, fallback=0):
-        try:
-            return int(sleeve_tuning.get(key, fallback))
-        except (TypeError, ValueError):
-            return int(fallback)
 
-    context_density_threshold = max(1, _tuning_int("context_density_threshold", 3))
-    context_density_met = len(context_hits) >= context_density_threshold
+def _score_career_sleeve_hits(
+    plan,
+    title_hits_in_title,
+    title_hits_in_text,
+    context_hits,
+    negative_hits,
+    anchor_hits,
+    bonus_hits,
+    title_intent_hits,
+    explain="full",
+):
+    total_positive_hits = len(title_hits_in_text.union(context_hits))
+    context_density_met = len(context_hits) >= plan["context_density_threshold"]
     title_context_blend = bool(title_hits_in_title and context_hits)
 
     score = (
-        len(title_hits_in_title) * points.get("title_hit", 0)
-        + len(context_hits) * points.get("context_hit", 0)
-        + len(bonus_hits) * points.get("bonus_hit", 0)
-        + len(negative_hits) * points.get("negative_hit", 0)
+        len(title_hits_in_title) * plan["title_hit_points"]
+        + len(context_hits) * plan["context_hit_points"]
+        + len(bonus_hits) * plan["bonus_hit_points"]
+        + len(negative_hits) * plan["negative_hit_points"]
     )
-    score += len(title_intent_hits) * _tuning_int("title_intent_weight", 0)
+    score += len(title_intent_hits) * plan["title_intent_weight"]
     if context_density_met:
-        score += _tuning_int("context_density_bonus", 0)
+        score += plan["context_density_bonus"]
     if title_context_blend:
-        score += _tuning_int("title_context_blend_bonus", 0)
-    if len(title_hits_in_title) >= must_haves.get("min_title_hits", 0):
-        score += points.get("title_gate_bonus", 0)
-    if total_positive_hits >= must_haves.get("min_total_hits", 0):
-        score += points.get("coverage_bonus", 0)
-    score = max(0, min(cap, score))
-
-    min_anchor_hits = max(0, int(must_haves.get("min_anchor_hits", 0)))
-    anchor_cap_score = max(0, min(cap, int(must_haves.get("anchor_cap_score", cap))))
+        score += plan["title_context_blend_bonus"]
+    if len(title_hits_in_title) >= plan["min_title_hits"]:
+        score += plan["title_gate_bonus"]
+    if total_positive_hits >= plan["min_total_hits"]:
+        score += plan["coverage_bonus"]
+    score = max(0, min(plan["cap"], score))
+
+    min_anchor_hits = plan["min_anchor_hits"]
+    anchor_cap_score = plan["anchor_cap_score"]
     anchor_gate_met = len(anchor_hits) >= min_anchor_hits
     if min_anchor_hits and not anchor_gate_met:
         score = min(score, anchor_cap_score)
 
-    reason = "ok" if anchor_gate_met else "missing_domain_anchors"
+    return score, _career_sleeve_hit_details(
+        plan,
+        title_hits_in_title,
+        context_hits,
+        negative_hits,
+        anchor_hits,
+        bonus_hits,
+        title_intent_hits,
+        total_positive_hits,
+        anchor_gate_met,
+        context_density_met,
+        title_context_blend,
+        explain,
+    )
 
-    return score, {
+
+def _career_sleeve_hit_details(
+    plan,
+    title_hits_in_title,
+    context_hits,
+    negative_hits,
+    anchor_hits,
+    bonus_hits,
+    title_intent_hits,
+    total_positive_hits,
+    anchor_gate_met,
+    context_density_met,
+    title_context_blend,
+    explain,
+):
+    min_anchor_hits = plan["min_anchor_hits"]
+    anchor_cap_score = plan["anchor_cap_score"]
+    reason = "ok" if anchor_gate_met else "missing_domain_anchors"
+    details = {
+        "reason": reason,
+        "total_positive_hits": total_positive_hits,
+        "anchor_gate_met": anchor_gate_met,
+        "context_density_met": context_density_met,
+        "title_context_blend": title_context_blend,
+    }
+    if explain == "none":
+        return details
+    details.update(
+        {
+            "title_intent_hit_count": len(title_intent_hits),
+            "context_density_threshold": plan["context_density_threshold"],
+            "title_hit_count": len(title_hits_in_title),
+            "anchor_hit_count": len(anchor_hits),
+            "min_anchor_hits": min_anchor_hits,
+            "anchor_cap_score": anchor_cap_score,
+            "min_title_hits": int(plan["min_title_hits"]),
+            "min_total_hits": int(plan["min_total_hits"]),
+        }
+    )
+    if explain == "summary":
+        return details
+    return {
         "reason": reason,
         "title_hits": sorted(title_hits_in_title),
         "context_hits": sorted(context_hits),
@@ -1602,7 +2108,7 @@ def score_career_sleeve(career_sleeve_id, raw_text, raw_title):
         "bonus_hits": sorted(bonus_hits),
         "title_intent_hits": sorted(title_intent_hits),
         "title_intent_hit_count": len(title_intent_hits),
-        "context_density_threshold": context_density_threshold,
+        "context_density_threshold": plan["context_density_threshold"],
         "context_density_met": context_density_met,
         "title_context_blend": title_context_blend,
         "title_hit_count": len(title_hits_in_title),
@@ -1611,30 +2117,153 @@ def score_career_sleeve(career_sleeve_id, raw_text, raw_title):
         "anchor_gate_met": anchor_gate_met,
         "anchor_cap_score": anchor_cap_score,
         "total_positive_hits": total_positive_hits,
-        "min_title_hits": int(must_haves.get("min_title_hits", 0)),
-        "min_total_hits": int(must_haves.get("min_total_hits", 0)),
+        "min_title_hits": int(plan["min_title_hits"]),
+        "min_total_hits": int(plan["min_total_hits"]),
     }
 
 
-def score_all_career_sleeves(raw_text, raw_title):
+def score_career_sleeve(career_sleeve_id, raw_text, raw_title, explain="full", ruleset=None):
+    explain = _explain_level(explain)
+    plan = (ruleset or _ACTIVE_RULESET)["career_sleeve_plans"][career_sleeve_id]
+    prepared_text = _build_prepared_text(raw_text)
+    prepared_title = _build_prepared_text(raw_title)
+
+    return _score_career_sleeve_hits(
+        plan,
+        title_hits_in_title=_match_phrases(prepared_title, plan["title_positive"]),
+        title_hits_in_text=_match_phrases(prepared_text, plan["title_positive"]),
+        context_hits=_match_phrases(prepared_text, plan["context_positive"]),
+        negative_hits=_match_phrases(prepared_text, plan["negative"]),
+        anchor_hits=_match_phrases(prepared_text, plan["anchors"]),
+        bonus_hits=_match_phrases(prepared_text, plan["bonus_signals"]),
+        title_intent_hits=_match_phrases(prepared_title, plan["title_intent"]),
+        explain=explain,
+    )
+
+
+def score_all_career_sleeves(raw_text, raw_title, explain="full", ruleset=None):
+    explain = _explain_level(explain)
+    ruleset = ruleset or _ACTIVE_RULESET
+    text_hits = _match_tagged_phrases(_build_prepared_text(raw_text), ruleset["fused_text_matcher"])
+    title_hits = _match_tagged_phrases(_build_prepared_text(raw_title), ruleset["fused_title_matcher"])
+    empty = frozenset()
     scores = {}
     details = {}
-    for career_sleeve_id in sorted(CAREER_SLEEVE_CONFIG):
-        sleeve_score, sleeve_details = score_career_sleeve(
-            career_sleeve_id,
-            raw_text,
-            raw_title,
+    for career_sleeve_id, plan in ruleset["career_sleeve_plans"].items():
+        sleeve_score, sleeve_details = _score_career_sleeve_hits(
+            plan,
+            title_hits_in_title=title_hits.get((career_sleeve_id, "title_positive"), empty),
+            title_hits_in_text=text_hits.get((career_sleeve_id, "title_positive"), empty),
+            context_hits=text_hits.get((career_sleeve_id, "context_positive"), empty),
+            negative_hits=text_hits.get((career_sleeve_id, "negative"), empty),
+            anchor_hits=text_hits.get((career_sleeve_id, "anchors"), empty),
+            bonus_hits=text_hits.get((career_sleeve_id, "bonus_signals"), empty),
+            title_intent_hits=title_hits.get((career_sleeve_id, "title_intent"), empty),
+            explain=explain,
         )
         scores[career_sleeve_id] = sleeve_score
         details[career_sleeve_id] = sleeve_details
     return scores, details
 
 
-def evaluate_soft_penalties(raw_text):
-    prepared_text = _prepare_text(raw_text)
+def _hit_column(hits_by_doc, career_sleeve_id, bucket):
+    empty = frozenset()
+    return [hits.get((career_sleeve_id, bucket), empty) for hits in hits_by_doc]
+
+
+def score_career_sleeves_batch(jobs, explain="full", ruleset=None):
+    """Score (raw_text, raw_title) pairs; each result equals score_all_career_sleeves.
+
+    Postings that normalize to the same text and title are scored once. The
+    fused matchers scan the whole batch in one pass, then each sleeve's scores,
+    coverage gates and caps are computed as columns over the distinct postings.
+    """
+    explain = _explain_level(explain)
+    ruleset = ruleset or _ACTIVE_RULESET
+    doc_by_key = {}
+    prepared_texts = []
+    prepared_titles = []
+    job_docs = []
+    for raw_text, raw_title in jobs or []:
+        prepared_text = _build_prepared_text(raw_text)
+        prepared_title = _build_prepared_text(raw_title)
+        key = (prepared_text.normalized, prepared_title.normalized)
+        doc = doc_by_key.get(key)
+        if doc is None:
+            doc = doc_by_key[key] = len(prepared_texts)
+            prepared_texts.append(prepared_text)
+            prepared_titles.append(prepared_title)
+        job_docs.append(doc)
+    text_hits = _match_tagged_phrases_batch(prepared_texts, ruleset["fused_text_matcher"])
+    title_hits = _match_tagged_phrases_batch(prepared_titles, ruleset["fused_title_matcher"])
+
+    columns_by_sleeve = {}
+    for career_sleeve_id, plan in ruleset["career_sleeve_plans"].items():
+        title_in_title = _hit_column(title_hits, career_sleeve_id, "title_positive")
+        title_intent = _hit_column(title_hits, career_sleeve_id, "title_intent")
+        title_in_text = _hit_column(text_hits, career_sleeve_id, "title_positive")
+        context = _hit_column(text_hits, career_sleeve_id, "context_positive")
+        negative = _hit_column(text_hits, career_sleeve_id, "negative")
+        anchors = _hit_column(text_hits, career_sleeve_id, "anchors")
+        bonus = _hit_column(text_hits, career_sleeve_id, "bonus_signals")
+        total_positive = [len(a.union(b)) for a, b in zip(title_in_text, context)]
+        density_met = [len(hits) >= plan["context_density_threshold"] for hits in context]
+        blend = [bool(a and b) for a, b in zip(title_in_title, context)]
+        raw_scores = [
+            len(title_in_title[doc]) * plan["title_hit_points"]
+            + len(context[doc]) * plan["context_hit_points"]
+            + len(bonus[doc]) * plan["bonus_hit_points"]
+            + len(negative[doc]) * plan["negative_hit_points"]
+            + len(title_intent[doc]) * plan["title_intent_weight"]
+            + (plan["context_density_bonus"] if density_met[doc] else 0)
+            + (plan["title_context_blend_bonus"] if blend[doc] else 0)
+            + (plan["title_gate_bonus"] if len(title_in_title[doc]) >= plan["min_title_hits"] else 0)
+            + (plan["coverage_bonus"] if total_positive[doc] >= plan["min_total_hits"] else 0)
+            for doc in range(len(prepared_texts))
+        ]
+        scores = [max(0, min(plan["cap"], score)) for score in raw_scores]
+        anchor_met = [len(hits) >= plan["min_anchor_hits"] for hits in anchors]
+        if plan["min_anchor_hits"]:
+            scores = [
+                score if met else min(score, plan["anchor_cap_score"])
+                for score, met in zip(scores, anchor_met)
+            ]
+        columns_by_sleeve[career_sleeve_id] = (
+            scores,
+            title_in_title,
+            context,
+            negative,
+            anchors,
+            bonus,
+            title_intent,
+            total_positive,
+            anchor_met,
+            density_met,
+            blend,
+        )
+
+    # Details are built per job so repeated postings never share hit lists.
+    results = []
+    for doc in job_docs:
+        scores = {}
+        details = {}
+        for career_sleeve_id, columns in columns_by_sleeve.items():
+            scores[career_sleeve_id] = columns[0][doc]
+            details[career_sleeve_id] = _career_sleeve_hit_details(
+                ruleset["career_sleeve_plans"][career_sleeve_id],
+                *(column[doc] for column in columns[1:]),
+                explain,
+            )
+        results.append((scores, details))
+    return results
+
+
+def evaluate_soft_penalties(raw_text, ruleset=None):
+    soft_penalties = (ruleset or _ACTIVE_RULESET)["rules"]["SOFT_PENALTIES"]
+    prepared_text = _build_prepared_text(raw_text)
     total_penalty = 0
     reasons = []
-    for rule in SOFT_PENALTIES:
+    for rule in soft_penalties:
         hits = _find_hits(prepared_text, rule.get("if_any", []))
         if not hits:
             continue
@@ -1642,3 +2271,430 @@ def evaluate_soft_penalties(raw_text):
         reasons.append(rule.get("reason") or f"Penalty hits: {', '.join(sorted(hits))}")
     return total_penalty, reasons
 
+
+# Compiled scoring tables (plans, fused automata, language and abroad matchers)
+# are cached in a versioned pickle artifact. Build it at deploy time with
+# `python career_sleeves.py build-ruleset`; a missing or stale artifact falls
+# back to compiling at import. Artifacts are tied to this module's source as
+# well as the rules, so a change to the compile logic invalidates them.
+RULESET_ARTIFACT_FORMAT = 1
+RULESET_ARTIFACT_PATH = Path(
+    os.getenv(
+        "CAREER_SLEEVES_RULESET_ARTIFACT",
+        str(Path(__file__).with_name("career_sleeves_ruleset.pickle")),
+    )
+)
+try:
+    _MODULE_SOURCE_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+except OSError:
+    _MODULE_SOURCE_DIGEST = None
+
+
+# Shapes the compiled tables and scorers rely on. "number" and "text" are
+# leaves, [schema] is a list of schema, ("map", schema) is an object with free
+# keys and ("record", required, optional) an object with named keys.
+_RULE_NUMBER = "number"
+_RULE_TEXT = "text"
+_RULE_PHRASES = [_RULE_TEXT]
+_RULE_NUMBER_MAP = ("map", _RULE_NUMBER)
+_RULE_SIGNAL_SCHEMA = (
+    "record",
+    {},
+    {"positive": _RULE_PHRASES, "negative": _RULE_PHRASES, "score": _RULE_NUMBER_MAP},
+)
+_RULE_SCHEMAS = {
+    "RANKING_WEIGHTS": _RULE_NUMBER_MAP,
+    "CAREER_SLEEVE_RANKING_WEIGHT_OVERRIDES": ("map", _RULE_NUMBER_MAP),
+    "CAREER_SLEEVE_DECISION_THRESHOLD_OVERRIDES": ("map", _RULE_NUMBER_MAP),
+    "CAREER_SLEEVE_CONFIG": (
+        "map",
+        (
+            "record",
+            {
+                "keywords": (
+                    "record",
+                    {
+                        "title_positive": _RULE_PHRASES,
+                        "context_positive": _RULE_PHRASES,
+                        "negative": _RULE_PHRASES,
+                    },
+                    {},
+                ),
+                "must_haves": (
+                    "record",
+                    {},
+                    {
+                        "min_title_hits": _RULE_NUMBER,
+                        "min_total_hits": _RULE_NUMBER,
+                        "min_anchor_hits": _RULE_NUMBER,
+                        "anchor_cap_score": _RULE_NUMBER,
+                        "bonus_signals": _RULE_PHRASES,
+                    },
+                ),
+                "scoring": ("record", {"points": _RULE_NUMBER_MAP, "cap_max": _RULE_NUMBER}, {}),
+            },
+            {"name": _RULE_TEXT, "tagline": _RULE_TEXT, "anchors": _RULE_PHRASES},
+        ),
+    ),
+    "CAREER_SLEEVE_TITLE_INTENT_TERMS": ("map", _RULE_PHRASES),
+    "CAREER_SLEEVE_SCORE_TUNING": ("map", _RULE_NUMBER_MAP),
+    "SOFT_PENALTIES": [
+        (
+            "record",
+            {"if_any": _RULE_PHRASES},
+            {"penalty_points": _RULE_NUMBER, "reason": _RULE_TEXT},
+        )
+    ],
+    "SYNERGY_SIGNALS": ("record", {"positive": _RULE_PHRASES, "cap_max": _RULE_NUMBER}, {}),
+    "REMOTE_FLEX_SIGNALS": _RULE_SIGNAL_SCHEMA,
+    "MOBILITY_SIGNALS": _RULE_SIGNAL_SCHEMA,
+    "VISA_SIGNALS": _RULE_SIGNAL_SCHEMA,
+    "HARD_REJECT_TITLE_PATTERNS": _RULE_PHRASES,
+    "HARD_REJECT_TEXT_PATTERNS": _RULE_PHRASES,
+    "HARD_REJECT_COLD_CALLING_CONTEXT": _RULE_PHRASES,
+    "LANGUAGE_REQUIRED_MARKERS": _RULE_PHRASES,
+}
+
+
+def _check_rule_shape(value, schema, where):
+    if schema == _RULE_NUMBER:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Scoring rule {where} must be a number")
+    elif schema == _RULE_TEXT:
+        if not isinstance(value, str):
+            raise ValueError(f"Scoring rule {where} must be a string")
+    elif isinstance(schema, list):
+        if not isinstance(value, list):
+            raise ValueError(f"Scoring rule {where} must be a list")
+        for index, item in enumerate(value):
+            _check_rule_shape(item, schema[0], f"{where}[{index}]")
+    else:
+        if not isinstance(value, dict):
+            raise ValueError(f"Scoring rule {where} must be an object")
+        if schema[0] == "map":
+            for key, item in value.items():
+                _check_rule_shape(item, schema[1], f"{where}.{key}")
+            return
+        _, required, optional = schema
+        for key, item_schema in required.items():
+            if key not in value:
+                raise ValueError(f"Scoring rule {where} is missing {key!r}")
+            _check_rule_shape(value[key], item_schema, f"{where}.{key}")
+        for key, item_schema in optional.items():
+            if key in value:
+                _check_rule_shape(value[key], item_schema, f"{where}.{key}")
+
+
+def _merge_rules(overrides):
+    rules = _builtin_rules()
+    for name, value in overrides.items():
+        if name not in rules:
+            raise ValueError(f"Unknown scoring rule: {name!r}")
+        base = rules[name]
+        if isinstance(base, dict):
+            if not isinstance(value, dict):
+                raise ValueError(f"Scoring rule {name} must be an object")
+            rules[name] = {**base, **value}
+        elif isinstance(base, list):
+            if not isinstance(value, list):
+                raise ValueError(f"Scoring rule {name} must be a list")
+            rules[name] = value
+        else:
+            rules[name] = value
+        _check_rule_shape(rules[name], _RULE_SCHEMAS[name], name)
+    return rules
+
+
+def _read_rules_file(path):
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Unreadable scoring ruleset {path}: {exc}") from exc
+    if not isinstance(payload, dict) or not isinstance(payload.get("rules", {}), dict):
+        raise ValueError(f"Scoring ruleset {path} must be an object with a 'rules' object")
+    unknown_keys = sorted(set(payload) - {"version", "rules"})
+    if unknown_keys:
+        raise ValueError(f"Scoring ruleset {path} has unknown keys {unknown_keys}; rules go under 'rules'")
+    version = str(payload.get("version") or "unversioned")
+    return version, _merge_rules(payload.get("rules", {}))
+
+
+def _compile_ruleset(rules=None, version="builtin"):
+    rules = rules or _builtin_rules()
+    fused_text_matcher, fused_title_matcher = _compile_fused_matchers(rules)
+    abroad_signal_tables, abroad_signal_matcher = _compile_abroad_signal_tables(rules)
+    language_name_matcher, language_marker_matcher = _compile_language_matchers(rules)
+    return {
+        "format": RULESET_ARTIFACT_FORMAT,
+        "fingerprint": _compute_ruleset_fingerprint(rules),
+        "source_digest": _MODULE_SOURCE_DIGEST,
+        "version": version,
+        "matcher_backend": _MATCHER_BACKEND,
+        "rules": rules,
+        "career_sleeve_plans": _compile_career_sleeve_plans(rules),
+        "fused_text_matcher": fused_text_matcher,
+        "fused_title_matcher": fused_title_matcher,
+        "abroad_signal_tables": abroad_signal_tables,
+        "abroad_signal_matcher": abroad_signal_matcher,
+        "language_name_matcher": language_name_matcher,
+        "language_marker_matcher": language_marker_matcher,
+    }
+
+
+def _load_ruleset_artifact(path, fingerprint):
+    try:
+        ruleset = pickle.loads(Path(path).read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+        return None
+    if not isinstance(ruleset, dict):
+        return None
+    if ruleset.get("format") != RULESET_ARTIFACT_FORMAT:
+        return None
+    if ruleset.get("fingerprint") != fingerprint:
+        return None
+    if _MODULE_SOURCE_DIGEST is None or ruleset.get("source_digest") != _MODULE_SOURCE_DIGEST:
+        return None
+    if ruleset.get("matcher_backend") != _MATCHER_BACKEND:
+        return None
+    return ruleset
+
+
+def _ruleset_for(rules, version):
+    fingerprint = _compute_ruleset_fingerprint(rules)
+    ruleset = _load_ruleset_artifact(RULESET_ARTIFACT_PATH, fingerprint)
+    if ruleset is None:
+        return _compile_ruleset(rules, version)
+    return dict(ruleset, version=version)
+
+
+def build_ruleset_artifact(path=None, rules_path=None):
+    target = Path(path or RULESET_ARTIFACT_PATH)
+    if rules_path:
+        version, rules = _read_rules_file(rules_path)
+        ruleset = _compile_ruleset(rules, version)
+    else:
+        ruleset = _compile_ruleset()
+    temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(pickle.dumps(ruleset, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(temp_path, target)
+    return target, ruleset["fingerprint"]
+
+
+_ACTIVE_RULESET = _ruleset_for(_builtin_rules(), "builtin")
+_RULESET_LOCK = threading.Lock()
+_RULESET_STATE = {
+    "path": None,
+    "mtime": None,
+    "error": None,
+    "loaded_at": time.time(),
+    "watcher": None,
+    "watcher_path": None,
+}
+
+
+def active_ruleset():
+    # Callers capture the returned dict once per ranking; a reload rebinds the
+    # global and never mutates a ruleset that is already in use.
+    return _ACTIVE_RULESET
+
+
+def ruleset_status():
+    with _RULESET_LOCK:
+        path = _RULESET_STATE["path"]
+        return {
+            "path": str(path) if path else None,
+            "mtime": _RULESET_STATE["mtime"],
+            "version": _ACTIVE_RULESET["version"],
+            "fingerprint": _ACTIVE_RULESET["fingerprint"],
+            "error": _RULESET_STATE["error"],
+            "loaded_at": _RULESET_STATE["loaded_at"],
+        }
+
+
+def _ruleset_file_mtime(path):
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def reload_ruleset(path=None, force=False):
+    """Compile the ruleset file and swap it in; returns True when it changed.
+
+    A missing file falls back to the built-in rules. An invalid file keeps the
+    active ruleset and records the error in ruleset_status().
+    """
+    return _reload_ruleset(path, force)
+
+
+def _reload_ruleset(path, force, watcher=None):
+    global _ACTIVE_RULESET
+    with _RULESET_LOCK:
+        if watcher is not None and _RULESET_STATE["watcher"] is not watcher:
+            # A stopped or replaced watcher must not swap its old file back in.
+            return False
+        path = Path(path) if path else _RULESET_STATE["path"]
+        if path is None:
+            return False
+        mtime = _ruleset_file_mtime(path)
+        if not force and path == _RULESET_STATE["path"] and mtime == _RULESET_STATE["mtime"]:
+            return False
+        _RULESET_STATE["path"] = path
+        _RULESET_STATE["mtime"] = mtime
+        try:
+            if mtime is None:
+                version, rules = "builtin", _builtin_rules()
+            else:
+                version, rules = _read_rules_file(path)
+            if _compute_ruleset_fingerprint(rules) == _ACTIVE_RULESET["fingerprint"]:
+                # Same rules under a new label: keep the compiled tables (and
+                # every cache keyed by the fingerprint) and only relabel.
+                ruleset = dict(_ACTIVE_RULESET, version=version)
+            else:
+                ruleset = _ruleset_for(rules, version)
+        except ValueError as exc:
+            _RULESET_STATE["error"] = str(exc)
+            return False
+        except Exception as exc:
+            _RULESET_STATE["error"] = f"{type(exc).__name__}: {exc}"
+            return False
+        _RULESET_STATE["error"] = None
+        if ruleset["fingerprint"] == _ACTIVE_RULESET["fingerprint"] and version == _ACTIVE_RULESET["version"]:
+            return False
+        # Compiled off to the side; a single rebinding publishes it.
+        _ACTIVE_RULESET = ruleset
+        _RULESET_STATE["loaded_at"] = time.time()
+        return True
+
+
+def start_ruleset_watcher(path, interval=5.0):
+    """Poll the ruleset file in a daemon thread and hot-swap it on change.
+
+    Starting a watcher on another path stops the current one first.
+    """
+    path = Path(path)
+    with _RULESET_LOCK:
+        if _RULESET_STATE["watcher"] is not None and _RULESET_STATE["watcher_path"] == path:
+            return _RULESET_STATE["watcher"]
+    stop_ruleset_watcher()
+    reload_ruleset(path)
+    with _RULESET_LOCK:
+        if _RULESET_STATE["watcher"] is not None:
+            return _RULESET_STATE["watcher"]
+        stop_event = threading.Event()
+        _RULESET_STATE["watcher"] = stop_event
+        _RULESET_STATE["watcher_path"] = path
+        # Seeded from the mtime the load above recorded, so an edit that lands
+        # after that load is still seen as a change.
+        initial_mtime = _RULESET_STATE["mtime"] if _RULESET_STATE["path"] == path else None
+
+    def _watch():
+        last_mtime = initial_mtime
+        while not stop_event.wait(interval):
+            mtime = _ruleset_file_mtime(path)
+            if mtime != last_mtime:
+                last_mtime = mtime
+                try:
+                    _reload_ruleset(path, force=True, watcher=stop_event)
+                except Exception as exc:
+                    # Keep polling; the next edit to the file gets another try.
+                    with _RULESET_LOCK:
+                        _RULESET_STATE["error"] = f"{type(exc).__name__}: {exc}"
+
+    threading.Thread(target=_watch, name="ruleset-watcher", daemon=True).start()
+    return stop_event
+
+
+def stop_ruleset_watcher():
+    with _RULESET_LOCK:
+        stop_event = _RULESET_STATE["watcher"]
+        _RULESET_STATE["watcher"] = None
+        _RULESET_STATE["watcher_path"] = None
+    if stop_event is not None:
+        stop_event.set()
+
+
+def matcher_backend():
+    return _MATCHER_BACKEND
+
+
+def set_matcher_backend(backend):
+    global _MATCHER_BACKEND, _ACTIVE_RULESET
+    backend = str(backend or "").strip().lower()
+    if backend not in MATCHER_BACKENDS:
+        raise ValueError(f"Unsupported matcher backend: {backend!r}")
+    if backend == _MATCHER_BACKEND:
+        return
+    with _RULESET_LOCK:
+        _MATCHER_BACKEND = backend
+        _PHRASE_MATCHER_CACHE.clear()
+        _ACTIVE_RULESET = _ruleset_for(_ACTIVE_RULESET["rules"], _ACTIVE_RULESET["version"])
+
+
+def _load_benchmark_jobs(path):
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    jobs = payload.get("jobs", []) if isinstance(payload, dict) else payload
+    return [
+        (
+            " ".join(
+                str(job.get(field) or "")
+                for field in ("title", "company", "location", "snippet", "full_description")
+            ),
+            str(job.get("title") or ""),
+        )
+        for job in jobs
+        if isinstance(job, dict)
+    ]
+
+
+def benchmark_matcher_backends(jobs, repeat=3):
+    previous_backend = _MATCHER_BACKEND
+    results = {}
+    try:
+        for backend in MATCHER_BACKENDS:
+            set_matcher_backend(backend)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                for raw_text, raw_title in jobs:
+                    prepared_text = _build_prepared_text(raw_text)
+                    prepared_title = _build_prepared_text(raw_title)
+                    detect_language_flags(prepared_text)
+                    score_all_career_sleeves(prepared_text, prepared_title)
+                    detect_hard_reject(prepared_title, prepared_text)
+                    score_abroad_components(prepared_text)
+                    score_synergy(prepared_text)
+                    evaluate_soft_penalties(prepared_text)
+            elapsed = max(time.perf_counter() - started, 1e-9)
+            results[backend] = (len(jobs) * repeat) / elapsed
+    finally:
+        set_matcher_backend(previous_backend)
+    return results
+
+
+def _main(argv):
+    command = argv[0] if argv else ""
+    if command == "build-ruleset":
+        output_path, fingerprint = build_ruleset_artifact(
+            argv[1] if len(argv) > 1 else None,
+            argv[2] if len(argv) > 2 else None,
+        )
+        print(f"Wrote ruleset {fingerprint} to {output_path}")
+        return 0
+    if command == "benchmark":
+        corpus_path = argv[1] if len(argv) > 1 else Path(__file__).with_name("sample_scrape_output.json")
+        repeat = int(argv[2]) if len(argv) > 2 else 20
+        jobs = _load_benchmark_jobs(corpus_path)
+        for backend, jobs_per_second in benchmark_matcher_backends(jobs, repeat=repeat).items():
+            print(f"{backend:>10}: {jobs_per_second:,.1f} jobs/sec ({len(jobs)} jobs x {repeat})")
+        return 0
+    print("usage: python career_sleeves.py build-ruleset [output_path] [rules.json]")
+    print("       python career_sleeves.py benchmark [corpus.json] [repeat]")
+    return 2
+
+
+if __name__ == "__main__":
+    # Run against the importable module so pickled tables reference
+    # career_sleeves rather than __main__.
+    import career_sleeves
+
+    sys.exit(career_sleeves._main(sys.argv[1:]))
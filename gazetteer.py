@@ -0,0 +1,382 @@
+"""Offline gazetteer resolving job location strings to NL/BE/DE/VN places."""
+
+import math
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+# (name, country, lat, lon, aliases). The name and every alias resolve to the
+# place and are reported back as written here. Words that are also common
+# vocabulary ("Best", "Goes", "Son", "Geel") are left out on purpose.
+PLACES = (
+    # Netherlands
+    ("'s-Hertogenbosch", "NL", 51.6978, 5.3037, ("Den Bosch", "Hertogenbosch")),
+    ("Amsterdam", "NL", 52.3676, 4.9041, ()),
+    ("The Hague", "NL", 52.0705, 4.3007, ("Den Haag", "'s-Gravenhage")),
+    ("Rotterdam", "NL", 51.9244, 4.4777, ()),
+    ("Utrecht", "NL", 52.0907, 5.1214, ()),
+    ("Eindhoven", "NL", 51.4416, 5.4697, ()),
+    ("Tilburg", "NL", 51.5555, 5.0913, ()),
+    ("Breda", "NL", 51.5719, 4.7683, ()),
+    ("Arnhem", "NL", 51.9851, 5.8987, ()),
+    ("Nijmegen", "NL", 51.8420, 5.8528, ()),
+    ("Groningen", "NL", 53.2194, 6.5665, ()),
+    ("Leiden", "NL", 52.1601, 4.4970, ()),
+    ("Maastricht", "NL", 50.8514, 5.6900, ()),
+    ("Haarlem", "NL", 52.3874, 4.6462, ()),
+    ("Delft", "NL", 52.0116, 4.3571, ()),
+    ("Almere", "NL", 52.3508, 5.2647, ()),
+    ("Zwolle", "NL", 52.5168, 6.0830, ()),
+    ("Amersfoort", "NL", 52.1561, 5.3878, ()),
+    ("Dordrecht", "NL", 51.8133, 4.6901, ()),
+    ("Apeldoorn", "NL", 52.2112, 5.9699, ()),
+    ("Leeuwarden", "NL", 53.2012, 5.7999, ()),
+    ("Venlo", "NL", 51.3704, 6.1724, ()),
+    ("Hengelo", "NL", 52.2676, 6.7930, ()),
+    ("Enschede", "NL", 52.2215, 6.8937, ()),
+    ("Hilversum", "NL", 52.2292, 5.1669, ()),
+    ("Zaandam", "NL", 52.4420, 4.8292, ("Zaanstad",)),
+    ("Amstelveen", "NL", 52.3080, 4.8720, ()),
+    ("Hoofddorp", "NL", 52.3030, 4.6890, ("Haarlemmermeer",)),
+    ("Schiphol", "NL", 52.3105, 4.7683, ()),
+    ("Diemen", "NL", 52.3397, 4.9625, ()),
+    ("Weesp", "NL", 52.3075, 5.0417, ()),
+    ("Alkmaar", "NL", 52.6324, 4.7534, ()),
+    ("Purmerend", "NL", 52.5050, 4.9590, ()),
+    ("Hoorn", "NL", 52.6425, 5.0597, ()),
+    ("Enkhuizen", "NL", 52.7033, 5.2917, ()),
+    ("Den Helder", "NL", 52.9533, 4.7600, ()),
+    ("IJmuiden", "NL", 52.4600, 4.6100, ("Velsen",)),
+    ("Beverwijk", "NL", 52.4833, 4.6569, ()),
+    ("Heemskerk", "NL", 52.5100, 4.6700, ()),
+    ("Heemstede", "NL", 52.3583, 4.6250, ()),
+    ("Lelystad", "NL", 52.5185, 5.4714, ()),
+    ("Dronten", "NL", 52.5250, 5.7181, ()),
+    ("Emmeloord", "NL", 52.7108, 5.7481, ()),
+    ("Zoetermeer", "NL", 52.0607, 4.4940, ()),
+    ("Rijswijk", "NL", 52.0362, 4.3256, ()),
+    ("Naaldwijk", "NL", 51.9930, 4.2070, ("Westland",)),
+    ("Gouda", "NL", 52.0115, 4.7105, ()),
+    ("Alphen aan den Rijn", "NL", 52.1294, 4.6550, ()),
+    ("Katwijk", "NL", 52.2033, 4.4000, ()),
+    ("Noordwijk", "NL", 52.2408, 4.4472, ()),
+    ("Leiderdorp", "NL", 52.1583, 4.5292, ()),
+    ("Woerden", "NL", 52.0850, 4.8833, ()),
+    ("Schiedam", "NL", 51.9192, 4.3886, ()),
+    ("Vlaardingen", "NL", 51.9122, 4.3419, ()),
+    ("Maassluis", "NL", 51.9233, 4.2500, ()),
+    ("Capelle aan den IJssel", "NL", 51.9292, 4.5778, ()),
+    ("Spijkenisse", "NL", 51.8450, 4.3290, ()),
+    ("Hellevoetsluis", "NL", 51.8333, 4.1333, ()),
+    ("Barendrecht", "NL", 51.8567, 4.5347, ()),
+    ("Ridderkerk", "NL", 51.8725, 4.6028, ()),
+    ("Zwijndrecht", "NL", 51.8150, 4.6333, ()),
+    ("Papendrecht", "NL", 51.8317, 4.6875, ()),
+    ("Gorinchem", "NL", 51.8306, 4.9742, ()),
+    ("Nieuwegein", "NL", 52.0292, 5.0806, ()),
+    ("Houten", "NL", 52.0283, 5.1681, ()),
+    ("Zeist", "NL", 52.0894, 5.2330, ()),
+    ("Bussum", "NL", 52.2733, 5.1611, ()),
+    ("Huizen", "NL", 52.2992, 5.2417, ()),
+    ("Baarn", "NL", 52.2117, 5.2875, ()),
+    ("Soest", "NL", 52.1733, 5.2917, ()),
+    ("Veenendaal", "NL", 52.0286, 5.5589, ()),
+    ("Ede", "NL", 52.0401, 5.6649, ()),
+    ("Wageningen", "NL", 51.9692, 5.6654, ()),
+    ("Barneveld", "NL", 52.1400, 5.5847, ()),
+    ("Nijkerk", "NL", 52.2200, 5.4861, ()),
+    ("Harderwijk", "NL", 52.3417, 5.6206, ()),
+    ("Culemborg", "NL", 51.9553, 5.2278, ()),
+    ("Tiel", "NL", 51.8869, 5.4290, ()),
+    ("Zaltbommel", "NL", 51.8100, 5.2494, ()),
+    ("Oss", "NL", 51.7650, 5.5181, ()),
+    ("Rosmalen", "NL", 51.7161, 5.3650, ()),
+    ("Vught", "NL", 51.6533, 5.2931, ()),
+    ("Boxtel", "NL", 51.5906, 5.3292, ()),
+    ("Oisterwijk", "NL", 51.5797, 5.1889, ()),
+    ("Waalwijk", "NL", 51.6825, 5.0703, ()),
+    ("Drunen", "NL", 51.6858, 5.1333, ()),
+    ("Uden", "NL", 51.6606, 5.6194, ()),
+    ("Veghel", "NL", 51.6167, 5.5486, ()),
+    ("Cuijk", "NL", 51.7283, 5.8792, ()),
+    ("Boxmeer", "NL", 51.6467, 5.9472, ()),
+    ("Helmond", "NL", 51.4817, 5.6611, ()),
+    ("Veldhoven", "NL", 51.4180, 5.4050, ()),
+    ("Geldrop", "NL", 51.4219, 5.5597, ()),
+    ("Nuenen", "NL", 51.4700, 5.5528, ()),
+    ("Valkenswaard", "NL", 51.3500, 5.4597, ()),
+    ("Oosterhout", "NL", 51.6450, 4.8597, ()),
+    ("Etten-Leur", "NL", 51.5706, 4.6356, ()),
+    ("Roosendaal", "NL", 51.5308, 4.4653, ()),
+    ("Bergen op Zoom", "NL", 51.4947, 4.2872, ()),
+    ("Moerdijk", "NL", 51.7017, 4.6264, ()),
+    ("Middelburg", "NL", 51.4988, 3.6136, ()),
+    ("Vlissingen", "NL", 51.4425, 3.5736, ("Flushing",)),
+    ("Terneuzen", "NL", 51.3358, 3.8278, ()),
+    ("Weert", "NL", 51.2517, 5.7069, ()),
+    ("Roermond", "NL", 51.1942, 5.9870, ()),
+    ("Venray", "NL", 51.5258, 5.9750, ()),
+    ("Sittard", "NL", 50.9983, 5.8692, ("Sittard-Geleen",)),
+    ("Geleen", "NL", 50.9742, 5.8292, ()),
+    ("Heerlen", "NL", 50.8882, 5.9795, ()),
+    ("Kerkrade", "NL", 50.8658, 6.0700, ()),
+    ("Deventer", "NL", 52.2550, 6.1639, ()),
+    ("Zutphen", "NL", 52.1383, 6.2014, ()),
+    ("Doetinchem", "NL", 51.9650, 6.2886, ()),
+    ("Winterswijk", "NL", 51.9725, 6.7194, ()),
+    ("Zevenaar", "NL", 51.9300, 6.0708, ()),
+    ("Duiven", "NL", 51.9467, 6.0139, ()),
+    ("Almelo", "NL", 52.3567, 6.6625, ()),
+    ("Oldenzaal", "NL", 52.3133, 6.9292, ()),
+    ("Rijssen", "NL", 52.3067, 6.5167, ()),
+    ("Nijverdal", "NL", 52.3600, 6.4625, ()),
+    ("Hardenberg", "NL", 52.5758, 6.6194, ()),
+    ("Kampen", "NL", 52.5550, 5.9114, ()),
+    ("Meppel", "NL", 52.6958, 6.1944, ()),
+    ("Hoogeveen", "NL", 52.7225, 6.4764, ()),
+    ("Emmen", "NL", 52.7792, 6.9069, ()),
+    ("Assen", "NL", 52.9925, 6.5625, ()),
+    ("Heerenveen", "NL", 52.9600, 5.9200, ()),
+    ("Drachten", "NL", 53.1050, 6.0989, ()),
+    ("Sneek", "NL", 53.0325, 5.6589, ()),
+    ("Harlingen", "NL", 53.1742, 5.4222, ()),
+    ("Delfzijl", "NL", 53.3300, 6.9181, ()),
+    ("Eemshaven", "NL", 53.4383, 6.8336, ()),
+    # Belgium
+    ("Brussels", "BE", 50.8503, 4.3517, ("Brussel", "Bruxelles")),
+    ("Antwerp", "BE", 51.2194, 4.4025, ("Antwerpen", "Anvers")),
+    ("Ghent", "BE", 51.0543, 3.7174, ("Gent", "Gand")),
+    ("Bruges", "BE", 51.2093, 3.2247, ("Brugge",)),
+    ("Leuven", "BE", 50.8798, 4.7005, ("Louvain",)),
+    ("Liège", "BE", 50.6326, 5.5797, ("Luik", "Lüttich")),
+    ("Namur", "BE", 50.4674, 4.8720, ("Namen",)),
+    ("Charleroi", "BE", 50.4108, 4.4446, ()),
+    ("Mons", "BE", 50.4542, 3.9567, ()),
+    ("Tournai", "BE", 50.6056, 3.3889, ("Doornik",)),
+    ("Mechelen", "BE", 51.0259, 4.4776, ("Malines",)),
+    ("Hasselt", "BE", 50.9307, 5.3325, ()),
+    ("Genk", "BE", 50.9650, 5.5008, ()),
+    ("Kortrijk", "BE", 50.8278, 3.2647, ("Courtrai",)),
+    ("Ostend", "BE", 51.2300, 2.9200, ("Oostende",)),
+    ("Roeselare", "BE", 50.9469, 3.1228, ()),
+    ("Aalst", "BE", 50.9378, 4.0403, ()),
+    ("Sint-Niklaas", "BE", 51.1650, 4.1431, ()),
+    ("Turnhout", "BE", 51.3225, 4.9447, ()),
+    ("Herentals", "BE", 51.1767, 4.8361, ()),
+    ("Lommel", "BE", 51.2300, 5.3128, ()),
+    ("Beringen", "BE", 51.0500, 5.2264, ()),
+    ("Diest", "BE", 50.9833, 5.0500, ()),
+    ("Tongeren", "BE", 50.7806, 5.4647, ()),
+    ("Maasmechelen", "BE", 50.9650, 5.6942, ()),
+    ("Zaventem", "BE", 50.8833, 4.4722, ()),
+    ("Vilvoorde", "BE", 50.9281, 4.4292, ()),
+    ("Wavre", "BE", 50.7167, 4.6000, ("Waver",)),
+    ("Louvain-la-Neuve", "BE", 50.6681, 4.6118, ("Ottignies",)),
+    ("Verviers", "BE", 50.5897, 5.8625, ()),
+    ("Eupen", "BE", 50.6275, 6.0364, ()),
+    ("Arlon", "BE", 49.6833, 5.8167, ()),
+    # Germany
+    ("Berlin", "DE", 52.5200, 13.4050, ()),
+    ("Hamburg", "DE", 53.5511, 9.9937, ()),
+    ("Munich", "DE", 48.1351, 11.5820, ("München", "Muenchen")),
+    ("Cologne", "DE", 50.9375, 6.9603, ("Köln", "Koeln", "Keulen")),
+    ("Frankfurt am Main", "DE", 50.1109, 8.6821, ("Frankfurt",)),
+    ("Stuttgart", "DE", 48.7758, 9.1829, ()),
+    ("Düsseldorf", "DE", 51.2277, 6.7735, ("Duesseldorf",)),
+    ("Dortmund", "DE", 51.5136, 7.4653, ()),
+    ("Essen", "DE", 51.4556, 7.0116, ()),
+    ("Duisburg", "DE", 51.4344, 6.7623, ()),
+    ("Bochum", "DE", 51.4818, 7.2162, ()),
+    ("Gelsenkirchen", "DE", 51.5177, 7.0857, ()),
+    ("Oberhausen", "DE", 51.4963, 6.8638, ()),
+    ("Mülheim an der Ruhr", "DE", 51.4275, 6.8825, ("Mülheim", "Muelheim")),
+    ("Wuppertal", "DE", 51.2562, 7.1508, ()),
+    ("Leverkusen", "DE", 51.0459, 7.0192, ()),
+    ("Bonn", "DE", 50.7374, 7.0982, ()),
+    ("Aachen", "DE", 50.7753, 6.0839, ("Aken",)),
+    ("Heinsberg", "DE", 51.0633, 6.0961, ()),
+    ("Mönchengladbach", "DE", 51.1805, 6.4428, ("Moenchengladbach",)),
+    ("Krefeld", "DE", 51.3388, 6.5853, ()),
+    ("Neuss", "DE", 51.2042, 6.6879, ()),
+    ("Kleve", "DE", 51.7883, 6.1386, ("Kleef",)),
+    ("Emmerich am Rhein", "DE", 51.8333, 6.2500, ("Emmerich",)),
+    ("Wesel", "DE", 51.6583, 6.6175, ()),
+    ("Bocholt", "DE", 51.8389, 6.6153, ()),
+    ("Borken", "DE", 51.8439, 6.8583, ()),
+    ("Gronau", "DE", 52.2125, 7.0417, ()),
+    ("Nordhorn", "DE", 52.4319, 7.0686, ()),
+    ("Lingen", "DE", 52.5233, 7.3172, ()),
+    ("Emden", "DE", 53.3667, 7.2061, ()),
+    ("Münster", "DE", 51.9607, 7.6261, ("Muenster",)),
+    ("Osnabrück", "DE", 52.2799, 8.0472, ("Osnabrueck",)),
+    ("Hamm", "DE", 51.6806, 7.8142, ()),
+    ("Soest", "DE", 51.5711, 8.1060, ()),
+    ("Paderborn", "DE", 51.7189, 8.7544, ()),
+    ("Bielefeld", "DE", 52.0302, 8.5325, ()),
+    ("Gütersloh", "DE", 51.9032, 8.3858, ("Guetersloh",)),
+    ("Siegen", "DE", 50.8748, 8.0243, ()),
+    ("Oldenburg", "DE", 53.1435, 8.2146, ()),
+    ("Bremen", "DE", 53.0793, 8.8017, ()),
+    ("Hanover", "DE", 52.3759, 9.7320, ("Hannover",)),
+    ("Braunschweig", "DE", 52.2689, 10.5268, ("Brunswick",)),
+    ("Wolfsburg", "DE", 52.4227, 10.7865, ()),
+    ("Kassel", "DE", 51.3127, 9.4797, ()),
+    ("Koblenz", "DE", 50.3569, 7.5890, ()),
+    ("Trier", "DE", 49.7499, 6.6371, ()),
+    ("Saarbrücken", "DE", 49.2402, 6.9969, ("Saarbruecken",)),
+    ("Mainz", "DE", 49.9929, 8.2473, ()),
+    ("Wiesbaden", "DE", 50.0782, 8.2398, ()),
+    ("Darmstadt", "DE", 49.8728, 8.6512, ()),
+    ("Mannheim", "DE", 49.4875, 8.4660, ()),
+    ("Heidelberg", "DE", 49.3988, 8.6724, ()),
+    ("Karlsruhe", "DE", 49.0069, 8.4037, ()),
+    ("Freiburg im Breisgau", "DE", 47.9990, 7.8421, ("Freiburg",)),
+    ("Ulm", "DE", 48.4011, 9.9876, ()),
+    ("Augsburg", "DE", 48.3705, 10.8978, ()),
+    ("Ingolstadt", "DE", 48.7665, 11.4258, ()),
+    ("Regensburg", "DE", 49.0134, 12.1016, ()),
+    ("Nuremberg", "DE", 49.4521, 11.0767, ("Nürnberg", "Nuernberg")),
+    ("Erfurt", "DE", 50.9848, 11.0299, ()),
+    ("Leipzig", "DE", 51.3397, 12.3731, ()),
+    ("Dresden", "DE", 51.0504, 13.7373, ()),
+    ("Magdeburg", "DE", 52.1205, 11.6276, ()),
+    ("Potsdam", "DE", 52.3906, 13.0645, ()),
+    ("Kiel", "DE", 54.3233, 10.1228, ()),
+    ("Lübeck", "DE", 53.8655, 10.6866, ("Luebeck",)),
+    ("Rostock", "DE", 54.0924, 12.0991, ()),
+    # Vietnam
+    ("Hanoi", "VN", 21.0285, 105.8542, ("Ha Noi",)),
+    ("Ho Chi Minh City", "VN", 10.8231, 106.6297, ("Ho Chi Minh", "HCMC", "Saigon", "Sai Gon", "TP HCM")),
+    ("Da Nang", "VN", 16.0544, 108.2022, ("Danang",)),
+    ("Hai Phong", "VN", 20.8449, 106.6881, ("Haiphong",)),
+    ("Can Tho", "VN", 10.0452, 105.7469, ()),
+    ("Nha Trang", "VN", 12.2388, 109.1967, ()),
+    ("Hue", "VN", 16.4637, 107.5909, ()),
+    ("Bien Hoa", "VN", 10.9574, 106.8429, ()),
+    ("Vung Tau", "VN", 10.3460, 107.0843, ()),
+    ("Thu Dau Mot", "VN", 10.9804, 106.6519, ("Binh Duong",)),
+    ("Bac Ninh", "VN", 21.1861, 106.0763, ()),
+    ("Hai Duong", "VN", 20.9373, 106.3146, ()),
+    ("Ha Long", "VN", 20.9517, 107.0800, ("Halong",)),
+    ("Thai Nguyen", "VN", 21.5942, 105.8482, ()),
+    ("Vinh", "VN", 18.6796, 105.6813, ()),
+    ("Quy Nhon", "VN", 13.7829, 109.2196, ()),
+    ("Da Lat", "VN", 11.9404, 108.4583, ("Dalat",)),
+)
+
+# Country names in a location string break ties between places sharing an alias.
+COUNTRY_HINTS = {
+    "netherlands": "NL",
+    "the netherlands": "NL",
+    "nederland": "NL",
+    "holland": "NL",
+    "belgium": "BE",
+    "belgie": "BE",
+    "belgique": "BE",
+    "belgien": "BE",
+    "germany": "DE",
+    "deutschland": "DE",
+    "duitsland": "DE",
+    "vietnam": "VN",
+    "viet nam": "VN",
+}
+
+RESOLVE_CACHE_MAX_ENTRIES = 4096
+_resolve_cache = OrderedDict()
+_resolve_cache_lock = threading.Lock()
+
+
+def normalize_place_text(value):
+    # Accents are folded so "Köln" and "Koln", "Hà Nội" and "Ha Noi" share a key.
+    text = unicodedata.normalize("NFKD", str(value or "").lower().replace("đ", "d"))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = re.sub(r"[^\w\s]+", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _build_alias_index(places):
+    index = {}
+    for place_index, (name, _, _, _, aliases) in enumerate(places):
+        for label in (name,) + tuple(aliases):
+            key = normalize_place_text(label)
+            entries = index.setdefault(key, [])
+            if place_index not in [entry[0] for entry in entries]:
+                entries.append((place_index, label))
+    return {key: tuple(entries) for key, entries in index.items()}
+
+
+_ALIAS_INDEX = _build_alias_index(PLACES)
+_MAX_ALIAS_TOKENS = max(len(key.split()) for key in list(_ALIAS_INDEX) + list(COUNTRY_HINTS))
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    radius_km = 6371.0
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(math.radians(lat1))
+        * math.cos(math.radians(lat2))
+        * math.sin(dlon / 2) ** 2
+    )
+    c = 2 * math.asin(math.sqrt(a))
+    return radius_km * c
+
+
+def distances_from(lat, lon):
+    """Return the distance in km (one decimal) from (lat, lon) to every place, by PLACES index."""
+    return tuple(
+        round(haversine_km(lat, lon, place_lat, place_lon), 1)
+        for _, _, place_lat, place_lon, _ in PLACES
+    )
+
+
+def _resolve_uncached(key):
+    tokens = key.split()
+    mentions = []
+    country_hints = set()
+    position = 0
+    while position < len(tokens):
+        # Longest alias first, so "Den Bosch" wins over a shorter overlapping key.
+        for size in range(min(_MAX_ALIAS_TOKENS, len(tokens) - position), 0, -1):
+            phrase = " ".join(tokens[position:position + size])
+            entries = _ALIAS_INDEX.get(phrase)
+            country = COUNTRY_HINTS.get(phrase)
+            if country:
+                country_hints.add(country)
+            if entries:
+                mentions.append(entries)
+                position += size
+                break
+        else:
+            position += 1
+    if not mentions:
+        return None
+    entries = mentions[0]
+    for place_index, label in entries:
+        if PLACES[place_index][1] in country_hints:
+            return place_index, label
+    return entries[0]
+
+
+def resolve_location(location_text):
+    """Return (place_index, label) for the first place named in location_text, or None.
+
+    Lookups walk the normalized tokens against the alias index; recent location
+    strings are memoized because the same few recur across every scrape.
+    """
+    key = normalize_place_text(location_text)
+    if not key:
+        return None
+    with _resolve_cache_lock:
+        if key in _resolve_cache:
+            _resolve_cache.move_to_end(key)
+            return _resolve_cache[key]
+    resolved = _resolve_uncached(key)
+    with _resolve_cache_lock:
+        _resolve_cache[key] = resolved
+        _resolve_cache.move_to_end(key)
+        while len(_resolve_cache) > RESOLVE_CACHE_MAX_ENTRIES:
+            _resolve_cache.popitem(last=False)
+    return resolved
@@ -1,18 +1,23 @@
 """Main Flask application for existence.app."""
 
 from flask import Flask, request, redirect, render_template, url_for, jsonify, session
-from collections import Counter
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, OrderedDict
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 import base64
+import bisect
 import html
 import hashlib
+import heapq
 import hmac
 import ipaddress
 import itertools
 import json
 import math
+import multiprocessing
 import os
+import queue
 import random
 import requests
 import secrets
@@ -30,6 +35,7 @@ from urllib.parse import parse_qsl, quote, unquote, urlencode, urlparse, urlunpa
 from parsel import Selector
 from werkzeug.security import generate_password_hash, check_password_hash
 import career_sleeves as c_sleeves
+import gazetteer
 import wage_calculator as wagecalc
 
 # Create an instance of the Flask class
@@ -59,6 +65,16 @@ JOBS_CACHE_EMPTY_TTL_SECONDS = 45
 MAX_STALE_CACHE_FALLBACK_SECONDS = 1800
 source_cache = {}
 source_health = {}
+SCORING_CACHE_MAX_ENTRIES = 5000
+SCORING_CACHE_MAX_BYTES = 16 * 1024 * 1024
+SCORING_PIPELINE_QUEUE_SIZE = 256
+scoring_cache = OrderedDict()
+scoring_cache_state = {"bytes": 0, "fingerprint": None}
+SCORING_PROCESS_MAX_POOLS = 2
+scoring_pools = OrderedDict()
+scoring_worker_state = {"ruleset": None}
+CUSTOM_SLEEVE_MATCHER_CACHE_MAX_ENTRIES = 256
+custom_sleeve_matcher_cache = OrderedDict()
 SOURCE_HEALTH_DEFAULT_BLOCK_THRESHOLD = 2
 SOURCE_HEALTH_DEFAULT_BLOCK_COOLDOWN_SECONDS = 3600
 SOURCE_HEALTH_DEFAULT_ERROR_COOLDOWN_SECONDS = 600
@@ -69,38 +85,8 @@ HOME_LON = 5.28914427
 HOME_LOCATION_LABEL = "Home"
 HOME_LOCATION_FULL_LABEL = "Copernicuslaan 105, 5223EC 's-Hertogenbosch"
 
-CITY_COORDS_NL = {
-    "'s-hertogenbosch": (51.6978, 5.3037),
-    "s hertogenbosch": (51.6978, 5.3037),
-    "s-hertogenbosch": (51.6978, 5.3037),
-    "den bosch": (51.6978, 5.3037),
-    "amsterdam": (52.3676, 4.9041),
-    "den haag": (52.0705, 4.3007),
-    "'s-gravenhage": (52.0705, 4.3007),
-    "s gravenhage": (52.0705, 4.3007),
-    "the hague": (52.0705, 4.3007),
-    "rotterdam": (51.9244, 4.4777),
-    "utrecht": (52.0907, 5.1214),
-    "eindhoven": (51.4416, 5.4697),
-    "tilburg": (51.5555, 5.0913),
-    "breda": (51.5719, 4.7683),
-    "arnhem": (51.9851, 5.8987),
-    "nijmegen": (51.8420, 5.8528),
-    "groningen": (53.2194, 6.5665),
-    "leiden": (52.1601, 4.4970),
-    "maastricht": (50.8514, 5.6900),
-    "haarlem": (52.3874, 4.6462),
-    "delft": (52.0116, 4.3571),
-    "almere": (52.3508, 5.2647),
-    "zwolle": (52.5168, 6.0830),
-    "amersfoort": (52.1561, 5.3878),
-    "dordrecht": (51.8133, 4.6901),
-    "apeldoorn": (52.2112, 5.9699),
-    "leeuwarden": (53.2012, 5.7999),
-    "venlo": (51.3704, 6.1724),
-    "hengelo": (52.2676, 6.7930),
-    "enschede": (52.2215, 6.8937),
-}
+# Distances from the anchor to every gazetteer place, computed once at import.
+HOME_PLACE_DISTANCES_KM = gazetteer.distances_from(HOME_LAT, HOME_LON)
 
 NETHERLANDS_KEYWORDS = [
     "netherlands", "nederland", "dutch", "holland",
@@ -304,6 +290,16 @@ QUERY_PERFORMANCE_STATE_PATH = STATE_DIR / "query_performance_state.json"
 SEEN_JOBS_STATE_PATH = STATE_DIR / "seen_jobs_state.json"
 CUSTOM_SLEEVES_STATE_PATH = STATE_DIR / "custom_sleeves_state.json"
 RUNTIME_CONFIG_PATH = Path(os.getenv("SCRAPE_RUNTIME_CONFIG", "scrape_runtime_config.json"))
+SCORING_RULESET_PATH = Path(
+    os.getenv("SCRAPE_SCORING_RULESET", str(RUNTIME_CONFIG_PATH.with_name("scoring_ruleset.json")))
+)
+SCORING_RULESET_POLL_SECONDS = float(os.getenv("SCRAPE_SCORING_RULESET_POLL_SECONDS", "5"))
+SCORING_PROCESS_WORKERS = int(os.getenv("SCRAPE_SCORING_PROCESSES", "0"))
+SCORING_PROCESS_MIN_BATCH = int(os.getenv("SCRAPE_SCORING_PROCESS_MIN_BATCH", "200"))
+NEAR_DUPLICATE_MIN_SIMILARITY = float(os.getenv("SCRAPE_NEAR_DUPLICATE_SIMILARITY", "0.8"))
+NEAR_DUPLICATE_BANDS = 8
+NEAR_DUPLICATE_BAND_ROWS = 4
+NEAR_DUPLICATE_SHINGLE_SIZE = 3
 DEFAULT_INCREMENTAL_WINDOW_DAYS = 14
 MAX_REASON_COUNT = 3
 FIXED_SYNERGY_SLEEVE_LETTERS = ("A", "B", "C", "D")
@@ -356,6 +352,9 @@ scrape_progress_state = {}
 scrape_progress_lock = threading.Lock()
 custom_sleeves_lock = threading.Lock()
 source_cache_lock = threading.Lock()
+scoring_cache_lock = threading.Lock()
+scoring_pool_lock = threading.Lock()
+custom_sleeve_matcher_lock = threading.Lock()
 source_health_lock = threading.Lock()
 auth_db_lock = threading.Lock()
 email_runtime_lock = threading.Lock()
@@ -1448,7 +1447,7 @@ def _next_available_custom_career_sleeve_letter(records, min_letter=CUSTOM_SYNER
 def _fixed_career_sleeves():
     records = []
     for letter in FIXED_SYNERGY_SLEEVE_LETTERS:
-        config = c_sleeves.CAREER_SLEEVE_CONFIG.get(letter, {})
+        config = c_sleeves.active_ruleset()["rules"]["CAREER_SLEEVE_CONFIG"].get(letter, {})
         records.append(
             {
                 "letter": letter,
@@ -1812,6 +1811,10 @@ def _load_runtime_config():
 
 
 RUNTIME_CONFIG = _load_runtime_config()
+if SCORING_RULESET_POLL_SECONDS > 0:
+    c_sleeves.start_ruleset_watcher(SCORING_RULESET_PATH, interval=SCORING_RULESET_POLL_SECONDS)
+else:
+    c_sleeves.reload_ruleset(SCORING_RULESET_PATH)
 
 
 def _log_event(event, **payload):
@@ -1922,10 +1925,34 @@ def _extract_job_id_from_url(url):
     return ""
 
 
-def _build_dedupe_key(item):
+def _job_identity(item, store=True):
+    """Return the identity record cached on the item, rebuilding it when its source fields change.
+
+    The record holds the dedupe key, canonical URL, job id and canonical company
+    URL, so fetch-time dedupe, ranking and unique counts share one computation
+    per parsed job. Pass store=False for response records, which must not carry
+    the private ``_identity`` key.
+    """
+    raw_url = item.get("link") or item.get("url")
+    company_url = _clean_value(item.get("company_url") or item.get("external_url"), "")
+    fields = (
+        item.get("title"),
+        item.get("company"),
+        raw_url,
+        item.get("job_id"),
+        item.get("location"),
+        item.get("date") or item.get("date_posted"),
+    )
+    identity = item.get("_identity")
+    if isinstance(identity, dict) and identity.get("fields") == fields:
+        if identity["company_url"] != company_url:
+            identity["company_url"] = company_url
+            identity["canonical_company_url"] = _canonicalize_url(company_url)
+        return identity
+
     title_key = c_sleeves.normalize_for_match(item.get("title"))
     company_key = c_sleeves.normalize_for_match(item.get("company"))
-    raw_url = _clean_value(item.get("link") or item.get("url"), "")
+    raw_url = _clean_value(raw_url, "")
     canonical_url = _canonicalize_url(raw_url)
     job_id = _clean_value(item.get("job_id"), "") or _extract_job_id_from_url(canonical_url or raw_url)
     anchor = job_id or canonical_url
@@ -1933,7 +1960,113 @@ def _build_dedupe_key(item):
         location_key = c_sleeves.normalize_for_match(item.get("location"))
         date_key = c_sleeves.normalize_for_match(item.get("date") or item.get("date_posted"))
         anchor = f"{location_key}|{date_key}"
-    return (title_key, company_key, anchor), canonical_url, job_id
+    identity = {
+        "fields": fields,
+        "dedupe_key": (title_key, company_key, anchor),
+        "raw_url": raw_url,
+        "canonical_url": canonical_url,
+        "job_id": job_id,
+        "company_url": company_url,
+        "canonical_company_url": _canonicalize_url(company_url),
+    }
+    if store:
+        item["_identity"] = identity
+    return identity
+
+
+def _identity_canonical_url(identity, url):
+    # Reuse the canonical forms already on the identity record before parsing again.
+    if url == identity["raw_url"]:
+        return identity["canonical_url"]
+    if url == identity["company_url"]:
+        return identity["canonical_company_url"]
+    return _canonicalize_url(url)
+
+
+def _build_dedupe_key(item):
+    identity = _job_identity(item)
+    return identity["dedupe_key"], identity["canonical_url"], identity["job_id"]
+
+
+# Each MinHash permutation XORs the 64-bit shingle hashes with a fixed mask.
+_MINHASH_RNG = random.Random(0x5EED)
+_MINHASH_MASKS = [_MINHASH_RNG.getrandbits(64) for _ in range(NEAR_DUPLICATE_BANDS * NEAR_DUPLICATE_BAND_ROWS)]
+
+
+def _near_duplicate_signature(title, company, snippet):
+    """Return (shingles, minhash) for the normalized title, company and snippet.
+
+    shingles is the set of word shingles and minhash holds one minimum per
+    mask in _MINHASH_MASKS.
+    """
+    tokens = c_sleeves.normalize_for_match(f"{title} {company} {snippet}").split()
+    size = min(NEAR_DUPLICATE_SHINGLE_SIZE, len(tokens))
+    if not size:
+        return frozenset(), ()
+    shingles = frozenset(" ".join(tokens[start:start + size]) for start in range(len(tokens) - size + 1))
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in shingles
+    ]
+    minhash = tuple(min(map(mask.__xor__, hashes)) for mask in _MINHASH_MASKS)
+    return shingles, minhash
+
+
+def _near_duplicate_index():
+    """Return (find, add) over an LSH index of MinHash signatures.
+
+    Signatures are bucketed per company and band of NEAR_DUPLICATE_BAND_ROWS
+    minima, so a lookup only compares entries sharing a band. A match must come
+    from a different source and reach NEAR_DUPLICATE_MIN_SIMILARITY Jaccard
+    similarity on its shingles. Signatures are only computed once a company has
+    been seen from a second source; until then entries wait unsigned.
+
+    find(company_key, source, texts) returns (row or None, signature) and
+    add(company_key, source, texts, row, signature) indexes the row.
+    """
+    buckets = {}
+    companies = {}
+    enabled = NEAR_DUPLICATE_MIN_SIMILARITY > 0
+
+    def _index(company_key, source, signature, row):
+        shingles, minhash = signature
+        if not minhash:
+            return
+        entry = (shingles, source, row)
+        for band in range(NEAR_DUPLICATE_BANDS):
+            rows = minhash[band * NEAR_DUPLICATE_BAND_ROWS:(band + 1) * NEAR_DUPLICATE_BAND_ROWS]
+            buckets.setdefault((company_key, band, rows), []).append(entry)
+
+    def find(company_key, source, texts):
+        company = companies.get(company_key)
+        if not enabled or not company_key or company is None or company["sources"] == {source}:
+            return None, None
+        for entry_source, entry_texts, entry_row in company["unsigned"]:
+            _index(company_key, entry_source, _near_duplicate_signature(*entry_texts), entry_row)
+        company["unsigned"] = []
+        signature = _near_duplicate_signature(*texts)
+        shingles, minhash = signature
+        for band in range(NEAR_DUPLICATE_BANDS):
+            rows = minhash[band * NEAR_DUPLICATE_BAND_ROWS:(band + 1) * NEAR_DUPLICATE_BAND_ROWS]
+            for entry_shingles, entry_source, entry_row in buckets.get((company_key, band, rows), ()):
+                if entry_source == source:
+                    continue
+                overlap = len(shingles & entry_shingles)
+                if overlap >= NEAR_DUPLICATE_MIN_SIMILARITY * (len(shingles) + len(entry_shingles) - overlap):
+                    return entry_row, signature
+        return None, signature
+
+    def add(company_key, source, texts, row, signature=None):
+        if not enabled or not company_key:
+            return
+        company = companies.setdefault(company_key, {"sources": set(), "unsigned": []})
+        company["sources"].add(source)
+        if signature is None:
+            company["unsigned"].append((source, texts, row))
+        else:
+            _index(company_key, source, signature, row)
+
+    return find, add
 
 
 def _count_unique_items(items):
@@ -2032,8 +2165,7 @@ def _prune_seen_jobs_state(state, window_days):
 
 
 def _seen_key_for_job(job):
-    dedupe_key, _, _ = _build_dedupe_key(job)
-    return "|".join(dedupe_key)
+    return "|".join(_job_identity(job, store=False)["dedupe_key"])
 
 
 def _apply_incremental_filter(jobs, window_days):
@@ -2188,56 +2320,22 @@ def _rate_limited_get(
     return None, last_exc or "request_failed"
 
 
-def _haversine_km(lat1, lon1, lat2, lon2):
-    radius_km = 6371.0
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(math.radians(lat1))
-        * math.cos(math.radians(lat2))
-        * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.asin(math.sqrt(a))
-    return radius_km * c
-
-
 def _estimate_distance_km(location_text):
-    text = _normalize_text(location_text)
-    for city, (lat, lon) in CITY_COORDS_NL.items():
-        if city in text:
-            return round(_haversine_km(HOME_LAT, HOME_LON, lat, lon), 1), city
-    return None, None
-
-
-def _display_city_label(city_key):
-    key = _clean_value(city_key, "").lower()
-    special = {
-        "'s-hertogenbosch": "'s-Hertogenbosch",
-        "s-hertogenbosch": "'s-Hertogenbosch",
-        "s hertogenbosch": "'s-Hertogenbosch",
-        "den bosch": "Den Bosch",
-        "'s-gravenhage": "'s-Gravenhage",
-        "s gravenhage": "'s-Gravenhage",
-        "the hague": "The Hague",
-        "den haag": "Den Haag",
-    }
-    if key in special:
-        return special[key]
-    if not key:
-        return ""
-    tokens = re.split(r"[\s\-]+", key)
-    return " ".join(token.capitalize() for token in tokens if token)
+    resolved = gazetteer.resolve_location(location_text)
+    if resolved is None:
+        return None, None, None
+    place_index, label = resolved
+    return HOME_PLACE_DISTANCES_KM[place_index], label, gazetteer.PLACES[place_index][1]
 
 
 def _score_location_proximity(location_text, raw_text="", work_mode="Unknown"):
     location_value = _clean_value(location_text, "")
-    distance_km, matched_city = _estimate_distance_km(location_value)
+    distance_km, matched_city, country_code = _estimate_distance_km(location_value)
     inferred_mode = _infer_work_mode(_normalize_text(location_value, raw_text, work_mode))
     mode = inferred_mode if inferred_mode != "Unknown" else _clean_value(work_mode, "Unknown")
     location_label = _clean_value(location_value, "Unknown")
     if matched_city:
-        location_label = _display_city_label(matched_city)
+        location_label = matched_city
 
     if distance_km is None:
         if mode in {"Remote", "Hybrid"} and _is_netherlands_job(location_value, raw_text):
@@ -2271,30 +2369,22 @@ def _score_location_proximity(location_text, raw_text="", work_mode="Unknown"):
         score = 0.8
         tier = "outside_focus"
 
-    if distance_km is not None and mode in {"Remote", "Hybrid"} and score < 2.2:
+    # The remote/hybrid floor only lifts far Dutch roles; resolved places abroad
+    # keep their distance tier, as they did before the gazetteer resolved them.
+    if distance_km is not None and country_code == "NL" and mode in {"Remote", "Hybrid"} and score < 2.2:
         score = 2.2
         tier = f"{tier}_remote_or_hybrid"
 
     return {
         "main_location": location_label,
         "distance_km": distance_km,
-        "matched_city": _display_city_label(matched_city),
+        "matched_city": matched_city or "",
         "score": round(float(score), 2),
         "tier": tier,
         "anchor": HOME_LOCATION_LABEL,
     }
 
 
-def _context_has_abroad_keywords(raw_text, start, end):
-    text = str(raw_text or "").lower()
-    left = max(0, start - 64)
-    right = min(len(text), end + 64)
-    context = c_sleeves.normalize_for_match(text[left:right])
-    if not context:
-        return False
-    return any(keyword in context for keyword in _expanded_abroad_percent_context_keywords())
-
-
 _ABROAD_PERCENT_CONTEXT_CACHE = None
 _ABROAD_CONTEXT_TERMS_CACHE = None
 _ABROAD_GEO_TERMS_CACHE = None
@@ -2333,82 +2423,162 @@ def _expanded_abroad_geo_terms():
     return _ABROAD_GEO_TERMS_CACHE
 
 
+# Ranges ("30-50%") and single values ("40 procent") in one pattern; group 2
+# is only set for ranges.
+_ABROAD_PERCENT_PATTERN = re.compile(
+    r"(\d{1,3})\s*(?:(?:-|to|tot)\s*(\d{1,3})\s*)?(?:%|percent|procent|percentage|pct)",
+    flags=re.IGNORECASE,
+)
+
+
 def _extract_abroad_percentage(raw_text):
     text = str(raw_text or "")
     if not text:
         return None, ""
     normalized_text = text.replace("\u2013", "-").replace("\u2014", "-")
+    lowered_text = normalized_text.lower()
 
-    candidates = []
-    range_spans = []
-    for match in re.finditer(
-        r"(\d{1,3})\s*(?:-|to|tot)\s*(\d{1,3})\s*(?:%|percent|procent|percentage|pct)",
-        normalized_text,
-        flags=re.IGNORECASE,
-    ):
-        start, end = match.span()
-        if not _context_has_abroad_keywords(normalized_text, start, end):
-            continue
-        first = int(match.group(1))
-        second = int(match.group(2))
-        low = max(0, min(100, min(first, second)))
-        high = max(0, min(100, max(first, second)))
-        candidates.append((high, f"{low}-{high}%"))
-        range_spans.append((start, end))
-
-    for match in re.finditer(
-        r"(\d{1,3})\s*(?:%|percent|procent|percentage|pct)",
-        normalized_text,
-        flags=re.IGNORECASE,
-    ):
+    matches = list(_ABROAD_PERCENT_PATTERN.finditer(normalized_text))
+    if not matches:
+        return None, ""
+    keyword_offsets = _abroad_keyword_offsets(lowered_text, [match.span() for match in matches])
+    range_candidates = []
+    single_candidates = []
+    for match in matches:
         start, end = match.span()
-        if any(start < span_end and end > span_start for span_start, span_end in range_spans):
-            continue
-        if not _context_has_abroad_keywords(normalized_text, start, end):
-            continue
-        value = max(0, min(100, int(match.group(1))))
-        candidates.append((value, f"{value}%"))
+        if match.group(2) is not None:
+            if _offsets_have_keyword(keyword_offsets, start, end, len(lowered_text)):
+                first = int(match.group(1))
+                second = int(match.group(2))
+                low = max(0, min(100, min(first, second)))
+                high = max(0, min(100, max(first, second)))
+                range_candidates.append((high, f"{low}-{high}%"))
+                continue
+            # A range without travel context still offers its upper bound as a single value.
+            start = match.start(2)
+            value = int(match.group(2))
+        else:
+            value = int(match.group(1))
+        if _offsets_have_keyword(keyword_offsets, start, end, len(lowered_text)):
+            value = max(0, min(100, value))
+            single_candidates.append((value, f"{value}%"))
 
+    candidates = range_candidates + single_candidates
     if not candidates:
         return None, ""
     candidates.sort(key=lambda item: item[0], reverse=True)
     return candidates[0][0], candidates[0][1]
 
 
-def _has_abroad_context(raw_text):
-    text = c_sleeves.normalize_for_match(raw_text)
-    if not text:
-        return False
-    return any(term in text for term in _expanded_abroad_context_terms())
+ABROAD_KEYWORD_WINDOW_CHARS = 64
+_ABROAD_TEXT_PATTERNS_CACHE = None
 
 
-def _alias_has_abroad_context(raw_text, alias):
-    text = c_sleeves.normalize_for_match(raw_text)
-    alias_text = c_sleeves.normalize_for_match(alias)
-    if not text or not alias_text:
-        return False
-    parts = [re.escape(part) for part in alias_text.split()]
-    if not parts:
-        return False
-    pattern = r"\b" + r"\s+".join(parts) + r"\b"
-    for match in re.finditer(pattern, text):
-        if _context_has_abroad_keywords(text, *match.span()):
+def _keyword_offsets_pattern(keywords):
+    # Matches normalized keywords in lowercased text: any run of non-word
+    # characters stands in for a space. A zero-width lookahead reports every
+    # start position, and trying keywords shortest first yields the tightest
+    # occurrence at each start.
+    ordered = sorted(set(keywords), key=lambda keyword: (len(keyword), keyword))
+    first_chars = "".join(sorted({keyword[0] for keyword in ordered}))
+    alternatives = "|".join(
+        r"\W+".join(re.escape(word) for word in keyword.split(" ")) for keyword in ordered
+    )
+    return re.compile(f"(?=[{re.escape(first_chars)}])(?=({alternatives}))")
+
+
+def _abroad_text_patterns():
+    """Compile the abroad context terms, percent context keywords and geo aliases once."""
+    global _ABROAD_TEXT_PATTERNS_CACHE
+    if _ABROAD_TEXT_PATTERNS_CACHE is None:
+        geo_terms = _expanded_abroad_geo_terms()
+        _ABROAD_TEXT_PATTERNS_CACHE = {
+            "context": re.compile(
+                "|".join(re.escape(term) for term in _expanded_abroad_context_terms())
+            ),
+            "percent_context": _keyword_offsets_pattern(_expanded_abroad_percent_context_keywords()),
+            "geo": c_sleeves.compile_tagged_phrase_matcher(
+                ((category, label), aliases)
+                for category in ("countries", "regions", "continents")
+                for label, aliases in geo_terms.get(category, [])
+            ),
+        }
+    return _ABROAD_TEXT_PATTERNS_CACHE
+
+
+def _abroad_keyword_offsets(text, spans):
+    """Return (starts, ends) of percent context keywords near spans of text, sorted by start.
+
+    Only the merged +/-64 character windows around the spans are scanned, once,
+    so each span's context check is a bisect over these offsets.
+    """
+    pattern = _abroad_text_patterns()["percent_context"]
+    starts = []
+    ends = []
+    region_left = region_right = -1
+    regions = []
+    for start, end in sorted(spans):
+        left = max(0, start - ABROAD_KEYWORD_WINDOW_CHARS)
+        right = min(len(text), end + ABROAD_KEYWORD_WINDOW_CHARS)
+        if left <= region_right:
+            region_right = max(region_right, right)
+            continue
+        if region_right >= 0:
+            regions.append((region_left, region_right))
+        region_left, region_right = left, right
+    if region_right >= 0:
+        regions.append((region_left, region_right))
+    for left, right in regions:
+        for match in pattern.finditer(text, left, right):
+            starts.append(match.start())
+            ends.append(match.end(1))
+    return starts, ends
+
+
+def _offsets_have_keyword(keyword_offsets, start, end, text_length):
+    # Same test as scanning the +/-64 character window for a keyword, done on
+    # the offsets found in a single pass over the text.
+    starts, ends = keyword_offsets
+    left = max(0, start - ABROAD_KEYWORD_WINDOW_CHARS)
+    right = min(text_length, end + ABROAD_KEYWORD_WINDOW_CHARS)
+    for index in range(bisect.bisect_left(starts, left), len(starts)):
+        if starts[index] >= right:
+            return False
+        if ends[index] <= right:
             return True
     return False
 
 
+def _has_abroad_context(raw_text):
+    if isinstance(raw_text, c_sleeves.PreparedText):
+        text = raw_text.normalized
+    else:
+        text = c_sleeves.normalize_for_match(raw_text)
+    if not text:
+        return False
+    return _abroad_text_patterns()["context"].search(text) is not None
+
+
 def _extract_abroad_geo_mentions(raw_text):
-    prepared_text = c_sleeves.prepare_text(raw_text)
-    has_context = _has_abroad_context(raw_text)
+    prepared_text = c_sleeves.build_prepared_text(raw_text)
     geo = {"countries": [], "regions": [], "continents": []}
+    hits = c_sleeves.match_tagged_phrases(prepared_text, _abroad_text_patterns()["geo"])
+    if not hits:
+        return geo, []
+    has_context = _has_abroad_context(prepared_text)
+    normalized = prepared_text.normalized
     for category in ("countries", "regions", "continents"):
         for label, aliases in _expanded_abroad_geo_terms().get(category, []):
-            hits = c_sleeves.find_hits(prepared_text, aliases)
-            if not hits:
-                continue
-            if label == "Netherlands":
+            if (category, label) not in hits or label == "Netherlands":
                 continue
-            contextual_hit = has_context or any(_alias_has_abroad_context(raw_text, alias) for alias in aliases)
+            contextual_hit = has_context
+            if not contextual_hit:
+                spans = [span for alias in aliases for span in c_sleeves.phrase_spans(prepared_text, alias)]
+                keyword_offsets = _abroad_keyword_offsets(normalized, spans)
+                contextual_hit = any(
+                    _offsets_have_keyword(keyword_offsets, start, end, len(normalized))
+                    for start, end in spans
+                )
             if contextual_hit and label not in geo[category]:
                 geo[category].append(label)
     locations = geo["countries"] + geo["regions"] + geo["continents"]
@@ -2498,9 +2668,10 @@ def _derive_abroad_identifiers(percentage, locations, raw_text, badges=None):
     return identifiers
 
 
-def _extract_abroad_metadata(raw_text):
+def _extract_abroad_metadata(raw_text, prepared_text=None):
+    prepared_text = c_sleeves.build_prepared_text(raw_text if prepared_text is None else prepared_text)
     percentage, percentage_text = _extract_abroad_percentage(raw_text)
-    geo, locations = _extract_abroad_geo_mentions(raw_text)
+    geo, locations = _extract_abroad_geo_mentions(prepared_text)
     return {
         "percentage": percentage,
         "percentage_text": percentage_text,
@@ -2508,7 +2679,7 @@ def _extract_abroad_metadata(raw_text):
         "regions": geo["regions"],
         "continents": geo["continents"],
         "locations": locations,
-        "identifiers": _derive_abroad_identifiers(percentage, locations, raw_text),
+        "identifiers": _derive_abroad_identifiers(percentage, locations, prepared_text),
     }
 
 
@@ -2797,6 +2968,14 @@ def _dedupe_queries(queries):
     return ordered
 
 
+# Expand the abroad term tables while the worker boots instead of on the first
+# /scrape; career_sleeves loads its own compiled tables from the ruleset artifact.
+_expanded_abroad_percent_context_keywords()
+_expanded_abroad_context_terms()
+_expanded_abroad_geo_terms()
+_abroad_text_patterns()
+
+
 def _search_query_bundle_for_career_sleeve(career_sleeve_key, search_queries=None, extra_queries=None):
     career_sleeve = (career_sleeve_key or "").upper()
     overrides = (RUNTIME_CONFIG.get("query_overrides") or {}).get(career_sleeve, [])
@@ -4796,6 +4975,516 @@ def _abroad_preferences_fit_profile(
     }
 
 
+def _scoring_ruleset_fingerprint(ruleset):
+    # The scoring ruleset can be hot-swapped, so only main's own rule digest is
+    # memoized; entries scored under an older ruleset simply stop matching.
+    # RUNTIME_CONFIG is deliberately left out: the cached detectors only read
+    # the job text, the career_sleeves ruleset and main's abroad term tables.
+    # Its threshold_overrides are applied by rank_and_filter_jobs after the
+    # cache lookup, and its other sections only steer fetching.
+    local_digest = scoring_cache_state.get("fingerprint")
+    if not local_digest:
+        local_rules = json.dumps(
+            [ABROAD_PERCENT_CONTEXT_KEYWORDS, ABROAD_CONTEXT_TERMS, ABROAD_GEO_TERMS],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        local_digest = hashlib.sha256(local_rules.encode("utf-8")).hexdigest()[:16]
+        scoring_cache_state["fingerprint"] = local_digest
+    return f"{c_sleeves.ruleset_fingerprint(ruleset)}:{local_digest}"
+
+
+def _scoring_cache_key(fingerprint, title_text, raw_text):
+    digest = hashlib.sha256()
+    for part in (fingerprint, title_text, raw_text):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _detect_job_text_signals(title_text, raw_text, ruleset, career_sleeve_result=None):
+    prepared = c_sleeves.build_prepared_text(raw_text)
+    prepared_title = c_sleeves.build_prepared_text(title_text)
+    language_flags, language_notes = c_sleeves.detect_language_flags(prepared, ruleset=ruleset)
+    career_sleeve_scores, career_sleeve_details = career_sleeve_result or c_sleeves.score_all_career_sleeves(
+        prepared,
+        prepared_title,
+        explain="none",
+        ruleset=ruleset,
+    )
+    abroad_components, abroad_badges, _ = c_sleeves.score_abroad_components(
+        prepared,
+        explain="none",
+        ruleset=ruleset,
+    )
+    abroad_meta = _extract_abroad_metadata(raw_text, prepared)
+    abroad_score, abroad_badges = _enhance_abroad_score(
+        float(abroad_components.get("abroad_score", 0.0)),
+        abroad_badges,
+        abroad_meta,
+        raw_text,
+    )
+    mobility_score, _ = _enhance_abroad_score(
+        float(abroad_components.get("mobility_score", 0.0)),
+        [],
+        abroad_meta,
+        raw_text,
+    )
+    synergy_score, synergy_hits = c_sleeves.score_synergy(prepared, ruleset=ruleset)
+    penalty_points, penalty_reasons = c_sleeves.evaluate_soft_penalties(prepared, ruleset=ruleset)
+    return {
+        "prepared_text": prepared.normalized,
+        "language_flags": language_flags,
+        "language_notes": language_notes,
+        "career_sleeve_scores": career_sleeve_scores,
+        "career_sleeve_details": career_sleeve_details,
+        "hard_reject_reason": c_sleeves.detect_hard_reject(
+            prepared_title,
+            prepared,
+            ruleset=ruleset,
+        ),
+        "abroad_components": abroad_components,
+        "abroad_meta": abroad_meta,
+        "abroad_score": abroad_score,
+        "abroad_badges": abroad_badges,
+        "mobility_score": mobility_score,
+        "abroad_identifiers": _derive_abroad_identifiers(
+            abroad_meta.get("percentage"),
+            abroad_meta.get("locations") or [],
+            raw_text,
+            badges=abroad_badges,
+        ),
+        "synergy_score": synergy_score,
+        "synergy_hits": synergy_hits,
+        "penalty_points": penalty_points,
+        "penalty_reasons": list(penalty_reasons or []),
+    }
+
+
+def _job_text_fields(job):
+    return tuple(
+        _clean_value(job.get(field), "")
+        for field in ("title", "company", "location", "snippet", "full_description")
+    )
+
+
+def _job_signal_texts(title, company, location, snippet, full_description):
+    raw_text = _clean_value(" ".join([title, company, location, snippet, full_description]), "")
+    return _normalize_text(title), raw_text
+
+
+def _encode_job_text_signals(title_text, raw_text, ruleset, career_sleeve_result=None):
+    # UTF-8 bytes, so SCORING_CACHE_MAX_BYTES counts bytes for non-ASCII postings too.
+    return json.dumps(
+        _detect_job_text_signals(title_text, raw_text, ruleset, career_sleeve_result),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _store_job_text_signals_payload(key, payload):
+    if len(payload) > SCORING_CACHE_MAX_BYTES:
+        return
+    with scoring_cache_lock:
+        previous = scoring_cache.pop(key, None)
+        if previous is not None:
+            scoring_cache_state["bytes"] -= len(previous)
+        scoring_cache[key] = payload
+        scoring_cache_state["bytes"] += len(payload)
+        while scoring_cache and (
+            len(scoring_cache) > SCORING_CACHE_MAX_ENTRIES
+            or scoring_cache_state["bytes"] > SCORING_CACHE_MAX_BYTES
+        ):
+            _, evicted = scoring_cache.popitem(last=False)
+            scoring_cache_state["bytes"] -= len(evicted)
+
+
+def _job_text_signals_payload(ruleset, fingerprint, title_text, raw_text):
+    # Text-only detector outputs keyed by content hash; payloads are stored as
+    # JSON so every hit hands out a fresh copy the caller may mutate.
+    key = _scoring_cache_key(fingerprint, title_text, raw_text)
+    with scoring_cache_lock:
+        payload = scoring_cache.get(key)
+        if payload is not None:
+            scoring_cache.move_to_end(key)
+    if payload is None:
+        payload = _encode_job_text_signals(title_text, raw_text, ruleset)
+        _store_job_text_signals_payload(key, payload)
+    return payload
+
+
+def _init_scoring_worker(ruleset):
+    scoring_worker_state["ruleset"] = ruleset
+
+
+def _score_job_text_chunk(chunk):
+    ruleset = scoring_worker_state["ruleset"]
+    sleeve_results = c_sleeves.score_career_sleeves_batch(
+        [(raw_text, title_text) for title_text, raw_text in chunk],
+        explain="none",
+        ruleset=ruleset,
+    )
+    return [
+        _encode_job_text_signals(title_text, raw_text, ruleset, sleeve_result)
+        for (title_text, raw_text), sleeve_result in zip(chunk, sleeve_results)
+    ]
+
+
+def _scoring_pool_context():
+    # Workers never fork from this multi-threaded process: a forked child can
+    # inherit a lock (logging, scoring cache) held by another thread and hang.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _scoring_process_pool(ruleset):
+    # One long-lived pool per ruleset fingerprint; workers receive the compiled
+    # ruleset once at start-up instead of with every chunk. Rankings that run
+    # on different rulesets during a hot swap each keep their own pool; the
+    # least recently used one is retired without cancelling, so rankings still
+    # mapping on it finish.
+    fingerprint = ruleset["fingerprint"]
+    retired = []
+    with scoring_pool_lock:
+        executor = scoring_pools.get(fingerprint)
+        if executor is not None:
+            scoring_pools.move_to_end(fingerprint)
+            return executor
+        executor = ProcessPoolExecutor(
+            max_workers=SCORING_PROCESS_WORKERS,
+            mp_context=_scoring_pool_context(),
+            initializer=_init_scoring_worker,
+            initargs=(ruleset,),
+        )
+        scoring_pools[fingerprint] = executor
+        while len(scoring_pools) > SCORING_PROCESS_MAX_POOLS:
+            retired.append(scoring_pools.popitem(last=False)[1])
+    for old_executor in retired:
+        old_executor.shutdown(wait=False)
+    return executor
+
+
+def _reset_scoring_process_pool(executor=None):
+    # Drops one failed pool, or every pool when none is given. A pool is only
+    # removed while it is still the one registered, so a fresh replacement
+    # another thread just created stays.
+    with scoring_pool_lock:
+        if executor is None:
+            retired = list(scoring_pools.values())
+            scoring_pools.clear()
+        else:
+            retired = [executor]
+            for fingerprint, current in list(scoring_pools.items()):
+                if current is executor:
+                    del scoring_pools[fingerprint]
+    for old_executor in retired:
+        old_executor.shutdown(wait=False)
+
+
+def _score_job_texts_in_pool(ruleset, fingerprint, job_texts):
+    """Fill the scoring cache for uncached (title_text, raw_text) pairs in worker processes.
+
+    Only runs when SCORING_PROCESS_WORKERS is set and the uncached batch reaches
+    SCORING_PROCESS_MIN_BATCH; returns how many payloads were stored. Any pool
+    failure leaves the remaining jobs to the in-process scorer.
+    """
+    if SCORING_PROCESS_WORKERS <= 0:
+        return 0
+    pending = {}
+    with scoring_cache_lock:
+        for title_text, raw_text in job_texts:
+            key = _scoring_cache_key(fingerprint, title_text, raw_text)
+            if key not in scoring_cache and key not in pending:
+                pending[key] = (title_text, raw_text)
+    if len(pending) < max(1, SCORING_PROCESS_MIN_BATCH):
+        return 0
+    keys = list(pending)[:SCORING_CACHE_MAX_ENTRIES]
+    chunk_size = max(1, math.ceil(len(keys) / (SCORING_PROCESS_WORKERS * 4)))
+    chunks = [
+        [pending[key] for key in keys[start:start + chunk_size]]
+        for start in range(0, len(keys), chunk_size)
+    ]
+    executor = None
+    try:
+        executor = _scoring_process_pool(ruleset)
+        payloads = itertools.chain.from_iterable(executor.map(_score_job_text_chunk, chunks))
+        stored = 0
+        for key, payload in zip(keys, payloads):
+            _store_job_text_signals_payload(key, payload)
+            stored += 1
+        return stored
+    except (BrokenProcessPool, CancelledError, OSError, RuntimeError) as exc:
+        _log_event("scoring_pool_failed", error=str(exc), batch=len(keys))
+        if executor is not None:
+            _reset_scoring_process_pool(executor)
+        return 0
+
+
+def _cached_job_text_signals(ruleset, fingerprint, title_text, raw_text):
+    return json.loads(_job_text_signals_payload(ruleset, fingerprint, title_text, raw_text))
+
+
+def _start_scoring_pipeline(run_id=""):
+    """Score fetched items in a background worker while other sources still fetch.
+
+    The worker fills the content-addressed text-signal cache, so the final
+    rank_and_filter_jobs call finds detection done for every item it saw and
+    only assembles, thresholds and sorts. Items arrive per source rather than
+    per page: the source fetchers build their job lists internally and expose
+    no per-page hook, so with parallel_fetch the overlap is between scoring
+    finished sources and fetching the rest. Returns (submit, close); close()
+    drains the queue and returns the worker counters.
+    """
+    ruleset = c_sleeves.active_ruleset()
+    fingerprint = _scoring_ruleset_fingerprint(ruleset)
+    pending = queue.Queue(maxsize=SCORING_PIPELINE_QUEUE_SIZE)
+    stats = {"submitted": 0, "scored": 0, "duplicates": 0, "errors": 0}
+    seen = set()
+    finished = object()
+
+    def _worker():
+        while True:
+            job = pending.get()
+            if job is finished:
+                return
+            try:
+                dedupe_key, _, _ = _build_dedupe_key(job)
+                if dedupe_key in seen:
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(dedupe_key)
+                title_text, raw_text = _job_signal_texts(*_job_text_fields(job))
+                _job_text_signals_payload(ruleset, fingerprint, title_text, raw_text)
+                stats["scored"] += 1
+            except Exception as exc:
+                # The ranker scores anything the pipeline missed.
+                stats["errors"] += 1
+                _log_event(
+                    "scoring_pipeline_failed",
+                    run_id=run_id,
+                    error=f"{type(exc).__name__}: {exc}",
+                    title=_clean_value(job.get("title"), "") if isinstance(job, dict) else "",
+                )
+
+    worker = threading.Thread(target=_worker, name=f"scoring-pipeline-{run_id}", daemon=True)
+    worker.start()
+
+    def submit(items):
+        for job in items or []:
+            stats["submitted"] += 1
+            pending.put(job)
+
+    def close():
+        pending.put(finished)
+        worker.join()
+        return dict(stats)
+
+    return submit, close
+
+
+def _resolve_job_urls(job, source, identity):
+    """Return (link, company_url, indeed_url, linkedin_url) for a parsed job."""
+    canonical_url = identity["canonical_url"]
+    link = _clean_value(job.get("link") or job.get("url"), "")
+    if not _is_absolute_http_url(link) and canonical_url:
+        link = canonical_url
+    if not _is_absolute_http_url(link):
+        link = ""
+    source_text = source.lower()
+    link_host = _host_for_url(link)
+    company_url = _clean_value(job.get("company_url") or job.get("external_url"), "")
+    if not _is_absolute_http_url(company_url) or _is_platform_job_host(company_url):
+        company_url = ""
+
+    indeed_url = _clean_value(job.get("indeed_url"), "")
+    if not _is_absolute_http_url(indeed_url):
+        if "indeed" in source_text and _is_absolute_http_url(link) and "indeed." in link_host:
+            indeed_url = link
+        else:
+            indeed_url = ""
+
+    linkedin_url = _clean_value(job.get("linkedin_url"), "")
+    if not _is_absolute_http_url(linkedin_url):
+        if "linkedin" in source_text and _is_absolute_http_url(link):
+            if "linkedin.com" in link_host or link_host.endswith("lnkd.in"):
+                linkedin_url = link
+            else:
+                linkedin_url = ""
+        else:
+            linkedin_url = ""
+
+    if not _is_absolute_http_url(link):
+        if _is_absolute_http_url(indeed_url):
+            link = indeed_url
+        elif _is_absolute_http_url(linkedin_url):
+            link = linkedin_url
+
+    if not company_url:
+        external_candidates = [
+            _clean_value(job.get("external_url"), ""),
+            _extract_external_destination_from_url(indeed_url),
+            _extract_external_destination_from_url(linkedin_url),
+            _extract_external_destination_from_url(link),
+        ]
+        for candidate in external_candidates:
+            if _is_absolute_http_url(candidate) and not _is_platform_job_host(candidate):
+                company_url = candidate
+                break
+
+    if (
+        not company_url
+        and _is_absolute_http_url(link)
+        and not _is_platform_job_host(link)
+        and "indeed" not in source_text
+        and "linkedin" not in source_text
+    ):
+        company_url = link
+
+    if company_url:
+        canonical_company = _identity_canonical_url(identity, company_url) or company_url
+        if indeed_url:
+            canonical_indeed = _identity_canonical_url(identity, indeed_url) or indeed_url
+            if canonical_company == canonical_indeed:
+                company_url = ""
+        if company_url and linkedin_url:
+            canonical_linkedin = _identity_canonical_url(identity, linkedin_url) or linkedin_url
+            if canonical_company == canonical_linkedin:
+                company_url = ""
+        if company_url and _is_platform_job_host(company_url):
+            company_url = ""
+    return link, company_url, indeed_url, linkedin_url
+
+
+RANK_COLUMNS = (
+    "career_sleeve",
+    "visa_score",
+    "mobility_score",
+    "remote_flex_score",
+    "primary_career_sleeve_score",
+    "synergy_score",
+    "location_proximity_score",
+    "penalty_points",
+    "location_gate_match",
+    "total_positive_hits",
+)
+
+
+def _rank_keys(columns, ruleset):
+    # The numeric ranking stage runs over columns rather than per-job dicts:
+    # weights are resolved once per career sleeve and each row's sort key is
+    # the same (rank_score, weighted_score, components...) tuple as before.
+    weights_by_sleeve = {}
+    keys = []
+    for (
+        career_sleeve,
+        visa_score,
+        mobility_score,
+        remote_flex_score,
+        primary_score,
+        synergy_score,
+        location_proximity_score,
+        penalty_points,
+        location_gate_match,
+    ) in zip(*(columns[name] for name in RANK_COLUMNS[:-1])):
+        weights = weights_by_sleeve.get(career_sleeve)
+        if weights is None:
+            weights = c_sleeves.ranking_weights_for_career_sleeve(career_sleeve, ruleset=ruleset)
+            weights = weights_by_sleeve[career_sleeve] = (
+                weights.get("visa_score", 0.30),
+                weights.get("mobility_score", 0.16),
+                weights.get("remote_flex_score", 0.06),
+                weights.get("primary_career_sleeve_score", 0.38),
+                weights.get("synergy_score", 0.05),
+                weights.get("location_proximity_score", 0.05),
+            )
+        weighted_score = (
+            (visa_score * weights[0])
+            + (mobility_score * weights[1])
+            + (remote_flex_score * weights[2])
+            + (primary_score * weights[3])
+            + (synergy_score * weights[4])
+            + (location_proximity_score * weights[5])
+        )
+        rank_score = (weighted_score * 20) - penalty_points - (0 if location_gate_match else 4)
+        keys.append(
+            (
+                round(rank_score, 4),
+                weighted_score,
+                primary_score,
+                visa_score,
+                mobility_score,
+                remote_flex_score,
+                location_proximity_score,
+                synergy_score,
+            )
+        )
+    return keys
+
+
+def _compile_custom_sleeve_matcher(normalized_queries, location_preferences):
+    geo_queries = _dedupe_queries(
+        [
+            c_sleeves.normalize_for_match(term)
+            for term in (
+                list(location_preferences.get("countries") or [])
+                + list(location_preferences.get("regions") or [])
+            )
+            if term
+        ]
+    )
+    abroad_min_percent = int(location_preferences.get("abroad_min_percent", 0) or 0)
+    abroad_max_percent = int(location_preferences.get("abroad_max_percent", 100) or 100)
+    return {
+        "queries": tuple(normalized_queries),
+        "query_matcher": c_sleeves.compile_tagged_phrase_matcher(
+            [(term, _bilingual_query_variants(term) or [term]) for term in normalized_queries]
+        ),
+        "geo_queries": tuple(geo_queries),
+        "geo_matcher": c_sleeves.compile_phrase_matcher(
+            _expand_terms_with_bilingual_variants(geo_queries) if geo_queries else []
+        ),
+        "abroad_min_percent": abroad_min_percent,
+        "abroad_max_percent": abroad_max_percent,
+        "abroad_range_active": abroad_min_percent > 0 or abroad_max_percent < 100,
+    }
+
+
+def _custom_sleeve_matcher(owner_key, letter, search_queries, location_preferences):
+    # Compiled query and geo matchers for one custom sleeve, keyed by owner,
+    # letter and the normalized queries and preferences. Entries are immutable
+    # and shared across scrapes; save_synergy_sleeve warms them.
+    normalized_queries = _dedupe_queries(
+        [c_sleeves.normalize_for_match(term) for term in (search_queries or []) if term]
+    )
+    key = (
+        _clean_value(owner_key, ""),
+        _normalize_career_sleeve_letter(letter) or "",
+        tuple(normalized_queries),
+        json.dumps(location_preferences, sort_keys=True),
+    )
+    with custom_sleeve_matcher_lock:
+        matcher = custom_sleeve_matcher_cache.get(key)
+        if matcher is not None:
+            custom_sleeve_matcher_cache.move_to_end(key)
+            return matcher
+    matcher = _compile_custom_sleeve_matcher(normalized_queries, location_preferences)
+    with custom_sleeve_matcher_lock:
+        custom_sleeve_matcher_cache[key] = matcher
+        custom_sleeve_matcher_cache.move_to_end(key)
+        while len(custom_sleeve_matcher_cache) > CUSTOM_SLEEVE_MATCHER_CACHE_MAX_ENTRIES:
+            custom_sleeve_matcher_cache.popitem(last=False)
+    return matcher
+
+
+def _evict_custom_sleeve_matchers(owner_key, letter):
+    owner_key = _clean_value(owner_key, "")
+    letter = _normalize_career_sleeve_letter(letter) or ""
+    with custom_sleeve_matcher_lock:
+        for key in [key for key in custom_sleeve_matcher_cache if key[:2] == (owner_key, letter)]:
+            del custom_sleeve_matcher_cache[key]
+
+
 def rank_and_filter_jobs(
     items,
     target_career_sleeve=None,
@@ -4808,152 +5497,320 @@ def rank_and_filter_jobs(
     custom_mode=False,
     custom_search_queries=None,
     custom_location_preferences=None,
+    custom_owner_key=None,
+    custom_letter=None,
+    max_results=None,
 ):
     diagnostics = diagnostics or _new_diagnostics()
+    # Capture the ruleset once so a hot reload mid-ranking cannot mix plans.
+    ruleset = c_sleeves.active_ruleset()
+    scoring_rules = ruleset["rules"]
+    scoring_fingerprint = _scoring_ruleset_fingerprint(ruleset)
+    diagnostics["ruleset_version"] = ruleset["version"]
     normalized_custom_queries = []
-    custom_term_variant_map = {}
     normalized_custom_location_preferences = _default_custom_location_preferences()
     normalized_custom_geo_queries = []
     custom_abroad_min_percent = 0
     custom_abroad_max_percent = 100
     custom_abroad_range_active = False
+    custom_matcher = None
     if custom_mode:
-        normalized_custom_queries = _dedupe_queries(
-            [
-                c_sleeves.normalize_for_match(term)
-                for term in (custom_search_queries or [])
-                if term
-            ]
-        )
-        custom_term_variant_map = {
-            term: _bilingual_query_variants(term)
-            for term in normalized_custom_queries
-        }
         normalized_custom_location_preferences = _parse_custom_location_preferences(
             custom_location_preferences
         )
-        normalized_custom_geo_queries = _dedupe_queries(
-            [
-                c_sleeves.normalize_for_match(term)
-                for term in (
-                    list(normalized_custom_location_preferences.get("countries") or [])
-                    + list(normalized_custom_location_preferences.get("regions") or [])
-                )
-                if term
-            ]
+        custom_matcher = _custom_sleeve_matcher(
+            custom_owner_key,
+            custom_letter,
+            custom_search_queries,
+            normalized_custom_location_preferences,
         )
-        custom_abroad_min_percent = int(
-            normalized_custom_location_preferences.get("abroad_min_percent", 0) or 0
+        normalized_custom_queries = list(custom_matcher["queries"])
+        normalized_custom_geo_queries = list(custom_matcher["geo_queries"])
+        custom_abroad_min_percent = custom_matcher["abroad_min_percent"]
+        custom_abroad_max_percent = custom_matcher["abroad_max_percent"]
+        custom_abroad_range_active = custom_matcher["abroad_range_active"]
+
+    def _materialize_ranked_job(row):
+        # Output records (URLs, reasons, confidence bands) are only built for
+        # rows that make the result; ranking and decisions never need them.
+        job = row["job"]
+        source = row["source"]
+        identity = row["identity"]
+        job_id = identity["job_id"]
+        title = row["title"]
+        company = row["company"]
+        location = row["location"]
+        snippet = row["snippet"]
+        full_description = row["full_description"]
+        raw_text = row["raw_text"]
+        signals = row["signals"]
+        work_mode = row["work_mode"]
+        language_flags = row["language_flags"]
+        language_notes = row["language_notes"]
+        career_sleeve_scores = row["career_sleeve_scores"]
+        scoring_career_sleeve = row["scoring_career_sleeve"]
+        primary_score = row["primary_score"]
+        total_positive_hits = row["total_positive_hits"]
+        missing_domain_anchors = row["missing_domain_anchors"]
+        custom_title_hits = row["custom_title_hits"]
+        custom_text_hits = row["custom_text_hits"]
+        custom_coverage_ratio = row["custom_coverage_ratio"]
+        custom_geo_matches = row["custom_geo_matches"]
+        custom_abroad_percent = row["custom_abroad_percent"]
+        custom_abroad_percent_in_range = row["custom_abroad_percent_in_range"]
+        hard_reject_reason = row["hard_reject_reason"]
+        remote_flex_score = row["remote_flex_score"]
+        visa_score = row["visa_score"]
+        abroad_meta = row["abroad_meta"]
+        abroad_score = row["abroad_score"]
+        abroad_badges = row["abroad_badges"]
+        mobility_score = row["mobility_score"]
+        abroad_identifiers = row["abroad_identifiers"]
+        location_profile = row["location_profile"]
+        location_proximity_score = row["location_proximity_score"]
+        penalty_reasons = row["penalty_reasons"]
+        location_gate_match = row["location_gate_match"]
+        link, company_url, indeed_url, linkedin_url = _resolve_job_urls(job, source, identity)
+        for duplicate in row["near_duplicates"]:
+            # Cross-source copies of this vacancy contribute the URLs it lacks.
+            duplicate_urls = _resolve_job_urls(
+                duplicate["job"],
+                duplicate["source"],
+                duplicate["identity"],
+            )
+            link, company_url, indeed_url, linkedin_url = tuple(
+                current or merged
+                for current, merged in zip((link, company_url, indeed_url, linkedin_url), duplicate_urls)
+            )
+        date_posted = _clean_value(job.get("date") or job.get("date_posted"), "Unknown")
+        salary = _clean_value(job.get("salary"), "Not listed")
+
+        career_sleeve_fit_confidence = _career_sleeve_fit_confidence(
+            primary_score=primary_score,
+            career_sleeve_scores=career_sleeve_scores,
+            total_positive_hits=total_positive_hits,
+            full_description=full_description,
+            raw_text=raw_text,
+            custom_mode=bool(custom_mode),
+            custom_coverage_ratio=custom_coverage_ratio,
+            custom_title_hits_count=len(custom_title_hits),
         )
-        custom_abroad_max_percent = int(
-            normalized_custom_location_preferences.get("abroad_max_percent", 100) or 100
+        career_sleeve_fit_score = round(float(primary_score or 0), 2)
+        career_sleeve_fit_confidence = round(float(career_sleeve_fit_confidence), 4)
+        career_sleeve_fit_confidence_pct = int(round(career_sleeve_fit_confidence * 100))
+        career_sleeve_fit_confidence_band = _confidence_band(career_sleeve_fit_confidence)
+        abroad_preferences_profile = _abroad_preferences_fit_profile(
+            custom_mode=bool(custom_mode),
+            normalized_custom_geo_queries=normalized_custom_geo_queries,
+            custom_geo_matches=custom_geo_matches,
+            custom_abroad_range_active=custom_abroad_range_active,
+            custom_abroad_min_percent=custom_abroad_min_percent,
+            custom_abroad_max_percent=custom_abroad_max_percent,
+            custom_abroad_percent=custom_abroad_percent,
+            abroad_score=abroad_score,
+            abroad_identifiers=abroad_identifiers,
+            abroad_meta=abroad_meta,
         )
-        custom_abroad_range_active = (
-            custom_abroad_min_percent > 0 or custom_abroad_max_percent < 100
+        primary_career_sleeve_config = scoring_rules["CAREER_SLEEVE_CONFIG"][scoring_career_sleeve]
+        distance_km = location_profile.get("distance_km")
+        if distance_km is None:
+            proximity_reason = (
+                f"Main location {location_profile.get('main_location', 'Unknown')} "
+                f"(distance to {location_profile.get('anchor', HOME_LOCATION_LABEL)} unknown; "
+                f"proximity {location_proximity_score}/4)"
+            )
+        else:
+            proximity_reason = (
+                f"Main location {location_profile.get('main_location', 'Unknown')} "
+                f"({distance_km} km to {location_profile.get('anchor', HOME_LOCATION_LABEL)}; "
+                f"proximity {location_proximity_score}/4)"
+            )
+        travel_share_text = abroad_meta.get("percentage_text") or "n/a"
+        geo_scope_text = ", ".join((abroad_meta.get("locations") or [])[:4]) or "none"
+        abroad_identifier_text = ", ".join(abroad_identifiers) or "no explicit signal"
+        abroad_summary = (
+            f"Abroad score {abroad_score}/4 via {abroad_identifier_text} "
+            f"(visa: {visa_score}/4; mobility: {mobility_score}/4; remote flexibility: {remote_flex_score}/4; "
+            f"travel share: {travel_share_text}; geo: {geo_scope_text})"
         )
-    scored_jobs = []
+        reasons = [
+            (
+                f"Career Sleeve {scoring_career_sleeve} fit {primary_score}/5 "
+                f"(A:{career_sleeve_scores['A']} B:{career_sleeve_scores['B']} "
+                f"C:{career_sleeve_scores['C']} D:{career_sleeve_scores['D']} E:{career_sleeve_scores['E']})"
+            ),
+            proximity_reason,
+            abroad_summary,
+            f"Keyword coverage {total_positive_hits} hits for Career Sleeve {scoring_career_sleeve}",
+        ]
+        if custom_mode:
+            coverage_pct = int(round(custom_coverage_ratio * 100))
+            reasons[0] = (
+                f"Custom Career Sleeve relevance {primary_score}/5 "
+                f"(matched {total_positive_hits} of {len(normalized_custom_queries)} custom queries; "
+                f"coverage {coverage_pct}%)"
+            )
+            custom_pref_parts = []
+            if normalized_custom_geo_queries:
+                custom_pref_parts.append(
+                    f"geo matches {len(custom_geo_matches)}/{len(normalized_custom_geo_queries)}"
+                )
+            if custom_abroad_range_active:
+                if custom_abroad_percent is None:
+                    custom_pref_parts.append(
+                        f"abroad % n/a (requested {custom_abroad_min_percent}-{custom_abroad_max_percent}%)"
+                    )
+                elif custom_abroad_percent_in_range:
+                    custom_pref_parts.append(
+                        f"abroad % {custom_abroad_percent}% within {custom_abroad_min_percent}-{custom_abroad_max_percent}%"
+                    )
+                else:
+                    custom_pref_parts.append(
+                        f"abroad % {custom_abroad_percent}% outside {custom_abroad_min_percent}-{custom_abroad_max_percent}%"
+                    )
+            if custom_pref_parts:
+                reasons.append(f"Custom location preferences: {'; '.join(custom_pref_parts)}")
+            if custom_title_hits:
+                reasons.append(
+                    f"Custom title hits: {', '.join(custom_title_hits[:4])}"
+                )
+            elif custom_text_hits:
+                reasons.append(
+                    f"Custom text hits: {', '.join(custom_text_hits[:4])}"
+                )
+        if language_notes:
+            reasons.append(language_notes[0])
+        if penalty_reasons:
+            reasons.append(penalty_reasons[0])
+        if missing_domain_anchors:
+            reasons.append("Domain anchors missing for this Career Sleeve; likely low relevance.")
+        if not location_gate_match:
+            reasons.append("Location outside preferred scope; ranked as lower priority.")
+        reasons = reasons[:MAX_REASON_COUNT]
+
+        return {
+            "title": title or "Unknown role",
+            "company": company or "Unknown company",
+            "location": location or "Unknown",
+            "url": link,
+            "source": source,
+            "date_posted": date_posted,
+            "work_mode": work_mode,
+            "snippet": snippet,
+            "full_description": full_description,
+            "company_url": company_url,
+            "indeed_url": indeed_url,
+            "linkedin_url": linkedin_url,
+            "raw_text": raw_text,
+            "prepared_text": signals["prepared_text"],
+            "primary_career_sleeve_id": scoring_career_sleeve,
+            "primary_career_sleeve_name": primary_career_sleeve_config.get("name", ""),
+            "primary_career_sleeve_tagline": primary_career_sleeve_config.get("tagline", ""),
+            "career_sleeve_id": scoring_career_sleeve,
+            "career_sleeve_name": primary_career_sleeve_config.get("name", ""),
+            "career_sleeve_tagline": primary_career_sleeve_config.get("tagline", ""),
+            "career_sleeve_scores": career_sleeve_scores,
+            "primary_career_sleeve_score": primary_score,
+            "career_sleeve_fit_score": career_sleeve_fit_score,
+            "career_sleeve_fit_confidence": career_sleeve_fit_confidence,
+            "career_sleeve_fit_confidence_pct": career_sleeve_fit_confidence_pct,
+            "career_sleeve_fit_confidence_band": career_sleeve_fit_confidence_band,
+            "abroad_score": abroad_score,
+            "remote_flex_score": remote_flex_score,
+            "mobility_score": mobility_score,
+            "visa_score": visa_score,
+            "abroad_badges": abroad_badges,
+            "abroad_identifiers": abroad_identifiers,
+            "abroad_summary": abroad_summary,
+            "abroad_preferences_fit_score": abroad_preferences_profile.get("fit_score", 0),
+            "abroad_preferences_fit_confidence": abroad_preferences_profile.get("fit_confidence", 0),
+            "abroad_preferences_fit_confidence_pct": abroad_preferences_profile.get(
+                "fit_confidence_pct",
+                0,
+            ),
+            "abroad_preferences_fit_confidence_band": abroad_preferences_profile.get(
+                "fit_confidence_band",
+                "low",
+            ),
+            "abroad_preferences_fit_mode": abroad_preferences_profile.get("mode", "general_signal"),
+            "abroad_preferences_geo_match_ratio": abroad_preferences_profile.get("geo_match_ratio", 0),
+            "abroad_preferences_geo_match_count": abroad_preferences_profile.get("geo_match_count", 0),
+            "abroad_preferences_geo_pref_count": abroad_preferences_profile.get("geo_pref_count", 0),
+            "abroad_preferences_range_fit": abroad_preferences_profile.get("range_fit", 0),
+            "abroad_percentage": abroad_meta["percentage"],
+            "abroad_percentage_text": abroad_meta["percentage_text"],
+            "abroad_countries": abroad_meta["countries"],
+            "abroad_regions": abroad_meta["regions"],
+            "abroad_continents": abroad_meta["continents"],
+            "abroad_locations": abroad_meta["locations"],
+            "main_location": location_profile.get("main_location", location or "Unknown"),
+            "distance_from_home_km": location_profile.get("distance_km"),
+            "distance_anchor": location_profile.get("anchor", HOME_LOCATION_LABEL),
+            "distance_anchor_full": HOME_LOCATION_FULL_LABEL,
+            "distance_match_city": location_profile.get("matched_city"),
+            "proximity_score": location_proximity_score,
+            "proximity_tier": location_profile.get("tier"),
+            "decision": "FAIL",
+            "reasons": reasons,
+            "hard_reject_reason": hard_reject_reason or None,
+            "language_flags": language_flags,
+            "language_notes": language_notes,
+            "query": _clean_value(job.get("query"), ""),
+            "query_location": _clean_value(job.get("query_location"), ""),
+            "detail_fetch_failed": bool(job.get("detail_fetch_failed", False)),
+            "canonical_url_or_job_id": job_id or link,
+            "link": link,
+            "date": date_posted,
+            "salary": salary,
+            "primary_career_sleeve": scoring_career_sleeve,
+            "why_relevant": reasons,
+            "custom_location_preferences": (
+                normalized_custom_location_preferences if custom_mode else _default_custom_location_preferences()
+            ),
+            "custom_geo_matches": custom_geo_matches,
+            "custom_abroad_percent_in_range": custom_abroad_percent_in_range,
+        }
+
+    if SCORING_PROCESS_WORKERS > 0 and len(items) >= SCORING_PROCESS_MIN_BATCH:
+        _score_job_texts_in_pool(
+            ruleset,
+            scoring_fingerprint,
+            [_job_signal_texts(*_job_text_fields(job)) for job in items],
+        )
+    candidates = []
+    rank_columns = {name: [] for name in RANK_COLUMNS}
     dedupe_seen = set()
+    find_near_duplicate, add_near_duplicate = _near_duplicate_index()
+    near_duplicate_count = 0
     raw_by_source = Counter()
     kept_by_source = Counter()
 
     for job in items:
         source = _clean_value(job.get("source"), "unknown")
         raw_by_source[source] += 1
-        dedupe_key, canonical_url, job_id = _build_dedupe_key(job)
+        identity = _job_identity(job)
+        dedupe_key = identity["dedupe_key"]
         if dedupe_key in dedupe_seen:
             continue
         dedupe_seen.add(dedupe_key)
-        kept_by_source[source] += 1
-
-        title = _clean_value(job.get("title"), "")
-        company = _clean_value(job.get("company"), "")
-        location = _clean_value(job.get("location"), "")
-        snippet = _clean_value(job.get("snippet"), "")
-        full_description = _clean_value(job.get("full_description"), "")
-        link = _clean_value(job.get("link") or job.get("url"), "")
-        if not _is_absolute_http_url(link) and canonical_url:
-            link = canonical_url
-        if not _is_absolute_http_url(link):
-            link = ""
-        date_posted = _clean_value(job.get("date") or job.get("date_posted"), "Unknown")
-        salary = _clean_value(job.get("salary"), "Not listed")
-        source_text = source.lower()
-        link_host = _host_for_url(link)
-        company_url = _clean_value(job.get("company_url") or job.get("external_url"), "")
-        if not _is_absolute_http_url(company_url) or _is_platform_job_host(company_url):
-            company_url = ""
-
-        indeed_url = _clean_value(job.get("indeed_url"), "")
-        if not _is_absolute_http_url(indeed_url):
-            if "indeed" in source_text and _is_absolute_http_url(link) and "indeed." in link_host:
-                indeed_url = link
-            else:
-                indeed_url = ""
-
-        linkedin_url = _clean_value(job.get("linkedin_url"), "")
-        if not _is_absolute_http_url(linkedin_url):
-            if "linkedin" in source_text and _is_absolute_http_url(link):
-                if "linkedin.com" in link_host or link_host.endswith("lnkd.in"):
-                    linkedin_url = link
-                else:
-                    linkedin_url = ""
-            else:
-                linkedin_url = ""
-
-        if not _is_absolute_http_url(link):
-            if _is_absolute_http_url(indeed_url):
-                link = indeed_url
-            elif _is_absolute_http_url(linkedin_url):
-                link = linkedin_url
-
-        if not company_url:
-            external_candidates = [
-                _clean_value(job.get("external_url"), ""),
-                _extract_external_destination_from_url(indeed_url),
-                _extract_external_destination_from_url(linkedin_url),
-                _extract_external_destination_from_url(link),
-            ]
-            for candidate in external_candidates:
-                if _is_absolute_http_url(candidate) and not _is_platform_job_host(candidate):
-                    company_url = candidate
-                    break
-
-        if (
-            not company_url
-            and _is_absolute_http_url(link)
-            and not _is_platform_job_host(link)
-            and "indeed" not in source_text
-            and "linkedin" not in source_text
-        ):
-            company_url = link
-
-        if company_url:
-            canonical_company = _canonicalize_url(company_url) or company_url
-            if indeed_url:
-                canonical_indeed = _canonicalize_url(indeed_url) or indeed_url
-                if canonical_company == canonical_indeed:
-                    company_url = ""
-            if company_url and linkedin_url:
-                canonical_linkedin = _canonicalize_url(linkedin_url) or linkedin_url
-                if canonical_company == canonical_linkedin:
-                    company_url = ""
-            if company_url and _is_platform_job_host(company_url):
-                company_url = ""
 
-        raw_text = _clean_value(
-            " ".join(
-                [
-                    title,
-                    company,
-                    location,
-                    snippet,
-                    full_description,
-                ]
-            ),
-            "",
-        )
-        prepared_text = c_sleeves.prepare_text(raw_text)
-        title_text = _normalize_text(title)
+        title, company, location, snippet, full_description = _job_text_fields(job)
+        # The same vacancy on another board is merged into the first copy
+        # before it is scored a second time.
+        company_key = dedupe_key[1]
+        survivor, signature = find_near_duplicate(company_key, source, (title, company, snippet))
+        if survivor is not None:
+            survivor["near_duplicates"].append({"job": job, "source": source, "identity": identity})
+            near_duplicate_count += 1
+            continue
+        kept_by_source[source] += 1
+        title_text, raw_text = _job_signal_texts(title, company, location, snippet, full_description)
+        signals = _cached_job_text_signals(ruleset, scoring_fingerprint, title_text, raw_text)
+        prepared = None
+        prepared_title = None
+        if custom_mode and normalized_custom_queries:
+            prepared = c_sleeves.build_prepared_text(raw_text)
+            prepared_title = c_sleeves.build_prepared_text(title_text)
         work_mode = _infer_work_mode(
             _normalize_text(
                 location,
@@ -4963,8 +5820,10 @@ def rank_and_filter_jobs(
             )
         )
 
-        language_flags, language_notes = c_sleeves.detect_language_flags(raw_text)
-        career_sleeve_scores, career_sleeve_details = c_sleeves.score_all_career_sleeves(raw_text, title_text)
+        language_flags = signals["language_flags"]
+        language_notes = signals["language_notes"]
+        career_sleeve_scores = signals["career_sleeve_scores"]
+        career_sleeve_details = signals["career_sleeve_details"]
         primary_career_sleeve, natural_primary_score = max(
             career_sleeve_scores.items(),
             key=lambda pair: pair[1],
@@ -4984,30 +5843,20 @@ def rank_and_filter_jobs(
         custom_title_hits = []
         custom_text_hits = []
         custom_coverage_ratio = 0.0
-        custom_missing_queries = []
         custom_geo_matches = []
         custom_pref_bonus = 0
         custom_abroad_percent = None
         custom_abroad_percent_in_range = None
         if custom_mode and normalized_custom_queries:
-            prepared_title = c_sleeves.prepare_text(title_text)
-            found_queries = set()
-            for term in normalized_custom_queries:
-                query_variants = custom_term_variant_map.get(term) or [term]
-                text_variant_hits = c_sleeves.find_hits(prepared_text, query_variants)
-                title_variant_hits = c_sleeves.find_hits(prepared_title, query_variants)
-                if text_variant_hits:
-                    custom_text_hits.append(term)
-                    found_queries.add(term)
-                if title_variant_hits:
-                    custom_title_hits.append(term)
-                    found_queries.add(term)
-            custom_text_hits = sorted(set(custom_text_hits))
-            custom_title_hits = sorted(set(custom_title_hits))
-            custom_hit_count = len(found_queries)
-            custom_missing_queries = sorted(
-                [term for term in normalized_custom_queries if term not in found_queries]
+            text_query_hits = c_sleeves.match_tagged_phrases(prepared, custom_matcher["query_matcher"])
+            title_query_hits = c_sleeves.match_tagged_phrases(
+                prepared_title,
+                custom_matcher["query_matcher"],
             )
+            custom_text_hits = sorted(text_query_hits)
+            custom_title_hits = sorted(title_query_hits)
+            found_queries = set(text_query_hits) | set(title_query_hits)
+            custom_hit_count = len(found_queries)
             custom_coverage_ratio = (
                 custom_hit_count / len(normalized_custom_queries)
                 if normalized_custom_queries
@@ -5023,21 +5872,18 @@ def rank_and_filter_jobs(
             primary_score = custom_score
             total_positive_hits = custom_hit_count
 
-        hard_reject_reason = c_sleeves.detect_hard_reject(title, raw_text)
-        abroad_components, abroad_badges, _ = c_sleeves.score_abroad_components(raw_text)
+        hard_reject_reason = signals["hard_reject_reason"]
+        abroad_components = signals["abroad_components"]
         remote_flex_score = float(abroad_components.get("remote_flex_score", 0.0))
-        mobility_score = float(abroad_components.get("mobility_score", 0.0))
         visa_score = float(abroad_components.get("visa_score", 0.0))
-        abroad_base_score = float(abroad_components.get("abroad_score", 0.0))
-        abroad_meta = _extract_abroad_metadata(raw_text)
+        abroad_meta = signals["abroad_meta"]
         custom_abroad_percent = abroad_meta.get("percentage")
         if custom_mode and normalized_custom_queries:
             if normalized_custom_geo_queries:
-                geo_candidates = _expand_terms_with_bilingual_variants(normalized_custom_geo_queries)
                 custom_geo_matches = sorted(
                     {
                         c_sleeves.normalize_for_match(hit)
-                        for hit in c_sleeves.find_hits(prepared_text, geo_candidates)
+                        for hit in c_sleeves.match_phrases(prepared, custom_matcher["geo_matcher"])
                         if c_sleeves.normalize_for_match(hit)
                     }
                 )
@@ -5054,55 +5900,15 @@ def rank_and_filter_jobs(
                     custom_abroad_percent_in_range = False
             if custom_pref_bonus:
                 primary_score = min(5, float(primary_score) + custom_pref_bonus)
-        abroad_score, abroad_badges = _enhance_abroad_score(
-            abroad_base_score,
-            abroad_badges,
-            abroad_meta,
-            raw_text,
-        )
-        mobility_score, _ = _enhance_abroad_score(
-            mobility_score,
-            [],
-            abroad_meta,
-            raw_text,
-        )
-        abroad_identifiers = _derive_abroad_identifiers(
-            abroad_meta.get("percentage"),
-            abroad_meta.get("locations") or [],
-            raw_text,
-            badges=abroad_badges,
-        )
-        career_sleeve_fit_confidence = _career_sleeve_fit_confidence(
-            primary_score=primary_score,
-            career_sleeve_scores=career_sleeve_scores,
-            total_positive_hits=total_positive_hits,
-            full_description=full_description,
-            raw_text=raw_text,
-            custom_mode=bool(custom_mode),
-            custom_coverage_ratio=custom_coverage_ratio,
-            custom_title_hits_count=len(custom_title_hits),
-        )
-        career_sleeve_fit_score = round(float(primary_score or 0), 2)
-        career_sleeve_fit_confidence = round(float(career_sleeve_fit_confidence), 4)
-        career_sleeve_fit_confidence_pct = int(round(career_sleeve_fit_confidence * 100))
-        career_sleeve_fit_confidence_band = _confidence_band(career_sleeve_fit_confidence)
-        abroad_preferences_profile = _abroad_preferences_fit_profile(
-            custom_mode=bool(custom_mode),
-            normalized_custom_geo_queries=normalized_custom_geo_queries,
-            custom_geo_matches=custom_geo_matches,
-            custom_abroad_range_active=custom_abroad_range_active,
-            custom_abroad_min_percent=custom_abroad_min_percent,
-            custom_abroad_max_percent=custom_abroad_max_percent,
-            custom_abroad_percent=custom_abroad_percent,
-            abroad_score=abroad_score,
-            abroad_identifiers=abroad_identifiers,
-            abroad_meta=abroad_meta,
-        )
+        abroad_score = signals["abroad_score"]
+        abroad_badges = signals["abroad_badges"]
+        mobility_score = signals["mobility_score"]
+        abroad_identifiers = signals["abroad_identifiers"]
         location_profile = _score_location_proximity(location, raw_text, work_mode)
         location_proximity_score = float(location_profile.get("score", 0))
-        synergy_score, synergy_hits = c_sleeves.score_synergy(raw_text)
-        penalty_points, penalty_reasons = c_sleeves.evaluate_soft_penalties(raw_text)
-        penalty_reasons = list(penalty_reasons or [])
+        synergy_score = signals["synergy_score"]
+        penalty_points = signals["penalty_points"]
+        penalty_reasons = signals["penalty_reasons"]
         required_languages = {
             c_sleeves.normalize_for_match(lang)
             for lang in (language_flags.get("extra_languages") or [])
@@ -5113,15 +5919,6 @@ def rank_and_filter_jobs(
                 "Vietnamese language required; lower priority for visa-friendly international profile."
             )
 
-        weights = c_sleeves.ranking_weights_for_career_sleeve(scoring_career_sleeve)
-        weighted_score = (
-            (visa_score * weights.get("visa_score", 0.30))
-            + (mobility_score * weights.get("mobility_score", 0.16))
-            + (remote_flex_score * weights.get("remote_flex_score", 0.06))
-            + (primary_score * weights.get("primary_career_sleeve_score", 0.38))
-            + (synergy_score * weights.get("synergy_score", 0.05))
-            + (location_proximity_score * weights.get("location_proximity_score", 0.05))
-        )
         location_gate_text = _build_location_gate_text(
             location,
             job.get("query_location"),
@@ -5129,216 +5926,62 @@ def rank_and_filter_jobs(
             raw_text,
         )
         location_gate_match = _passes_location_gate(location_gate_text, location_mode)
-        location_penalty = 0 if location_gate_match else 4
-        rank_score = (weighted_score * 20) - penalty_points - location_penalty
-
-        primary_career_sleeve_config = c_sleeves.CAREER_SLEEVE_CONFIG[scoring_career_sleeve]
-        distance_km = location_profile.get("distance_km")
-        if distance_km is None:
-            proximity_reason = (
-                f"Main location {location_profile.get('main_location', 'Unknown')} "
-                f"(distance to {location_profile.get('anchor', HOME_LOCATION_LABEL)} unknown; "
-                f"proximity {location_proximity_score}/4)"
-            )
-        else:
-            proximity_reason = (
-                f"Main location {location_profile.get('main_location', 'Unknown')} "
-                f"({distance_km} km to {location_profile.get('anchor', HOME_LOCATION_LABEL)}; "
-                f"proximity {location_proximity_score}/4)"
-            )
-        travel_share_text = abroad_meta.get("percentage_text") or "n/a"
-        geo_scope_text = ", ".join((abroad_meta.get("locations") or [])[:4]) or "none"
-        abroad_identifier_text = ", ".join(abroad_identifiers) or "no explicit signal"
-        abroad_summary = (
-            f"Abroad score {abroad_score}/4 via {abroad_identifier_text} "
-            f"(visa: {visa_score}/4; mobility: {mobility_score}/4; remote flexibility: {remote_flex_score}/4; "
-            f"travel share: {travel_share_text}; geo: {geo_scope_text})"
-        )
-        reasons = [
-            (
-                f"Career Sleeve {scoring_career_sleeve} fit {primary_score}/5 "
-                f"(A:{career_sleeve_scores['A']} B:{career_sleeve_scores['B']} "
-                f"C:{career_sleeve_scores['C']} D:{career_sleeve_scores['D']} E:{career_sleeve_scores['E']})"
-            ),
-            proximity_reason,
-            abroad_summary,
-            f"Keyword coverage {total_positive_hits} hits for Career Sleeve {scoring_career_sleeve}",
-        ]
-        if custom_mode:
-            coverage_pct = int(round(custom_coverage_ratio * 100))
-            reasons[0] = (
-                f"Custom Career Sleeve relevance {primary_score}/5 "
-                f"(matched {total_positive_hits} of {len(normalized_custom_queries)} custom queries; "
-                f"coverage {coverage_pct}%)"
-            )
-            custom_pref_parts = []
-            if normalized_custom_geo_queries:
-                custom_pref_parts.append(
-                    f"geo matches {len(custom_geo_matches)}/{len(normalized_custom_geo_queries)}"
-                )
-            if custom_abroad_range_active:
-                if custom_abroad_percent is None:
-                    custom_pref_parts.append(
-                        f"abroad % n/a (requested {custom_abroad_min_percent}-{custom_abroad_max_percent}%)"
-                    )
-                elif custom_abroad_percent_in_range:
-                    custom_pref_parts.append(
-                        f"abroad % {custom_abroad_percent}% within {custom_abroad_min_percent}-{custom_abroad_max_percent}%"
-                    )
-                else:
-                    custom_pref_parts.append(
-                        f"abroad % {custom_abroad_percent}% outside {custom_abroad_min_percent}-{custom_abroad_max_percent}%"
-                    )
-            if custom_pref_parts:
-                reasons.append(f"Custom location preferences: {'; '.join(custom_pref_parts)}")
-            if custom_title_hits:
-                reasons.append(
-                    f"Custom title hits: {', '.join(custom_title_hits[:4])}"
-                )
-            elif custom_text_hits:
-                reasons.append(
-                    f"Custom text hits: {', '.join(custom_text_hits[:4])}"
-                )
-        if language_notes:
-            reasons.append(language_notes[0])
-        if penalty_reasons:
-            reasons.append(penalty_reasons[0])
-        if missing_domain_anchors:
-            reasons.append("Domain anchors missing for this Career Sleeve; likely low relevance.")
-        if not location_gate_match:
-            reasons.append("Location outside preferred scope; ranked as lower priority.")
-        reasons = reasons[:MAX_REASON_COUNT]
-
-        scored_jobs.append(
+        rank_columns["career_sleeve"].append(scoring_career_sleeve)
+        rank_columns["visa_score"].append(visa_score)
+        rank_columns["mobility_score"].append(mobility_score)
+        rank_columns["remote_flex_score"].append(remote_flex_score)
+        rank_columns["primary_career_sleeve_score"].append(primary_score)
+        rank_columns["synergy_score"].append(synergy_score)
+        rank_columns["location_proximity_score"].append(location_proximity_score)
+        rank_columns["penalty_points"].append(penalty_points)
+        rank_columns["location_gate_match"].append(location_gate_match)
+        rank_columns["total_positive_hits"].append(total_positive_hits)
+
+        candidates.append(
             {
-                "title": title or "Unknown role",
-                "company": company or "Unknown company",
-                "location": location or "Unknown",
-                "url": link,
+                "job": job,
                 "source": source,
-                "date_posted": date_posted,
-                "work_mode": work_mode,
+                "identity": identity,
+                "title": title,
+                "company": company,
+                "location": location,
                 "snippet": snippet,
                 "full_description": full_description,
-                "company_url": company_url,
-                "indeed_url": indeed_url,
-                "linkedin_url": linkedin_url,
                 "raw_text": raw_text,
-                "prepared_text": prepared_text.strip(),
-                "primary_career_sleeve_id": scoring_career_sleeve,
-                "primary_career_sleeve_name": primary_career_sleeve_config.get("name", ""),
-                "primary_career_sleeve_tagline": primary_career_sleeve_config.get("tagline", ""),
-                "career_sleeve_id": scoring_career_sleeve,
-                "career_sleeve_name": primary_career_sleeve_config.get("name", ""),
-                "career_sleeve_tagline": primary_career_sleeve_config.get("tagline", ""),
-                "career_sleeve_scores": career_sleeve_scores,
-                "primary_career_sleeve_score": primary_score,
-                "career_sleeve_fit_score": career_sleeve_fit_score,
-                "career_sleeve_fit_confidence": career_sleeve_fit_confidence,
-                "career_sleeve_fit_confidence_pct": career_sleeve_fit_confidence_pct,
-                "career_sleeve_fit_confidence_band": career_sleeve_fit_confidence_band,
-                "abroad_score": abroad_score,
-                "remote_flex_score": remote_flex_score,
-                "mobility_score": mobility_score,
-                "visa_score": visa_score,
-                "abroad_badges": abroad_badges,
-                "abroad_identifiers": abroad_identifiers,
-                "abroad_summary": abroad_summary,
-                "abroad_preferences_fit_score": abroad_preferences_profile.get("fit_score", 0),
-                "abroad_preferences_fit_confidence": abroad_preferences_profile.get("fit_confidence", 0),
-                "abroad_preferences_fit_confidence_pct": abroad_preferences_profile.get(
-                    "fit_confidence_pct",
-                    0,
-                ),
-                "abroad_preferences_fit_confidence_band": abroad_preferences_profile.get(
-                    "fit_confidence_band",
-                    "low",
-                ),
-                "abroad_preferences_fit_mode": abroad_preferences_profile.get("mode", "general_signal"),
-                "abroad_preferences_geo_match_ratio": abroad_preferences_profile.get("geo_match_ratio", 0),
-                "abroad_preferences_geo_match_count": abroad_preferences_profile.get("geo_match_count", 0),
-                "abroad_preferences_geo_pref_count": abroad_preferences_profile.get("geo_pref_count", 0),
-                "abroad_preferences_range_fit": abroad_preferences_profile.get("range_fit", 0),
-                "abroad_percentage": abroad_meta["percentage"],
-                "abroad_percentage_text": abroad_meta["percentage_text"],
-                "abroad_countries": abroad_meta["countries"],
-                "abroad_regions": abroad_meta["regions"],
-                "abroad_continents": abroad_meta["continents"],
-                "abroad_locations": abroad_meta["locations"],
-                "main_location": location_profile.get("main_location", location or "Unknown"),
-                "distance_from_home_km": location_profile.get("distance_km"),
-                "distance_anchor": location_profile.get("anchor", HOME_LOCATION_LABEL),
-                "distance_anchor_full": HOME_LOCATION_FULL_LABEL,
-                "distance_match_city": location_profile.get("matched_city"),
-                "proximity_score": location_proximity_score,
-                "proximity_tier": location_profile.get("tier"),
-                "decision": "FAIL",
-                "reasons": reasons,
-                "hard_reject_reason": hard_reject_reason or None,
+                "signals": signals,
+                "work_mode": work_mode,
                 "language_flags": language_flags,
                 "language_notes": language_notes,
-                "query": _clean_value(job.get("query"), ""),
-                "query_location": _clean_value(job.get("query_location"), ""),
-                "detail_fetch_failed": bool(job.get("detail_fetch_failed", False)),
-                "canonical_url_or_job_id": job_id or link,
-                "link": link,
-                "date": date_posted,
-                "salary": salary,
-                "primary_career_sleeve": scoring_career_sleeve,
-                "why_relevant": reasons,
-                "custom_location_preferences": (
-                    normalized_custom_location_preferences if custom_mode else _default_custom_location_preferences()
+                "career_sleeve_scores": career_sleeve_scores,
+                "strict_target_mismatch": bool(
+                    strict_career_sleeve and target_career_sleeve and primary_career_sleeve != target_career_sleeve
                 ),
+                "scoring_career_sleeve": scoring_career_sleeve,
+                "primary_score": primary_score,
+                "total_positive_hits": total_positive_hits,
+                "missing_domain_anchors": missing_domain_anchors,
+                "custom_title_hits": custom_title_hits,
+                "custom_text_hits": custom_text_hits,
+                "custom_coverage_ratio": custom_coverage_ratio,
                 "custom_geo_matches": custom_geo_matches,
+                "custom_abroad_percent": custom_abroad_percent,
                 "custom_abroad_percent_in_range": custom_abroad_percent_in_range,
-                "_base_reasons": list(reasons),
-                "_score_components": {
-                    "synergy_score": synergy_score,
-                    "penalty_points": penalty_points,
-                    "total_positive_hits": total_positive_hits,
-                    "location_gate_match": location_gate_match,
-                    "location_proximity_score": location_proximity_score,
-                    "abroad_score": abroad_score,
-                    "remote_flex_score": remote_flex_score,
-                    "mobility_score": mobility_score,
-                    "visa_score": visa_score,
-                    "custom_mode": bool(custom_mode),
-                    "custom_query_count": len(normalized_custom_queries),
-                    "custom_text_hits": custom_text_hits,
-                    "custom_title_hits": custom_title_hits,
-                    "custom_missing_queries": custom_missing_queries,
-                    "custom_coverage_ratio": round(custom_coverage_ratio, 4),
-                    "custom_geo_queries": normalized_custom_geo_queries,
-                    "custom_geo_matches": custom_geo_matches,
-                    "custom_pref_bonus": custom_pref_bonus,
-                    "custom_abroad_range_active": custom_abroad_range_active,
-                    "custom_abroad_min_percent": custom_abroad_min_percent,
-                    "custom_abroad_max_percent": custom_abroad_max_percent,
-                    "custom_abroad_percent": custom_abroad_percent,
-                    "custom_abroad_percent_in_range": custom_abroad_percent_in_range,
-                    "career_sleeve_fit_score": career_sleeve_fit_score,
-                    "career_sleeve_fit_confidence": career_sleeve_fit_confidence,
-                    "career_sleeve_fit_confidence_pct": career_sleeve_fit_confidence_pct,
-                    "career_sleeve_fit_confidence_band": career_sleeve_fit_confidence_band,
-                    "abroad_preferences_fit_profile": abroad_preferences_profile,
-                    "strict_target_mismatch": bool(
-                        strict_career_sleeve and target_career_sleeve and primary_career_sleeve != target_career_sleeve
-                    ),
-                    "missing_domain_anchors": bool(missing_domain_anchors),
-                },
-                "_fail_reason": "",
-                "_rank": (
-                    round(rank_score, 4),
-                    weighted_score,
-                    primary_score,
-                    visa_score,
-                    mobility_score,
-                    remote_flex_score,
-                    location_proximity_score,
-                    synergy_score,
-                ),
+                "hard_reject_reason": hard_reject_reason,
+                "remote_flex_score": remote_flex_score,
+                "visa_score": visa_score,
+                "abroad_meta": abroad_meta,
+                "abroad_score": abroad_score,
+                "abroad_badges": abroad_badges,
+                "mobility_score": mobility_score,
+                "abroad_identifiers": abroad_identifiers,
+                "location_profile": location_profile,
+                "location_proximity_score": location_proximity_score,
+                "penalty_reasons": penalty_reasons,
+                "location_gate_match": location_gate_match,
+                "near_duplicates": [],
             }
         )
+        add_near_duplicate(company_key, source, (title, company, snippet), candidates[-1], signature)
 
     threshold_cfg = RUNTIME_CONFIG.get("threshold_overrides", {})
     threshold_career_sleeve = (
@@ -5346,10 +5989,11 @@ def rank_and_filter_jobs(
         if target_career_sleeve in c_sleeves.VALID_CAREER_SLEEVES
         else ""
     )
-    if not threshold_career_sleeve and scored_jobs:
-        threshold_career_sleeve = _clean_value(scored_jobs[0].get("primary_career_sleeve_id"), "").upper()
+    if not threshold_career_sleeve and candidates:
+        threshold_career_sleeve = _clean_value(candidates[0]["scoring_career_sleeve"], "").upper()
     career_sleeve_threshold_defaults = c_sleeves.decision_thresholds_for_career_sleeve(
-        threshold_career_sleeve or "E"
+        threshold_career_sleeve or "E",
+        ruleset=ruleset,
     )
 
     base_min_total_hits = int(
@@ -5427,109 +6071,164 @@ def rank_and_filter_jobs(
         },
     ]
 
-    chosen_profile = threshold_profiles[0]
-    fallback_steps = []
-    for profile in threshold_profiles:
-        pass_count = 0
-        for scored in scored_jobs:
-            scored["reasons"] = list(scored.get("_base_reasons") or [])
-            hard_reject_reason = scored.get("hard_reject_reason")
-            primary_score = float(scored.get("primary_career_sleeve_score", 0))
-            total_hits = int(scored.get("_score_components", {}).get("total_positive_hits", 0))
-            location_gate_match = bool(scored.get("_score_components", {}).get("location_gate_match", True))
-            mismatch = scored.get("_score_components", {}).get("strict_target_mismatch", False)
-            missing_domain_anchors = bool(
-                scored.get("_score_components", {}).get("missing_domain_anchors", False)
-            )
-            fail_reason = ""
-
-            if hard_reject_reason:
-                decision = "FAIL"
-                fail_reason = hard_reject_reason
-            elif not location_gate_match:
-                decision = "FAIL"
-                fail_reason = "location_out_of_scope"
-            elif mismatch:
-                decision = "FAIL"
-                fail_reason = "target_career_sleeve_mismatch"
-            elif missing_domain_anchors:
-                decision = "FAIL"
-                fail_reason = "missing_domain_anchors"
-            elif custom_mode and not normalized_custom_queries:
-                decision = "FAIL"
-                fail_reason = "custom_queries_missing"
-            elif custom_mode:
-                if total_hits >= custom_pass_hits and primary_score >= custom_pass_score:
-                    decision = "PASS"
-                elif total_hits >= custom_maybe_hits and primary_score >= custom_maybe_score:
-                    decision = "MAYBE"
-                else:
-                    decision = "FAIL"
-                    fail_reason = "custom_queries_no_match"
-            elif primary_score >= profile["min_primary_score"] and total_hits >= profile["min_total_hits"]:
+    # Gate outcomes and custom-mode decisions do not depend on the threshold
+    # profile, so they are resolved once. The remaining jobs are reduced to
+    # (primary_score, total_hits) counts, which is all a profile needs to count
+    # its PASS results; decisions are then materialized for the chosen profile only.
+    decisions = []
+    fail_reasons = []
+    fixed_pass_count = 0
+    threshold_pair_counts = Counter()
+    for candidate, primary_score, total_hits in zip(
+        candidates,
+        rank_columns["primary_career_sleeve_score"],
+        rank_columns["total_positive_hits"],
+    ):
+        primary_score = float(primary_score)
+        total_hits = int(total_hits)
+        decision = ""
+        fail_reason = ""
+        if candidate["hard_reject_reason"]:
+            decision = "FAIL"
+            fail_reason = candidate["hard_reject_reason"]
+        elif not candidate["location_gate_match"]:
+            decision = "FAIL"
+            fail_reason = "location_out_of_scope"
+        elif candidate["strict_target_mismatch"]:
+            decision = "FAIL"
+            fail_reason = "target_career_sleeve_mismatch"
+        elif candidate["missing_domain_anchors"]:
+            decision = "FAIL"
+            fail_reason = "missing_domain_anchors"
+        elif custom_mode and not normalized_custom_queries:
+            decision = "FAIL"
+            fail_reason = "custom_queries_missing"
+        elif custom_mode:
+            if total_hits >= custom_pass_hits and primary_score >= custom_pass_score:
                 decision = "PASS"
-            elif (
-                primary_score >= profile["min_maybe_primary_score"]
-                and total_hits >= profile["min_maybe_total_hits"]
-            ):
+            elif total_hits >= custom_maybe_hits and primary_score >= custom_maybe_score:
                 decision = "MAYBE"
             else:
                 decision = "FAIL"
-                if primary_score < profile["min_maybe_primary_score"]:
-                    fail_reason = "primary_career_sleeve_score_too_low"
-                else:
-                    fail_reason = "insufficient_keyword_hits"
-
-            scored["decision"] = decision
-            if fail_reason:
-                scored["_fail_reason"] = fail_reason
-                reasons = list(scored.get("reasons") or [])
-                reasons.append(f"Fail reason: {fail_reason}")
-                scored["reasons"] = reasons[:MAX_REASON_COUNT]
-            scored["_applied_threshold_profile"] = profile["name"]
-            if decision == "PASS":
-                pass_count += 1
+                fail_reason = "custom_queries_no_match"
+        else:
+            threshold_pair_counts[(primary_score, total_hits)] += 1
+        if decision == "PASS":
+            fixed_pass_count += 1
+        decisions.append(decision)
+        fail_reasons.append(fail_reason)
 
+    threshold_pairs = sorted(threshold_pair_counts.items(), reverse=True)
+    chosen_profile = threshold_profiles[0]
+    fallback_steps = []
+    for profile in threshold_profiles:
+        pass_count = fixed_pass_count
+        for (primary_score, total_hits), count in threshold_pairs:
+            if primary_score < profile["min_primary_score"]:
+                break
+            if total_hits >= profile["min_total_hits"]:
+                pass_count += count
         chosen_profile = profile
         if profile["name"] != "default":
             fallback_steps.append(profile["name"])
         if pass_count >= PASS_FALLBACK_MIN_COUNT:
             break
 
+    for index, (primary_score, total_hits) in enumerate(
+        zip(rank_columns["primary_career_sleeve_score"], rank_columns["total_positive_hits"])
+    ):
+        if decisions[index]:
+            continue
+        primary_score = float(primary_score)
+        total_hits = int(total_hits)
+        if primary_score >= chosen_profile["min_primary_score"] and total_hits >= chosen_profile["min_total_hits"]:
+            decisions[index] = "PASS"
+        elif (
+            primary_score >= chosen_profile["min_maybe_primary_score"]
+            and total_hits >= chosen_profile["min_maybe_total_hits"]
+        ):
+            decisions[index] = "MAYBE"
+        else:
+            decisions[index] = "FAIL"
+            if primary_score < chosen_profile["min_maybe_primary_score"]:
+                fail_reasons[index] = "primary_career_sleeve_score_too_low"
+            else:
+                fail_reasons[index] = "insufficient_keyword_hits"
+
     priority = {"PASS": 2, "MAYBE": 1, "FAIL": 0}
-    scored_jobs.sort(
-        key=lambda job: (priority.get(job.get("decision", "FAIL"), 0), job.get("_rank", (0, 0, 0, 0))),
+    rank_keys = _rank_keys(rank_columns, ruleset)
+    ranked_decisions = list(decisions)
+    promoted = set()
+    if "PASS" not in decisions and "MAYBE" not in decisions:
+        promotable = [
+            index
+            for index, fail_reason in enumerate(fail_reasons)
+            if not candidates[index]["hard_reject_reason"] and not fail_reason.startswith("location_")
+        ]
+        promoted = set(heapq.nlargest(10, promotable, key=rank_keys.__getitem__))
+        for index in promoted:
+            decisions[index] = "MAYBE"
+
+    decision_counts = Counter(decisions)
+    # Counts are exact over every FAIL row; ties in most_common() keep the
+    # order in which each reason first appears in the ranked output.
+    fail_reason_counts = Counter()
+    fail_reason_leaders = {}
+    for index, decision in enumerate(decisions):
+        if decision != "FAIL":
+            continue
+        reason = fail_reasons[index] or "unknown_fail"
+        fail_reason_counts[reason] += 1
+        leader = fail_reason_leaders.get(reason)
+        if leader is None or rank_keys[index] > rank_keys[leader]:
+            fail_reason_leaders[reason] = index
+    fail_reason_counter = Counter()
+    for reason in sorted(
+        fail_reason_leaders,
+        key=lambda reason: (rank_keys[fail_reason_leaders[reason]], -fail_reason_leaders[reason]),
         reverse=True,
-    )
+    ):
+        fail_reason_counter[reason] = fail_reason_counts[reason]
 
-    pass_jobs = [job for job in scored_jobs if job.get("decision") == "PASS"]
-    maybe_jobs = [job for job in scored_jobs if job.get("decision") == "MAYBE"]
-    fail_jobs = [job for job in scored_jobs if job.get("decision") == "FAIL"]
-    if not pass_jobs and not maybe_jobs and scored_jobs:
-        promoted = []
-        for failed in fail_jobs:
-            if failed.get("hard_reject_reason"):
-                continue
-            if (failed.get("_fail_reason") or "").startswith("location_"):
-                continue
-            failed["decision"] = "MAYBE"
-            reasons = list(failed.get("reasons") or [])
-            reasons.append("Promoted to MAYBE to avoid empty output while raw matches exist.")
-            failed["reasons"] = reasons[:MAX_REASON_COUNT]
-            promoted.append(failed)
-            if len(promoted) >= 10:
-                break
-        maybe_jobs = [job for job in scored_jobs if job.get("decision") == "MAYBE"]
-        fail_jobs = [job for job in scored_jobs if job.get("decision") == "FAIL"]
+    # Always return PASS first, then MAYBE, so the UI can paginate without losing MAYBE visibility.
+    # With max_results only the best K rows are ordered and materialized; the
+    # counters above already cover every scored job.
+    selectable = [
+        index
+        for index, decision in enumerate(decisions)
+        if decision != "FAIL" or include_fail
+    ]
 
-    fail_reason_counter = Counter()
-    for failed in fail_jobs:
-        fail_reason_counter[failed.get("_fail_reason") or "unknown_fail"] += 1
+    def selection_key(index):
+        return priority[decisions[index]], rank_keys[index]
 
-    # Always return PASS first, then MAYBE, so the UI can paginate without losing MAYBE visibility.
-    selected_jobs = pass_jobs + maybe_jobs
-    if include_fail:
-        selected_jobs = selected_jobs + fail_jobs
+    if max_results is None:
+        selected_indices = sorted(selectable, key=selection_key, reverse=True)
+        materialize_indices = sorted(
+            range(len(candidates)),
+            key=lambda index: (priority[ranked_decisions[index]], rank_keys[index]),
+            reverse=True,
+        )
+    else:
+        selected_indices = heapq.nlargest(max(0, int(max_results)), selectable, key=selection_key)
+        materialize_indices = selected_indices
+
+    records = {}
+    for index in materialize_indices:
+        record = _materialize_ranked_job(candidates[index])
+        reasons = list(record["reasons"])
+        fail_reason = fail_reasons[index]
+        if fail_reason:
+            reasons.append(f"Fail reason: {fail_reason}")
+            reasons = reasons[:MAX_REASON_COUNT]
+        if index in promoted:
+            reasons.append("Promoted to MAYBE to avoid empty output while raw matches exist.")
+            reasons = reasons[:MAX_REASON_COUNT]
+        record["decision"] = decisions[index]
+        record["reasons"] = reasons
+        records[index] = record
+    scored_jobs = [records[index] for index in materialize_indices]
+    selected_jobs = [records[index] for index in selected_indices]
 
     dedupe_ratio_by_source = {}
     for source, raw_count in raw_by_source.items():
@@ -5545,15 +6244,15 @@ def rank_and_filter_jobs(
         {"reason": reason, "count": count}
         for reason, count in fail_reason_counter.most_common(5)
     ]
-    full_description_count = sum(1 for job in scored_jobs if _clean_value(job.get("full_description"), ""))
-    full_description_coverage = round((full_description_count / len(scored_jobs)), 4) if scored_jobs else 0
+    full_description_count = sum(1 for candidate in candidates if candidate["full_description"])
+    full_description_coverage = round((full_description_count / len(candidates)), 4) if candidates else 0
     funnel = {
         "raw": len(items),
-        "after_dedupe": len(scored_jobs),
-        "scored": len(scored_jobs),
-        "pass_count": len(pass_jobs),
-        "maybe_count": len(maybe_jobs),
-        "fail_count": len(fail_jobs),
+        "after_dedupe": len(candidates),
+        "scored": len(candidates),
+        "pass_count": decision_counts["PASS"],
+        "maybe_count": decision_counts["MAYBE"],
+        "fail_count": decision_counts["FAIL"],
         "full_description_count": full_description_count,
         "full_description_coverage": full_description_coverage,
         "top_fail_reasons": top_fail_reasons,
@@ -5563,13 +6262,7 @@ def rank_and_filter_jobs(
     diagnostics["fallbacks_applied"] = fallback_steps
     diagnostics["dedupe_ratio_by_source"] = dedupe_ratio_by_source
     diagnostics["threshold_profile"] = chosen_profile
-
-    for job in scored_jobs:
-        job.pop("_rank", None)
-        job.pop("_score_components", None)
-        job.pop("_applied_threshold_profile", None)
-        job.pop("_fail_reason", None)
-        job.pop("_base_reasons", None)
+    diagnostics["near_duplicates_collapsed"] = near_duplicate_count
 
     if return_diagnostics:
         return {
@@ -6031,6 +6724,7 @@ def fetch_jobs_from_sources(
     force_source_retry=False,
     enforce_mvp_bundle=True,
     parallel_fetch=False,
+    on_source_items=None,
 ):
     profile = SCRAPE_MODE
     requested = [source for source in selected_sources if source in SOURCE_REGISTRY]
@@ -6098,6 +6792,8 @@ def fetch_jobs_from_sources(
 
     def _consume_source_result(source_key, source_label, source_items, source_error, source_diag):
         items.extend(source_items or [])
+        if on_source_items is not None:
+            on_source_items(source_items or [])
         if source_error:
             errors.append(f"{source_key}: {source_error}")
         _progress_update(
@@ -6690,7 +7386,7 @@ def index():
 
 @app.route('/healthz')
 def healthz():
-    return jsonify({"status": "ok"})
+    return jsonify({"status": "ok", "scoring_ruleset": c_sleeves.ruleset_status()})
 
 
 # Redirect '/index.html' to '/'
@@ -6822,6 +7518,8 @@ def save_synergy_sleeve():
             return jsonify({"error": "Could not persist custom Career Sleeve state."}), 500
         catalog = _career_sleeve_catalog(context)
 
+    _evict_custom_sleeve_matchers(context.get("owner_key"), letter)
+    _custom_sleeve_matcher(context.get("owner_key"), letter, queries, location_preferences)
     return jsonify({"ok": True, "saved": record, "catalog": catalog})
 
 
@@ -6854,6 +7552,7 @@ def delete_synergy_sleeve(letter):
             return jsonify({"error": "Could not persist custom Career Sleeve state."}), 500
         catalog = _career_sleeve_catalog(context)
 
+    _evict_custom_sleeve_matchers(context.get("owner_key"), normalized_letter)
     return jsonify({"ok": True, "deleted": normalized_letter, "catalog": catalog})
 
 
@@ -7076,6 +7775,7 @@ def scrape():
     strict_career_sleeve = (request.args.get("strict", "0") == "1") and not custom_mode
     force_refresh = request.args.get("refresh", "0") == "1"
     include_fail = request.args.get("include_fail", "0") == "1"
+    pipeline_mode = request.args.get("pipeline", "0") == "1"
 
     max_results_raw = request.args.get("max_results", "200")
     try:
@@ -7224,26 +7924,41 @@ def scrape():
         detail_rps=detail_rps,
         no_new_unique_pages=no_new_unique_pages,
         max_results=max_results,
+        pipeline_mode=pipeline_mode,
     )
 
-    items, fetch_errors, used_sources, fetch_diagnostics = fetch_jobs_from_sources(
-        selected_sources,
-        scoring_profile_career_sleeve,
-        location_mode=location_mode,
-        force_refresh=force_refresh,
-        max_pages=max_pages,
-        target_raw=target_raw,
-        requests_per_second=requests_per_second,
-        detail_rps=detail_rps,
-        no_new_unique_pages=no_new_unique_pages,
-        search_queries=search_queries,
-        extra_queries=extra_queries,
-        allow_failover=allow_failover,
-        run_id=run_id,
-        force_source_retry=force_source_retry,
-        enforce_mvp_bundle=enforce_mvp_bundle,
-        parallel_fetch=parallel_fetch,
+    submit_to_pipeline, close_pipeline = (
+        _start_scoring_pipeline(run_id) if pipeline_mode else (None, None)
     )
+    try:
+        items, fetch_errors, used_sources, fetch_diagnostics = fetch_jobs_from_sources(
+            selected_sources,
+            scoring_profile_career_sleeve,
+            location_mode=location_mode,
+            force_refresh=force_refresh,
+            max_pages=max_pages,
+            target_raw=target_raw,
+            requests_per_second=requests_per_second,
+            detail_rps=detail_rps,
+            no_new_unique_pages=no_new_unique_pages,
+            search_queries=search_queries,
+            extra_queries=extra_queries,
+            allow_failover=allow_failover,
+            run_id=run_id,
+            force_source_retry=force_source_retry,
+            enforce_mvp_bundle=enforce_mvp_bundle,
+            parallel_fetch=parallel_fetch,
+            on_source_items=submit_to_pipeline,
+        )
+    finally:
+        pipeline_stats = close_pipeline() if close_pipeline else None
+    if pipeline_stats is not None:
+        _progress_update(
+            run_id,
+            "pipeline-scored",
+            f"Scored {pipeline_stats['scored']} items while fetching",
+            **pipeline_stats,
+        )
     _progress_update(
         run_id,
         "fetch-finished",
@@ -7273,6 +7988,10 @@ def scrape():
         custom_mode=custom_mode,
         custom_search_queries=search_queries,
         custom_location_preferences=custom_location_preferences,
+        custom_owner_key=auth_context.get("owner_key"),
+        custom_letter=custom_letter,
+        # Incremental runs mark every ranked job as seen, so they need the full list.
+        max_results=None if incremental_mode else max_results,
     )
     candidate_items = ranking_result.get("jobs") or []
     incremental_skipped = 0
@@ -1,4 +1,10 @@
+import json
+import os
+import tempfile
+import time
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 import career_sleeves as c_sleeves
 
@@ -32,6 +38,16 @@ class TestCareerSleeves(unittest.TestCase):
         self.assertFalse(flags["extra_language_required"])
         self.assertTrue(flags["extra_language_preferred"])
 
+    def test_language_required_is_decided_per_clause_for_each_language(self):
+        flags, notes = c_sleeves.detect_language_flags(
+            "Fluent German is mandatory; French and Spanish speakers welcome.\n"
+            "English and Dutch required."
+        )
+        self.assertEqual(flags["extra_languages"], ["french", "german", "spanish"])
+        self.assertTrue(flags["extra_language_required"])
+        self.assertIn("german", notes[0])
+        self.assertNotIn("french", notes[0])
+
     def test_plural_matching_improves_keyword_detection(self):
         score, details = c_sleeves.score_career_sleeve(
             "A",
@@ -61,6 +77,18 @@ class TestCareerSleeves(unittest.TestCase):
         self.assertIn("visa_support", badges)
         self.assertIn("components", details)
 
+    def test_abroad_signal_tables_are_expanded_once_with_bilingual_variants(self):
+        table = c_sleeves._ACTIVE_RULESET["abroad_signal_tables"]["mobility"]
+        self.assertIn("internationaal reizen", table["positive_terms"])
+        raw_text = "Hybride functie met internationaal reizen en visum sponsoring."
+        _, _, details = c_sleeves.score_abroad_components(raw_text)
+        expected = c_sleeves.find_hits(
+            c_sleeves.prepare_text(raw_text),
+            list(table["positive_terms"]),
+        )
+        self.assertEqual(details["mobility"]["positive_hits"], sorted(expected))
+        self.assertTrue(expected)
+
     def test_hard_reject_detects_sales_titles(self):
         reason = c_sleeves.detect_hard_reject(
             "Account Executive",
@@ -68,6 +96,314 @@ class TestCareerSleeves(unittest.TestCase):
         )
         self.assertTrue(reason.startswith("hard_reject_title"))
 
+    def test_compiled_find_hits_matches_per_phrase_reference(self):
+        prepared = c_sleeves.prepare_text(
+            "Deliveries and festivals across data-centres; on-site rollout, logistics "
+            "policies, live music events and key stakeholder alignment."
+        )
+        phrases = [
+            "delivery",
+            "festival",
+            "data centre",
+            "on-site",
+            "on site",
+            "rollout",
+            "policy",
+            "live music",
+            "music event",
+            "stakeholder alignment",
+            "key",
+            "data center",
+        ]
+        expected = {
+            phrase for phrase in phrases if c_sleeves._phrase_in_text(prepared, phrase)
+        }
+        self.assertEqual(c_sleeves.find_hits(prepared, phrases), expected)
+        self.assertIn("delivery", expected)
+        self.assertIn("on site", expected)
+        self.assertNotIn("music event", expected)
+
+    def test_scoring_plans_are_compiled_for_every_career_sleeve(self):
+        plans = c_sleeves._ACTIVE_RULESET["career_sleeve_plans"]
+        self.assertEqual(set(plans), set(c_sleeves.CAREER_SLEEVE_CONFIG))
+        plan_c = plans["C"]
+        self.assertEqual(plan_c["min_anchor_hits"], 1)
+        self.assertEqual(plan_c["anchor_cap_score"], 2)
+        self.assertEqual(plans["E"]["context_density_threshold"], 2)
+
+    def test_ruleset_artifact_round_trips_and_rejects_stale_builds(self):
+        fingerprint = c_sleeves.ruleset_fingerprint()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            artifact_path = Path(tmp_dir) / "ruleset.pickle"
+            c_sleeves.build_ruleset_artifact(artifact_path)
+            loaded = c_sleeves._load_ruleset_artifact(artifact_path, fingerprint)
+            self.assertEqual(loaded, c_sleeves._compile_ruleset())
+
+            self.assertIsNone(c_sleeves._load_ruleset_artifact(artifact_path, "outdated"))
+            with patch.object(c_sleeves, "_MODULE_SOURCE_DIGEST", "edited-module"):
+                self.assertIsNone(c_sleeves._load_ruleset_artifact(artifact_path, fingerprint))
+            artifact_path.write_bytes(b"not a pickle")
+            self.assertIsNone(c_sleeves._load_ruleset_artifact(artifact_path, fingerprint))
+        self.assertIsNone(c_sleeves._load_ruleset_artifact(artifact_path, fingerprint))
+
+    def test_ruleset_file_hot_swaps_without_touching_captured_rulesets(self):
+        original = c_sleeves.active_ruleset()
+        raw_title = "Operations Coordinator"
+        raw_text = "Operations coordinator role. Strong commercial awareness required."
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rules_path = Path(tmp_dir) / "scoring_ruleset.json"
+            rules_path.write_text(
+                json.dumps(
+                    {
+                        "version": "2026-10-17.1",
+                        "rules": {"HARD_REJECT_TEXT_PATTERNS": ["commercial awareness"]},
+                    }
+                ),
+                encoding="utf-8",
+            )
+            try:
+                self.assertTrue(c_sleeves.reload_ruleset(rules_path))
+                swapped = c_sleeves.active_ruleset()
+                self.assertEqual(swapped["version"], "2026-10-17.1")
+                self.assertNotEqual(swapped["fingerprint"], original["fingerprint"])
+                self.assertEqual(
+                    c_sleeves.detect_hard_reject(raw_title, raw_text),
+                    "hard_reject_text:commercial awareness",
+                )
+                # A ranking that captured the previous ruleset keeps scoring with it.
+                self.assertEqual(c_sleeves.detect_hard_reject(raw_title, raw_text, ruleset=original), "")
+                self.assertFalse(c_sleeves.reload_ruleset(rules_path))
+
+                rules_path.write_text('{"rules": {"NOT_A_RULE": []}}', encoding="utf-8")
+                self.assertFalse(c_sleeves.reload_ruleset(rules_path, force=True))
+                self.assertIs(c_sleeves.active_ruleset(), swapped)
+                self.assertIn("NOT_A_RULE", c_sleeves.ruleset_status()["error"])
+
+                rules_path.unlink()
+                self.assertTrue(c_sleeves.reload_ruleset(rules_path))
+                self.assertEqual(c_sleeves.ruleset_fingerprint(), original["fingerprint"])
+            finally:
+                rules_path.unlink(missing_ok=True)
+                c_sleeves.reload_ruleset(rules_path, force=True)
+                c_sleeves._RULESET_STATE["path"] = None
+
+    def test_malformed_ruleset_files_keep_the_active_ruleset(self):
+        original = c_sleeves.active_ruleset()
+        cases = [
+            ({"rules": {"CAREER_SLEEVE_CONFIG": {"A": {"name": "x"}}}}, "missing 'keywords'"),
+            ({"rules": {"RANKING_WEIGHTS": {"visa_score": "heavy"}}}, "RANKING_WEIGHTS.visa_score"),
+            ({"rules": {"SYNERGY_SIGNALS": {"positive": "international"}}}, "SYNERGY_SIGNALS.positive"),
+            ({"RANKING_WEIGHTS": {"visa_score": 2}}, "unknown keys"),
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rules_path = Path(tmp_dir) / "scoring_ruleset.json"
+            try:
+                for payload, message in cases:
+                    with self.subTest(message=message):
+                        rules_path.write_text(json.dumps(payload), encoding="utf-8")
+                        self.assertFalse(c_sleeves.reload_ruleset(rules_path, force=True))
+                        self.assertIs(c_sleeves.active_ruleset(), original)
+                        self.assertIn(message, c_sleeves.ruleset_status()["error"])
+
+                rules_path.write_text('{"rules": {"HARD_REJECT_TEXT_PATTERNS": ["x"]}}', encoding="utf-8")
+                with patch.object(c_sleeves, "_ruleset_for", side_effect=KeyError("keywords")):
+                    self.assertFalse(c_sleeves.reload_ruleset(rules_path, force=True))
+                self.assertIs(c_sleeves.active_ruleset(), original)
+                self.assertEqual(c_sleeves.ruleset_status()["error"], "KeyError: 'keywords'")
+            finally:
+                rules_path.unlink(missing_ok=True)
+                c_sleeves.reload_ruleset(rules_path, force=True)
+                c_sleeves._RULESET_STATE["path"] = None
+        self.assertIsNone(c_sleeves.ruleset_status()["error"])
+
+    def _isolate_ruleset_watcher(self, rules_path):
+        # Park any watcher started by the app import and restore the builtin
+        # ruleset once the test's own watcher is gone.
+        previous = (c_sleeves._RULESET_STATE["watcher"], c_sleeves._RULESET_STATE["watcher_path"])
+        c_sleeves._RULESET_STATE["watcher"] = None
+        c_sleeves._RULESET_STATE["watcher_path"] = None
+
+        def _restore():
+            c_sleeves.stop_ruleset_watcher()
+            rules_path.unlink(missing_ok=True)
+            c_sleeves.reload_ruleset(rules_path, force=True)
+            c_sleeves._RULESET_STATE["path"] = None
+            c_sleeves._RULESET_STATE["watcher"], c_sleeves._RULESET_STATE["watcher_path"] = previous
+
+        self.addCleanup(_restore)
+
+    def _wait_for(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(condition())
+
+    def test_ruleset_watcher_survives_reload_failures(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rules_path = Path(tmp_dir) / "scoring_ruleset.json"
+            rules_path.write_text('{"rules": {}}', encoding="utf-8")
+            self._isolate_ruleset_watcher(rules_path)
+            c_sleeves.start_ruleset_watcher(rules_path, interval=0.01)
+            with patch.object(
+                c_sleeves,
+                "_reload_ruleset",
+                side_effect=[RuntimeError("boom"), False],
+            ) as reload:
+                os.utime(rules_path, ns=(10**18, 10**18))
+                self._wait_for(lambda: reload.call_count == 1)
+                self._wait_for(lambda: c_sleeves.ruleset_status()["error"] == "RuntimeError: boom")
+                os.utime(rules_path, ns=(2 * 10**18, 2 * 10**18))
+                self._wait_for(lambda: reload.call_count == 2)
+                c_sleeves.stop_ruleset_watcher()
+
+    def test_ruleset_watcher_sees_edits_made_right_after_the_initial_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rules_path = Path(tmp_dir) / "scoring_ruleset.json"
+            rules_path.write_text('{"version": "v1", "rules": {}}', encoding="utf-8")
+            self._isolate_ruleset_watcher(rules_path)
+            original_reload = c_sleeves.reload_ruleset
+
+            def _reload_then_edit(path=None, force=False):
+                changed = original_reload(path, force)
+                rules_path.write_text('{"version": "v2", "rules": {}}', encoding="utf-8")
+                os.utime(rules_path, ns=(10**18, 10**18))
+                return changed
+
+            with patch.object(c_sleeves, "reload_ruleset", side_effect=_reload_then_edit):
+                c_sleeves.start_ruleset_watcher(rules_path, interval=0.01)
+            self._wait_for(lambda: c_sleeves.ruleset_status()["version"] == "v2")
+
+    def test_ruleset_watcher_moves_to_a_new_path(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            old_path = Path(tmp_dir) / "old.json"
+            new_path = Path(tmp_dir) / "new.json"
+            old_path.write_text('{"version": "old", "rules": {}}', encoding="utf-8")
+            new_path.write_text('{"version": "new", "rules": {}}', encoding="utf-8")
+            self._isolate_ruleset_watcher(new_path)
+            old_watcher = c_sleeves.start_ruleset_watcher(old_path, interval=0.01)
+            self.assertIs(c_sleeves.start_ruleset_watcher(old_path, interval=0.01), old_watcher)
+            new_watcher = c_sleeves.start_ruleset_watcher(new_path, interval=0.01)
+            self.assertIsNot(new_watcher, old_watcher)
+            self.assertTrue(old_watcher.is_set())
+            self.assertEqual(c_sleeves.ruleset_status()["version"], "new")
+
+            # Edits to the old file are no longer picked up.
+            os.utime(old_path, ns=(10**18, 10**18))
+            time.sleep(0.1)
+            self.assertEqual(c_sleeves.ruleset_status()["version"], "new")
+            new_path.write_text('{"version": "newer", "rules": {}}', encoding="utf-8")
+            os.utime(new_path, ns=(10**18, 10**18))
+            self._wait_for(lambda: c_sleeves.ruleset_status()["version"] == "newer")
+
+    def test_score_all_career_sleeves_matches_individual_scorers(self):
+        raw_text = (
+            "Festival production manager for data center commissioning, supply chain "
+            "rollouts, theme park guest flow and cold calling."
+        )
+        raw_title = "Production Manager Operations"
+        scores, details = c_sleeves.score_all_career_sleeves(raw_text, raw_title)
+        for sleeve_id in c_sleeves.CAREER_SLEEVE_CONFIG:
+            expected_score, expected_details = c_sleeves.score_career_sleeve(
+                sleeve_id,
+                raw_text,
+                raw_title,
+            )
+            self.assertEqual(scores[sleeve_id], expected_score)
+            self.assertEqual(details[sleeve_id], expected_details)
+
+    def test_explain_levels_keep_scores_and_gates_identical(self):
+        raw_text = "Commissioning engineer for HVAC reliability with international travel."
+        raw_title = "Commissioning Engineer"
+        full_scores, full_details = c_sleeves.score_all_career_sleeves(raw_text, raw_title)
+        for explain in ("none", "summary"):
+            scores, details = c_sleeves.score_all_career_sleeves(
+                raw_text,
+                raw_title,
+                explain=explain,
+            )
+            self.assertEqual(scores, full_scores)
+            for sleeve_id, entry in details.items():
+                self.assertNotIn("context_hits", entry)
+                for key, value in entry.items():
+                    self.assertEqual(value, full_details[sleeve_id][key])
+        _, none_details = c_sleeves.score_all_career_sleeves(raw_text, raw_title, explain="none")
+        self.assertEqual(none_details["C"]["reason"], "missing_domain_anchors")
+        self.assertNotIn("anchor_hit_count", none_details["C"])
+        components, badges, details = c_sleeves.score_abroad_components(raw_text, explain="none")
+        self.assertEqual((components, badges), c_sleeves.score_abroad_components(raw_text)[:2])
+        self.assertNotIn("positive_hits", details["mobility"])
+        with self.assertRaises(ValueError):
+            c_sleeves.score_career_sleeve("C", raw_text, raw_title, explain="verbose")
+
+    def test_prepared_text_is_accepted_by_every_detector(self):
+        raw_text = (
+            "Hybrid festival role with visa sponsorship, SDR outreach and "
+            "international travel. German required."
+        )
+        prepared = c_sleeves.build_prepared_text(raw_text)
+        self.assertEqual(prepared.padded, c_sleeves.prepare_text(raw_text))
+        self.assertEqual(
+            [prepared.normalized[offset:].split(" ")[0] for offset in prepared.offsets],
+            list(prepared.tokens),
+        )
+        self.assertEqual(
+            c_sleeves.detect_language_flags(prepared),
+            c_sleeves.detect_language_flags(raw_text),
+        )
+        self.assertEqual(
+            c_sleeves.score_abroad_components(prepared),
+            c_sleeves.score_abroad_components(raw_text),
+        )
+        self.assertEqual(c_sleeves.score_synergy(prepared), c_sleeves.score_synergy(raw_text))
+        self.assertEqual(
+            c_sleeves.evaluate_soft_penalties(prepared),
+            c_sleeves.evaluate_soft_penalties(raw_text),
+        )
+        self.assertEqual(
+            c_sleeves.detect_hard_reject(c_sleeves.build_prepared_text("SDR"), prepared),
+            c_sleeves.detect_hard_reject("SDR", raw_text),
+        )
+
+    def test_positional_index_answers_phrase_positions_and_spans(self):
+        prepared = c_sleeves.build_prepared_text(
+            "Travel to North-America; north america north america trips."
+        )
+        self.assertEqual(prepared.positions["north"], [2, 4, 6])
+        self.assertEqual(c_sleeves._phrase_token_positions(prepared, "North America"), [2, 4, 6])
+        spans = c_sleeves.phrase_spans(prepared, "north america")
+        self.assertEqual(
+            [prepared.normalized[start:end] for start, end in spans],
+            ["north america"] * 3,
+        )
+        overlapping = c_sleeves.build_prepared_text("go go go")
+        self.assertEqual(c_sleeves._phrase_token_positions(overlapping, "go go"), [0, 1])
+        self.assertEqual(c_sleeves.phrase_spans(overlapping, "go go"), [(0, 5)])
+        self.assertEqual(c_sleeves.phrase_spans(prepared, "south america"), [])
+
+    def test_batch_scoring_matches_score_all_career_sleeves(self):
+        jobs = [
+            ("Festival production office with touring crews.", "Tour Manager"),
+            ("Data centre commissioning and uptime.", "Commissioning Engineer"),
+            ("Festival production office with touring crews!", "Tour manager"),
+            # "data centre" must not match across the boundary with the next posting.
+            ("Commissioning of HVAC in a data", "Commissioning Engineer"),
+            ("centre uptime", ""),
+            ("", ""),
+        ]
+        for explain in ("none", "summary", "full"):
+            with self.subTest(explain=explain):
+                results = c_sleeves.score_career_sleeves_batch(jobs, explain=explain)
+                self.assertEqual(
+                    results,
+                    [
+                        c_sleeves.score_all_career_sleeves(raw_text, raw_title, explain=explain)
+                        for raw_text, raw_title in jobs
+                    ],
+                )
+        results = c_sleeves.score_career_sleeves_batch(jobs)
+        self.assertIsNot(results[0][1]["A"]["context_hits"], results[2][1]["A"]["context_hits"])
+        self.assertEqual(c_sleeves.score_career_sleeves_batch([]), [])
+
     def test_workflow_role_scores_without_hard_must_have_gate(self):
         score, details = c_sleeves.score_career_sleeve(
             "D",
@@ -101,6 +437,13 @@ class TestCareerSleeves(unittest.TestCase):
             )
         )
 
+    def test_blocked_detection_scans_bounded_prefix_with_token_boundaries(self):
+        self.assertTrue(c_sleeves.detect_blocked_html("<title>Are-you a ROBOT?</title>"))
+        self.assertTrue(c_sleeves.detect_blocked_html("Blocked. Sign in  to continue"))
+        self.assertFalse(c_sleeves.detect_blocked_html("recaptcha_key blocked blocked"))
+        padding = "<script>" + ("x " * c_sleeves.BLOCKED_HTML_SCAN_CHARS) + "</script>"
+        self.assertFalse(c_sleeves.detect_blocked_html(padding + "<h1>Captcha</h1>"))
+
 
 if __name__ == "__main__":
     unittest.main()
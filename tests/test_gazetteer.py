@@ -0,0 +1,50 @@
+import unittest
+
+import gazetteer
+import main
+
+
+class TestGazetteer(unittest.TestCase):
+    def test_aliases_resolve_to_one_place_and_keep_their_label(self):
+        den_bosch = gazetteer.resolve_location("Den Bosch, Netherlands")
+        hertogenbosch = gazetteer.resolve_location("'s-Hertogenbosch")
+        self.assertEqual(den_bosch[0], hertogenbosch[0])
+        self.assertEqual(den_bosch[1], "Den Bosch")
+        self.assertEqual(hertogenbosch[1], "'s-Hertogenbosch")
+
+    def test_accents_are_folded_and_multi_token_names_match(self):
+        hanoi = gazetteer.resolve_location("Hà Nội, Việt Nam")
+        self.assertEqual(gazetteer.PLACES[hanoi[0]][0], "Hanoi")
+        frankfurt = gazetteer.resolve_location("Frankfurt am Main, Hessen")
+        self.assertEqual(frankfurt[1], "Frankfurt am Main")
+        cologne = gazetteer.resolve_location("Köln")
+        self.assertEqual(cologne, gazetteer.resolve_location("Koln"))
+
+    def test_country_hint_breaks_shared_alias_ties(self):
+        self.assertEqual(gazetteer.PLACES[gazetteer.resolve_location("Soest")[0]][1], "NL")
+        self.assertEqual(gazetteer.PLACES[gazetteer.resolve_location("Soest, Germany")[0]][1], "DE")
+
+    def test_matches_whole_tokens_only(self):
+        self.assertIsNone(gazetteer.resolve_location("Denver, CO, United States"))
+        self.assertEqual(gazetteer.resolve_location("Utrechtseweg 10, Zeist")[1], "Zeist")
+
+    def test_proximity_uses_precomputed_home_distances(self):
+        profile = main._score_location_proximity("Antwerpen, Belgium")
+        place_index, _ = gazetteer.resolve_location("Antwerpen, Belgium")
+        self.assertEqual(profile["distance_km"], main.HOME_PLACE_DISTANCES_KM[place_index])
+        self.assertEqual(profile["matched_city"], "Antwerpen")
+        self.assertEqual(profile["tier"], "extended_commute")
+
+    def test_remote_or_hybrid_floor_applies_to_dutch_places_only(self):
+        groningen = main._score_location_proximity("Groningen, Netherlands", work_mode="Hybrid")
+        self.assertEqual(groningen["score"], 2.2)
+        self.assertEqual(groningen["tier"], "very_far_remote_or_hybrid")
+        for location in ("Berlin, Germany", "Hanoi, Vietnam", "Ho Chi Minh City"):
+            with self.subTest(location=location):
+                profile = main._score_location_proximity(location, work_mode="Hybrid")
+                self.assertEqual(profile["score"], 0.8)
+                self.assertEqual(profile["tier"], "outside_focus")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 import main
@@ -107,6 +110,48 @@ class TestMainRanking(unittest.TestCase):
         )
         self.assertEqual(len(ranked), 1)
 
+    def test_cross_source_near_duplicates_collapse_and_merge_urls(self):
+        snippet = "Festival venue AV technician role with 30% travel across Germany and visa sponsorship."
+        indeed_job = self._job("MergeCo", snippet)
+        indeed_job.update({"source": "indeed", "link": "https://nl.indeed.com/viewjob?jk=abc123"})
+        linkedin_job = self._job("MergeCo", snippet + " Apply now.")
+        linkedin_job.update({"source": "linkedin", "link": "https://www.linkedin.com/jobs/view/987654321"})
+        other_job = self._job("MergeCo", "Warehouse forklift driver night shifts in Tilburg.", title="Forklift Driver")
+        other_job.update({"source": "linkedin", "link": "https://www.linkedin.com/jobs/view/555555555"})
+        diagnostics = main._new_diagnostics()
+        result = main.rank_and_filter_jobs(
+            [indeed_job, linkedin_job, other_job],
+            target_career_sleeve="A",
+            min_target_score=1,
+            location_mode="nl_vn",
+            strict_career_sleeve=False,
+            include_fail=True,
+            return_diagnostics=True,
+            diagnostics=diagnostics,
+        )
+        self.assertEqual(result["funnel"]["after_dedupe"], 2)
+        self.assertEqual(diagnostics["near_duplicates_collapsed"], 1)
+        merged = next(job for job in result["all_jobs"] if job["title"] == "AV Technician")
+        self.assertEqual(merged["source"], "indeed")
+        self.assertEqual(merged["indeed_url"], indeed_job["link"])
+        self.assertEqual(merged["linkedin_url"], linkedin_job["link"])
+
+    def test_job_identity_is_computed_once_and_kept_out_of_output(self):
+        job = self._job("IdentityCo", "Festival venue AV role with travel.")
+        job["link"] = "https://example.com/jobs/7?utm_source=feed"
+        with patch.object(main, "_canonicalize_url", wraps=main._canonicalize_url) as canonicalize:
+            main._build_dedupe_key(job)
+            ranked = main.rank_and_filter_jobs(
+                [job],
+                target_career_sleeve="A",
+                min_target_score=3,
+                location_mode="nl_vn",
+                strict_career_sleeve=False,
+            )
+        link_calls = [call for call in canonicalize.call_args_list if call.args == (job["link"],)]
+        self.assertEqual(len(link_calls), 1)
+        self.assertNotIn("_identity", ranked[0])
+
     def test_output_contract_contains_decision_and_text_fields(self):
         jobs = [
             self._job(
@@ -132,6 +177,253 @@ class TestMainRanking(unittest.TestCase):
         self.assertIn("language_flags", item)
         self.assertIn("hard_reject_reason", item)
 
+    def test_repeat_ranking_reuses_cached_text_signals(self):
+        jobs = [
+            self._job(
+                "CacheCheck",
+                "Festival venue AV role with 30% travel across Germany and visa sponsorship.",
+            )
+        ]
+        first = main.rank_and_filter_jobs(
+            [dict(job) for job in jobs],
+            target_career_sleeve="A",
+            min_target_score=3,
+            location_mode="nl_vn",
+            strict_career_sleeve=False,
+        )
+        first[0]["language_flags"]["mutated"] = True
+        with patch.object(
+            main.c_sleeves,
+            "score_all_career_sleeves",
+            side_effect=AssertionError("cache miss"),
+        ):
+            second = main.rank_and_filter_jobs(
+                [dict(job) for job in jobs],
+                target_career_sleeve="A",
+                min_target_score=3,
+                location_mode="nl_vn",
+                strict_career_sleeve=False,
+            )
+        del first[0]["language_flags"]["mutated"]
+        self.assertEqual(first, second)
+        self.assertLessEqual(main.scoring_cache_state["bytes"], main.SCORING_CACHE_MAX_BYTES)
+
+    def test_scoring_cache_counts_payload_bytes_for_non_ascii_postings(self):
+        with main.scoring_cache_lock:
+            main.scoring_cache.clear()
+            main.scoring_cache_state["bytes"] = 0
+        ruleset = main.c_sleeves.active_ruleset()
+        fingerprint = main._scoring_ruleset_fingerprint(ruleset)
+        payload = main._job_text_signals_payload(
+            ruleset,
+            fingerprint,
+            "Kỹ thuật viên âm thanh",
+            "Hỗ trợ sự kiện lễ hội tại Hà Nội và Thành phố Hồ Chí Minh.",
+        )
+        self.assertIsInstance(payload, bytes)
+        self.assertGreater(len(payload), len(payload.decode("utf-8")))
+        self.assertEqual(main.scoring_cache_state["bytes"], len(payload))
+
+    def test_hot_reloaded_ruleset_applies_to_the_next_ranking(self):
+        jobs = [self._job("ReloadCheck", "Remote AV festival role with travel and live events support.")]
+
+        def _rank():
+            return main.rank_and_filter_jobs(
+                [dict(job) for job in jobs],
+                target_career_sleeve="A",
+                min_target_score=3,
+                location_mode="nl_vn",
+                strict_career_sleeve=False,
+            )
+
+        before = _rank()
+        renamed = dict(main.c_sleeves.CAREER_SLEEVE_CONFIG["A"], name="Renamed Sleeve")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rules_path = Path(tmp_dir) / "scoring_ruleset.json"
+            rules_path.write_text(
+                json.dumps({"version": "test", "rules": {"CAREER_SLEEVE_CONFIG": {"A": renamed}}}),
+                encoding="utf-8",
+            )
+            try:
+                self.assertTrue(main.c_sleeves.reload_ruleset(rules_path))
+                after = _rank()
+            finally:
+                rules_path.unlink()
+                main.c_sleeves.reload_ruleset(main.SCORING_RULESET_PATH)
+        self.assertNotEqual(before[0]["primary_career_sleeve_name"], "Renamed Sleeve")
+        self.assertEqual(after[0]["primary_career_sleeve_name"], "Renamed Sleeve")
+        self.assertEqual(_rank(), before)
+
+    def test_small_runs_walk_every_fallback_profile_and_decide_once(self):
+        jobs = [
+            self._job("FallbackPass", "Festival venue role with show control and live production."),
+            self._job("FallbackFail", "Warehouse picking role.", title="Order Picker"),
+        ]
+        diagnostics = main._new_diagnostics()
+        result = main.rank_and_filter_jobs(
+            jobs,
+            target_career_sleeve="A",
+            min_target_score=3,
+            location_mode="nl_vn",
+            strict_career_sleeve=False,
+            include_fail=True,
+            return_diagnostics=True,
+            diagnostics=diagnostics,
+        )
+        self.assertEqual(
+            result["fallbacks_applied"],
+            [
+                "fallback:min_total_hits-1",
+                "fallback:min_primary_career_sleeve_score-1",
+                "fallback:soften_maybe_floor",
+            ],
+        )
+        self.assertEqual(diagnostics["threshold_profile"]["name"], "fallback:soften_maybe_floor")
+        for job in result["all_jobs"]:
+            fail_lines = [reason for reason in job["reasons"] if reason.startswith("Fail reason:")]
+            self.assertLessEqual(len(fail_lines), 1)
+        funnel = result["funnel"]
+        self.assertEqual(funnel["pass_count"] + funnel["maybe_count"] + funnel["fail_count"], 2)
+
+    def test_rank_weights_are_resolved_once_per_career_sleeve(self):
+        jobs = [
+            self._job(f"Columnar{index}", "Festival venue AV role with live production and travel.")
+            for index in range(5)
+        ]
+        original = main.c_sleeves.ranking_weights_for_career_sleeve
+        with patch.object(
+            main.c_sleeves,
+            "ranking_weights_for_career_sleeve",
+            side_effect=original,
+        ) as weights_lookup:
+            ranked = main.rank_and_filter_jobs(
+                jobs,
+                target_career_sleeve="A",
+                min_target_score=3,
+                location_mode="nl_vn",
+                strict_career_sleeve=False,
+            )
+        self.assertEqual(len(ranked), 5)
+        self.assertEqual(weights_lookup.call_count, len({job["career_sleeve_id"] for job in ranked}))
+        self.assertTrue(all("_rank" not in job for job in ranked))
+
+    def test_max_results_returns_the_top_k_with_exact_funnel(self):
+        jobs = [
+            self._job("TopKFestival", "Festival venue AV role with show control and live production."),
+            self._job("TopKTravel", "AV festival role with 30% travel across Germany and visa sponsorship."),
+            self._job("TopKSales", "Cold calling sales role with commission only pay.", title="Sales Agent"),
+            self._job("TopKWarehouse", "Warehouse picking role.", title="Order Picker"),
+            self._job("TopKRemote", "Remote AV festival role with travel and live events support."),
+        ]
+        options = {
+            "target_career_sleeve": "A",
+            "min_target_score": 3,
+            "location_mode": "nl_vn",
+            "strict_career_sleeve": False,
+            "include_fail": True,
+            "return_diagnostics": True,
+        }
+        full = main.rank_and_filter_jobs([dict(job) for job in jobs], **options)
+        top = main.rank_and_filter_jobs([dict(job) for job in jobs], max_results=2, **options)
+
+        self.assertEqual(top["jobs"], full["jobs"][:2])
+        self.assertEqual(top["all_jobs"], top["jobs"])
+        self.assertEqual(top["funnel"], full["funnel"])
+        self.assertEqual(top["top_fail_reasons"], full["top_fail_reasons"])
+        self.assertEqual(len(full["all_jobs"]), 5)
+
+    def test_process_pool_scoring_matches_in_process_ranking(self):
+        jobs = [
+            self._job(f"Pool{index}", f"Festival venue AV role {index} with 30% travel across Germany.")
+            for index in range(6)
+        ]
+        options = {
+            "target_career_sleeve": "A",
+            "min_target_score": 3,
+            "location_mode": "nl_vn",
+            "strict_career_sleeve": False,
+            "include_fail": True,
+        }
+
+        def _clear_scoring_cache():
+            with main.scoring_cache_lock:
+                main.scoring_cache.clear()
+                main.scoring_cache_state["bytes"] = 0
+
+        _clear_scoring_cache()
+        expected = main.rank_and_filter_jobs([dict(job) for job in jobs], **options)
+        _clear_scoring_cache()
+        self.addCleanup(main._reset_scoring_process_pool)
+        original_detect = main._detect_job_text_signals
+        with patch.object(main, "SCORING_PROCESS_WORKERS", 2), patch.object(
+            main,
+            "SCORING_PROCESS_MIN_BATCH",
+            4,
+        ), patch.object(main, "_detect_job_text_signals", side_effect=original_detect) as detect:
+            pooled = main.rank_and_filter_jobs([dict(job) for job in jobs], **options)
+        self.assertEqual(pooled, expected)
+        # Worker processes record calls on their own copy of the mock.
+        self.assertEqual(detect.call_count, 0)
+
+    def test_cancelled_pool_batch_falls_back_to_in_process_scoring(self):
+        class _CancelledPool:
+            def map(self, fn, chunks):
+                raise main.CancelledError()
+
+        pool = _CancelledPool()
+        job_texts = [(f"Role {index}", f"Festival venue AV role {index}.") for index in range(4)]
+        ruleset = main.c_sleeves.active_ruleset()
+        with patch.object(main, "SCORING_PROCESS_WORKERS", 2), patch.object(
+            main,
+            "SCORING_PROCESS_MIN_BATCH",
+            1,
+        ), patch.object(main, "_scoring_process_pool", return_value=pool), patch.object(
+            main,
+            "_reset_scoring_process_pool",
+        ) as reset:
+            stored = main._score_job_texts_in_pool(ruleset, ruleset["fingerprint"], job_texts)
+        self.assertEqual(stored, 0)
+        reset.assert_called_once_with(pool)
+
+    def test_scoring_pools_are_kept_per_fingerprint_and_reset_individually(self):
+        created = []
+
+        class _FakeExecutor:
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+                self.shut_down = False
+                created.append(self)
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shutdown_args = (wait, cancel_futures)
+                self.shut_down = True
+
+        self.addCleanup(main.scoring_pools.clear)
+        main.scoring_pools.clear()
+        with patch.object(main, "ProcessPoolExecutor", _FakeExecutor), patch.object(
+            main,
+            "SCORING_PROCESS_MAX_POOLS",
+            2,
+        ):
+            first = main._scoring_process_pool({"fingerprint": "old"})
+            second = main._scoring_process_pool({"fingerprint": "new"})
+            self.assertIs(main._scoring_process_pool({"fingerprint": "old"}), first)
+            self.assertIsNot(first, second)
+            self.assertNotEqual(first.kwargs["mp_context"].get_start_method(), "fork")
+
+            # A failure on a pool that was already replaced leaves the replacement alone.
+            main._reset_scoring_process_pool(second)
+            replacement = main._scoring_process_pool({"fingerprint": "new"})
+            main._reset_scoring_process_pool(second)
+            self.assertIs(main.scoring_pools["new"], replacement)
+            self.assertFalse(replacement.shut_down)
+
+            # A third ruleset retires the least recently used pool without cancelling.
+            main._scoring_process_pool({"fingerprint": "third"})
+            self.assertTrue(first.shut_down)
+            self.assertEqual(first.shutdown_args, (False, False))
+            self.assertEqual(list(main.scoring_pools), ["new", "third"])
+
     def test_output_contract_contains_career_sleeve_and_abroad_preferences_confidence(self):
         jobs = [
             self._job(
@@ -299,6 +591,25 @@ class TestMainRanking(unittest.TestCase):
         self.assertIn("Germany", meta["countries"])
         self.assertIn("Spain", meta["countries"])
 
+    def test_abroad_percentage_ignores_benefit_percentages_outside_travel_context(self):
+        raw_text = (
+            "Benefits: 8% holiday pay, 3-5% pension and a 15 percent bonus for the whole team. " * 6
+            + "Expect 20\u201340% travel across EMEA."
+        )
+        self.assertEqual(main._extract_abroad_percentage(raw_text), (40, "20-40%"))
+        self.assertEqual(main._extract_abroad_percentage(raw_text.split("Expect")[0]), (None, ""))
+
+    def test_geo_mentions_without_global_context_need_a_nearby_keyword(self):
+        raw_text = (
+            "Onsite installs in Germany. "
+            + "Our team values calm and precise work every single day. " * 3
+            + "Spain office."
+        )
+        self.assertFalse(main._has_abroad_context(raw_text))
+        geo, locations = main._extract_abroad_geo_mentions(raw_text)
+        self.assertEqual(geo["countries"], ["Germany"])
+        self.assertEqual(locations, ["Germany"])
+
     def test_abroad_identifiers_are_present_in_ranked_output(self):
         jobs = [
             self._job(
@@ -556,6 +867,37 @@ class TestMainRanking(unittest.TestCase):
         self.assertIn(ranked[0]["decision"], {"PASS", "MAYBE"})
         self.assertGreaterEqual(ranked[0]["primary_career_sleeve_score"], 1)
 
+    def test_custom_sleeve_matcher_is_compiled_once_per_owner_and_letter(self):
+        jobs = [
+            self._job(
+                "CachedCustom",
+                "Operaties analist voor workflow projecten met 30% reizen naar Germany.",
+                title="Operations Analyst",
+            )
+        ]
+        kwargs = dict(
+            target_career_sleeve="E",
+            min_target_score=3,
+            location_mode="nl_vn",
+            strict_career_sleeve=False,
+            custom_mode=True,
+            custom_search_queries=["operations analyst", "workflow", "festival"],
+            custom_location_preferences={"countries": ["Germany"], "abroad_min_percent": 20},
+            custom_owner_key="user:42",
+            custom_letter="F",
+        )
+        first = main.rank_and_filter_jobs([dict(job) for job in jobs], **kwargs)
+        with patch.object(main, "_bilingual_query_variants", side_effect=AssertionError("recompiled")):
+            second = main.rank_and_filter_jobs([dict(job) for job in jobs], **kwargs)
+        self.assertEqual(first, second)
+        self.assertIn("matched 2 of 3 custom queries", first[0]["reasons"][0])
+        self.assertEqual(first[0]["custom_geo_matches"], ["germany"])
+
+        main._evict_custom_sleeve_matchers("user:42", "F")
+        self.assertFalse(
+            [key for key in main.custom_sleeve_matcher_cache if key[:2] == ("user:42", "F")]
+        )
+
     def test_custom_mode_matches_dutch_variant_for_english_term(self):
         jobs = [
             self._job(
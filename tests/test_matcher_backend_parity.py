@@ -0,0 +1,101 @@
+import json
+import unittest
+from pathlib import Path
+
+import career_sleeves as c_sleeves
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURE_CORPORA = [
+    REPO_ROOT / "sample_scrape_output.json",
+    Path(__file__).resolve().parent / "fixtures" / "job_postings.json",
+]
+
+
+def _corpus_jobs():
+    jobs = []
+    for corpus_path in FIXTURE_CORPORA:
+        jobs.extend(c_sleeves._load_benchmark_jobs(corpus_path))
+    return jobs
+
+
+def _snapshot(raw_text, raw_title):
+    prepared_text = c_sleeves.build_prepared_text(raw_text)
+    prepared_title = c_sleeves.build_prepared_text(raw_title)
+    return {
+        "language": c_sleeves.detect_language_flags(prepared_text),
+        "sleeves": c_sleeves.score_all_career_sleeves(prepared_text, prepared_title),
+        "single": [
+            c_sleeves.score_career_sleeve(sleeve_id, prepared_text, prepared_title)
+            for sleeve_id in sorted(c_sleeves.CAREER_SLEEVE_CONFIG)
+        ],
+        "hard_reject": c_sleeves.detect_hard_reject(prepared_title, prepared_text),
+        "abroad": c_sleeves.score_abroad_components(prepared_text),
+        "synergy": c_sleeves.score_synergy(prepared_text),
+        "penalties": c_sleeves.evaluate_soft_penalties(prepared_text),
+    }
+
+
+class TestMatcherBackendParity(unittest.TestCase):
+    def setUp(self):
+        self._previous_backend = c_sleeves.matcher_backend()
+
+    def tearDown(self):
+        c_sleeves.set_matcher_backend(self._previous_backend)
+
+    def _snapshots_for(self, backend, jobs):
+        c_sleeves.set_matcher_backend(backend)
+        return [_snapshot(raw_text, raw_title) for raw_text, raw_title in jobs]
+
+    def test_fixture_corpora_are_present(self):
+        jobs = _corpus_jobs()
+        self.assertGreaterEqual(len(jobs), 10)
+        sample = json.loads(FIXTURE_CORPORA[0].read_text(encoding="utf-8"))
+        self.assertTrue(sample["jobs"])
+
+    def test_backends_agree_on_hits_and_scores(self):
+        jobs = _corpus_jobs()
+        reference = self._snapshots_for("reference", jobs)
+        compiled = self._snapshots_for("compiled", jobs)
+        for (raw_text, raw_title), expected, actual in zip(jobs, reference, compiled):
+            with self.subTest(title=raw_title):
+                self.assertEqual(actual, expected)
+
+    def test_batch_scoring_matches_per_job_scoring_on_both_backends(self):
+        jobs = _corpus_jobs()
+        jobs = jobs + jobs[:3]
+        for backend in ("reference", "compiled"):
+            c_sleeves.set_matcher_backend(backend)
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    c_sleeves.score_career_sleeves_batch(jobs),
+                    [
+                        c_sleeves.score_all_career_sleeves(raw_text, raw_title)
+                        for raw_text, raw_title in jobs
+                    ],
+                )
+
+    def test_backends_agree_on_ad_hoc_find_hits(self):
+        prepared = c_sleeves.build_prepared_text(
+            "Site visits to data-centres, festivals and policies; on site rollouts."
+        )
+        phrases = ["site visit", "data centre", "festival", "policy", "on-site", "rollout", "centres"]
+        c_sleeves.set_matcher_backend("reference")
+        expected = c_sleeves.find_hits(prepared, phrases)
+        c_sleeves.set_matcher_backend("compiled")
+        self.assertEqual(c_sleeves.find_hits(prepared, phrases), expected)
+        self.assertIn("policy", expected)
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            c_sleeves.set_matcher_backend("simd")
+        self.assertEqual(c_sleeves.matcher_backend(), self._previous_backend)
+
+    def test_benchmark_reports_jobs_per_second_for_every_backend(self):
+        results = c_sleeves.benchmark_matcher_backends(_corpus_jobs()[:2], repeat=1)
+        self.assertEqual(set(results), set(c_sleeves.MATCHER_BACKENDS))
+        self.assertTrue(all(rate > 0 for rate in results.values()))
+        self.assertEqual(c_sleeves.matcher_backend(), self._previous_backend)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -131,6 +131,67 @@ class TestScrapeEndpoint(unittest.TestCase):
             main.fetch_jobs_from_sources = original_fetch
             main.rank_and_filter_jobs = original_rank
 
+    def test_pipeline_mode_scores_items_while_sources_fetch(self):
+        def fake_fetch_source(source_key, *args, **kwargs):
+            diagnostics = main._new_diagnostics()
+            if source_key != "indeed_web":
+                return ([], None, diagnostics)
+            return (
+                [
+                    {
+                        "title": "AV Technician",
+                        "company": f"Pipeline {index}",
+                        "location": "Amsterdam, Netherlands",
+                        "snippet": "Festival venue AV role with show control and live production.",
+                        "link": f"https://example.com/pipeline-{index}",
+                        "source": "Indeed",
+                    }
+                    for index in range(3)
+                ],
+                None,
+                diagnostics,
+            )
+
+        detection_threads = []
+        original_detect = main._detect_job_text_signals
+
+        def recording_detect(*args, **kwargs):
+            detection_threads.append(main.threading.current_thread().name)
+            return original_detect(*args, **kwargs)
+
+        with main.scoring_cache_lock:
+            main.scoring_cache.clear()
+            main.scoring_cache_state["bytes"] = 0
+        with patch.object(main, "_fetch_source_with_cache", side_effect=fake_fetch_source), patch.object(
+            main,
+            "_detect_job_text_signals",
+            side_effect=recording_detect,
+        ):
+            response = self.client.get("/scrape?career_sleeve=A&pipeline=1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()["jobs"]), 3)
+        self.assertEqual(len(detection_threads), 3)
+        self.assertTrue(all(name.startswith("scoring-pipeline") for name in detection_threads))
+
+    def test_pipeline_worker_logs_failures_and_leaves_items_to_the_ranker(self):
+        with patch.object(main, "_build_dedupe_key", side_effect=RuntimeError("bad key")), patch.object(
+            main,
+            "_log_event",
+        ) as log_event:
+            submit, close = main._start_scoring_pipeline(run_id="run-1")
+            submit([{"title": "AV Technician", "company": "Pipeline", "snippet": "Festival venue."}])
+            stats = close()
+
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["scored"], 0)
+        log_event.assert_called_once_with(
+            "scoring_pipeline_failed",
+            run_id="run-1",
+            error="RuntimeError: bad key",
+            title="AV Technician",
+        )
+
     def test_fetch_jobs_enforces_mvp_source_bundle_only(self):
         original_fetch_source = main._fetch_source_with_cache
         try: